@@ -0,0 +1,662 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**benchmarks.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Benchmarks module.
+
+**Others:**
+	The libraries hot paths are executed against the headless :mod:`maya` stand-in on generated grids of increasing
+	vertices counts, the modules and search benchmarks use the sizes as modules files and interfaces counts.
+	Each benchmark records the best wall time and the :mod:`maya.cmds` calls count per size, and the time and calls
+	scaling exponents fitted on the sizes. The results are written into a JSON file for trend tracking and can be
+	compared to a baseline file, the execution fails when a benchmark regresses beyond a threshold::
+
+		python -m snippets.benchmarks --output benchmarks.json
+		python -m snippets.benchmarks --baseline benchmarks.json --threshold 0.25
+
+	This module must run outside Maya since it puts the stand-in package first on :data:`sys.path`.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import imp
+import json
+import logging
+import math
+import optparse
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+STANDINS_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "standins")
+
+if STANDINS_DIRECTORY not in sys.path:
+	sys.path.insert(0, STANDINS_DIRECTORY)
+
+import maya.cmds as cmds
+import maya.scene
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import snippets.libraries.collapseComponents
+import snippets.libraries.exportObjectsToFiles
+import snippets.libraries.makePlanar
+import snippets.libraries.renameFromClosest
+import snippets.libraries.selectionConstraints
+import snippets.libraries.snapOnClosestVertex
+import snippets.libraries.uvsUtilities
+import snippets.managers.modulesScanner
+from snippets.commandsProfiler import CommandsProfiler
+from snippets.globals.constants import Constants
+from snippets.managers.bytecodeCache import BytecodeCache
+from snippets.managers.modulesManager import ModulesManager
+from snippets.searchEngine import SearchEngine
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+			"STANDINS_DIRECTORY",
+			"BENCHMARKS",
+			"getGrid",
+			"getFacesPerPatchesBenchmark",
+			"getComponentsBoundingBoxBenchmark",
+			"getUVsShellsStatisticsBenchmark",
+			"autoRatioUVsAreasBenchmark",
+			"normalizeTexelDensityBenchmark",
+			"normalizeTexelDensityShellsBenchmark",
+			"snapComponentsOnClosestVertexBenchmark",
+			"collapseComponentsBenchmark",
+			"makePlanarBenchmark",
+			"selectIsolatedVerticesBenchmark",
+			"selectCreasesEdgesBenchmark",
+			"selectSideVerticesBenchmark",
+			"renameTargetsFromClosestSourcesBenchmark",
+			"exportObjectsToFilesBenchmark",
+			"assignMariShadersBenchmark",
+			"getModulesPaths",
+			"scanDirectoriesBenchmark",
+			"importModulesBenchmark",
+			"cachedImportModulesBenchmark",
+			"registerAllBenchmark",
+			"searchBenchmark",
+			"getScalingExponent",
+			"runBenchmark",
+			"runBenchmarks",
+			"getRegressions",
+			"main"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def getGrid(vertices, name="benchmark"):
+	"""
+	This definition creates a grid with approximately given vertices count.
+
+	:param vertices: Vertices count. ( Integer )
+	:param name: Grid name. ( String )
+	:return: Grid name. ( String )
+	"""
+
+	subdivisions = max(1, int(round(math.sqrt(vertices))) - 1)
+	return cmds.polyPlane(name=name, width=10., height=10., subdivisionsX=subdivisions, subdivisionsY=subdivisions)[0]
+
+def getFacesPerPatchesBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.uvsUtilities.getFacesPerPatches` benchmark,
+	the grid UVs span four patches.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	cmds.polyEditUV(grid, pu=0., pv=0., su=1.999, sv=1.999)
+	return lambda: snippets.libraries.uvsUtilities.getFacesPerPatches(grid)
+
+def getComponentsBoundingBoxBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.uvsUtilities.getComponentsBoundingBox` benchmark.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	return lambda: snippets.libraries.uvsUtilities.getComponentsBoundingBox([grid])
+
+def getUVsShellsStatisticsBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.uvsUtilities.getUVsShellsStatistics` benchmark.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	return lambda: snippets.libraries.uvsUtilities.getUVsShellsStatistics(grid)
+
+def autoRatioUVsAreasBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.uvsUtilities.autoRatioUVsAreas` benchmark,
+	the vertices are spread across four grids of different sizes.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grids = []
+	for i in range(4):
+		grids.append(getGrid(vertices // 4, "grid{0}".format(i + 1)))
+		cmds.xform(grids[-1], m=(i + 1., 0., 0., 0., 0., 1., 0., 0., 0., 0., 1., 0., 0., 0., 0., 1.))
+	return lambda: snippets.libraries.uvsUtilities.autoRatioUVsAreas(grids)
+
+def normalizeTexelDensityBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.uvsUtilities.normalizeTexelDensity` benchmark,
+	the vertices are spread across four grids of different sizes.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grids = []
+	for i in range(4):
+		grids.append(getGrid(vertices // 4, "grid{0}".format(i + 1)))
+		cmds.xform(grids[-1], m=(i + 1., 0., 0., 0., 0., 1., 0., 0., 0., 0., 1., 0., 0., 0., 0., 1.))
+	return lambda: snippets.libraries.uvsUtilities.normalizeTexelDensity(grids)
+
+def normalizeTexelDensityShellsBenchmark(vertices):
+	"""
+	This definition prepares the undoable :func:`snippets.libraries.uvsUtilities.normalizeTexelDensity` benchmark,
+	each face of the four grids is its own UVs shell and each rescaled UVs shell is one operation.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grids = []
+	for i in range(4):
+		grids.append(getGrid(vertices // 4, "grid{0}".format(i + 1)))
+		cmds.xform(grids[-1], m=(i + 1., 0., 0., 0., 0., 1., 0., 0., 0., 0., 1., 0., 0., 0., 0., 1.))
+		cmds.polyForceUV(grids[-1], unitize=True)
+	execute = lambda: snippets.libraries.uvsUtilities.normalizeTexelDensity(grids, undoable=True)
+	execute.operations = sum(cmds.polyEvaluate(grid, face=True) for grid in grids)
+	return execute
+
+def snapComponentsOnClosestVertexBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.snapOnClosestVertex.snapComponentsOnClosestVertex`
+	benchmark, the grid is snapped onto a slightly offset copy.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	reference = getGrid(vertices, "reference")
+	cmds.xform(reference, t=(0.001, 0.001, 0.001))
+	return lambda: snippets.libraries.snapOnClosestVertex.snapComponentsOnClosestVertex(reference, [grid], 0.1)
+
+def collapseComponentsBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.collapseComponents.collapseComponents` benchmark.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	return lambda: snippets.libraries.collapseComponents.collapseComponents([grid])
+
+def makePlanarBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.makePlanar.makePlanar` benchmark.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	faces = "{0}.f[0:{1}]".format(grid, cmds.polyEvaluate(grid, face=True) - 1)
+	return lambda: snippets.libraries.makePlanar.makePlanar([faces])
+
+def selectIsolatedVerticesBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.selectionConstraints.selectIsolatedVertices` benchmark.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	return lambda: snippets.libraries.selectionConstraints.selectIsolatedVertices([grid])
+
+def selectCreasesEdgesBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.selectionConstraints.selectCreasesEdges` benchmark,
+	one edge out of ten is creased.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	edges = cmds.polyEvaluate(grid, edge=True)
+	cmds.polyCrease(["{0}.e[{1}]".format(grid, edge) for edge in range(0, edges, 10)], value=1.)
+	return lambda: snippets.libraries.selectionConstraints.selectCreasesEdges(grid)
+
+def selectSideVerticesBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.selectionConstraints.selectSideVertices` benchmark.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	return lambda: snippets.libraries.selectionConstraints.selectSideVertices(grid)
+
+def renameTargetsFromClosestSourcesBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.renameFromClosest.renameTargetsFromClosestSources`
+	benchmark, the vertices are spread across four sources and four targets.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	sources, targets = [], []
+	for i in range(4):
+		sources.append(getGrid(vertices // 8, "source{0}".format(i + 1)))
+		cmds.xform(sources[-1], t=(i * 20., 0., 0.))
+		targets.append(getGrid(vertices // 8, "target{0}".format(i + 1)))
+		cmds.xform(targets[-1], t=((3 - i) * 20., 1., 0.))
+	return lambda: snippets.libraries.renameFromClosest.renameTargetsFromClosestSources(sources, targets)
+
+def exportObjectsToFilesBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.exportObjectsToFiles.exportObjectsToFiles` benchmark.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grid = getGrid(vertices)
+	return lambda: snippets.libraries.exportObjectsToFiles.exportObjectsToFiles([grid], "Obj")
+
+def assignMariShadersBenchmark(vertices):
+	"""
+	This definition prepares the :func:`snippets.libraries.uvsUtilities.assignMariShaders` benchmark,
+	the vertices are spread across four grids, two of them spanning four patches.
+
+	:param vertices: Vertices count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	grids = []
+	for i in range(4):
+		grids.append(getGrid(vertices // 4, "grid{0}".format(i + 1)))
+		if i % 2:
+			cmds.polyEditUV(grids[-1], pu=0., pv=0., su=1.999, sv=1.999)
+	return lambda: snippets.libraries.uvsUtilities.assignMariShaders(grids, "benchmark")
+
+def getModulesPaths(files, paths, directory):
+	"""
+	This definition creates given modules files count spread across given modules paths count.
+
+	:param files: Modules files count. ( Integer )
+	:param paths: Modules paths count. ( Integer )
+	:param directory: Directory where to create the modules paths. ( String )
+	:return: Modules paths. ( List )
+	"""
+
+	modulesPaths = [os.path.join(directory, "modules{0}".format(i)) for i in range(paths)]
+	for i in range(files):
+		path = os.path.join(modulesPaths[i % paths], "package{0}".format(i // 64))
+		if not os.path.exists(path):
+			os.makedirs(path)
+		with open(os.path.join(path, "module{0}.py".format(i)), "w") as file:
+			file.write("__all__ = [\"IModule{0}\", \"IModule{0}Options\"]\n\n"
+						"def IModule{0}():\n\t\"\"\"Module {0} interface.\"\"\"\n\n\treturn True\n\n"
+						"def IModule{0}Options(value=None):\n\t\"\"\"Module {0} options interface.\"\"\"\n\n"
+						"\treturn value\n".format(i))
+	return modulesPaths
+
+def scanDirectoriesBenchmark(files, paths=2):
+	"""
+	This definition prepares the :func:`snippets.managers.modulesScanner.scanDirectories` benchmark,
+	given modules files count is spread across given modules paths.
+
+	:param files: Modules files count. ( Integer )
+	:param paths: Modules paths count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	modulesPaths = getModulesPaths(files, paths, tempfile.mkdtemp(dir=maya.scene.SCENE.workspace))
+	return lambda: snippets.managers.modulesScanner.scanDirectories(modulesPaths)
+
+def importModulesBenchmark(files, cached=False):
+	"""
+	This definition prepares the modules imports benchmark from read only libraries, given modules files count
+	is compiled from the sources or loaded from a warm :class:`snippets.managers.bytecodeCache.BytecodeCache` class
+	instance, each import is one operation.
+
+	:param files: Modules files count. ( Integer )
+	:param cached: Loads the modules from the bytecode cache. ( Boolean )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	directory = tempfile.mkdtemp(dir=maya.scene.SCENE.workspace)
+	modules = snippets.managers.modulesScanner.scanDirectories(getModulesPaths(files, 1, directory))
+	bytecodeCache = BytecodeCache(os.path.join(directory, "bytecode"))
+	for name, file in modules:
+		bytecodeCache.registerModule(name, file)
+		cached and bytecodeCache.getCode(name)
+
+	def execute():
+		# Read only libraries directories never get compiled files written next to the sources.
+		dontWriteBytecode, sys.dont_write_bytecode = sys.dont_write_bytecode, True
+		try:
+			for name, file in modules:
+				sys.modules.pop(name, None)
+				if cached:
+					bytecodeCache.load_module(name)
+				else:
+					imp.load_source(name, file)
+				del(sys.modules[name])
+		finally:
+			sys.dont_write_bytecode = dontWriteBytecode
+
+	execute.operations = len(modules)
+	return execute
+
+def cachedImportModulesBenchmark(files):
+	"""
+	This definition prepares the modules imports benchmark from the bytecode cache.
+
+	:param files: Modules files count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	return importModulesBenchmark(files, True)
+
+def registerAllBenchmark(files, paths=4):
+	"""
+	This definition prepares the :meth:`snippets.managers.modulesManager.ModulesManager.registerAll` benchmark,
+	given modules files count is spread across given modules paths and the interfaces index is empty.
+
+	:param files: Modules files count. ( Integer )
+	:param paths: Modules paths count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	directory = tempfile.mkdtemp(dir=maya.scene.SCENE.workspace)
+	modulesManager = ModulesManager(getModulesPaths(files, paths, directory), os.path.join(directory, "interfaces.json"))
+	return lambda: modulesManager.registerAll()
+
+def searchBenchmark(interfaces, queries=100):
+	"""
+	This definition prepares the :meth:`snippets.searchEngine.SearchEngine.search` benchmark,
+	given queries count is typed one character at a time as in the Popup, each keystroke is one operation.
+
+	:param interfaces: Interfaces count. ( Integer )
+	:param queries: Queries count. ( Integer )
+	:return: Benchmark callable. ( Object )
+	"""
+
+	words = ("select", "vertices", "edges", "faces", "uvs", "shells", "normalize", "texel", "density", "snap",
+			"closest", "rename", "export", "objects", "files", "collapse", "components", "planar", "align", "mirror")
+
+	searchEngine = SearchEngine()
+	for i in range(interfaces):
+		searchEngine.addDocument(i,
+								" ".join((words[i % len(words)], words[(i // len(words)) % len(words)], str(i))),
+								"module{0}".format(i // 16),
+								"This definition {0} the {1} of given objects.".format(words[(i * 7) % len(words)],
+																						words[(i * 13) % len(words)]))
+		searchEngine.setUsage(i, i % 5)
+
+	# Words, words pairs and abbreviations queries.
+	keystrokes = []
+	for i in range(queries):
+		query = (words[i % len(words)],
+				"{0} {1}".format(words[i % len(words)], words[(i * 3) % len(words)]),
+				"".join(word[0] for word in words[i % 7:i % 7 + 3]))[i % 3]
+		keystrokes.extend(query[:j] for j in range(1, len(query) + 1))
+
+	execute = lambda: [searchEngine.search(keystroke) for keystroke in keystrokes]
+	execute.operations = len(keystrokes)
+	return execute
+
+BENCHMARKS = (("getFacesPerPatches", getFacesPerPatchesBenchmark),
+			("getComponentsBoundingBox", getComponentsBoundingBoxBenchmark),
+			("getUVsShellsStatistics", getUVsShellsStatisticsBenchmark),
+			("autoRatioUVsAreas", autoRatioUVsAreasBenchmark),
+			("normalizeTexelDensity", normalizeTexelDensityBenchmark),
+			("normalizeTexelDensityShells", normalizeTexelDensityShellsBenchmark),
+			("snapComponentsOnClosestVertex", snapComponentsOnClosestVertexBenchmark),
+			("collapseComponents", collapseComponentsBenchmark),
+			("makePlanar", makePlanarBenchmark),
+			("selectIsolatedVertices", selectIsolatedVerticesBenchmark),
+			("selectCreasesEdges", selectCreasesEdgesBenchmark),
+			("selectSideVertices", selectSideVerticesBenchmark),
+			("renameTargetsFromClosestSources", renameTargetsFromClosestSourcesBenchmark),
+			("exportObjectsToFiles", exportObjectsToFilesBenchmark),
+			("assignMariShaders", assignMariShadersBenchmark),
+			("scanDirectories", scanDirectoriesBenchmark),
+			("importModules", importModulesBenchmark),
+			("cachedImportModules", cachedImportModulesBenchmark),
+			("registerAll", registerAllBenchmark),
+			("search", searchBenchmark))
+
+def getScalingExponent(sizes, values):
+	"""
+	This definition returns the least squares slope of given values against given sizes in log-log space,
+	1 means linear scaling and 2 quadratic scaling.
+
+	:param sizes: Sizes. ( List )
+	:param values: Values. ( List )
+	:return: Scaling exponent. ( Float )
+	"""
+
+	points = [(math.log(size), math.log(value)) for size, value in zip(sizes, values) if size > 0 and value > 0]
+	if len(points) < 2:
+		return
+
+	xMean = sum(point[0] for point in points) / len(points)
+	yMean = sum(point[1] for point in points) / len(points)
+	variance = sum((point[0] - xMean) ** 2 for point in points)
+	if not variance:
+		return
+
+	return sum((point[0] - xMean) * (point[1] - yMean) for point in points) / variance
+
+@core.executionTrace
+def runBenchmark(benchmark, vertices, repeats=Constants.benchmarksRepeats):
+	"""
+	This definition runs given benchmark on a fresh scene for each repeat.
+
+	The benchmark callable can define an **operations** attribute, the best time per operation is then recorded.
+
+	:param benchmark: Benchmark preparation definition. ( Object )
+	:param vertices: Vertices count. ( Integer )
+	:param repeats: Repeats count. ( Integer )
+	:return: Best wall time, calls count and actual vertices count, given size if no mesh is built. ( Dictionary )
+	"""
+
+	result = {"time" : None, "calls" : None, "vertices" : None}
+	for i in range(repeats):
+		cmds.file(new=True, force=True)
+		execute = benchmark(vertices)
+		result["vertices"] = sum(cmds.polyEvaluate(mesh, vertex=True) for mesh in cmds.ls(type="mesh")) or vertices
+
+		with CommandsProfiler(cmds, callSites=False) as commandsProfiler:
+			startTime = time.time()
+			execute()
+			duration = time.time() - startTime
+
+		if result["time"] is None or duration < result["time"]:
+			result["time"] = duration
+			if hasattr(execute, "operations"):
+				result["operationTime"] = duration / execute.operations
+		result["calls"] = commandsProfiler.getCallsCount()
+	return result
+
+@core.executionTrace
+def runBenchmarks(sizes=Constants.benchmarksSizes, repeats=Constants.benchmarksRepeats, names=None):
+	"""
+	This definition runs the benchmarks on given sizes.
+
+	:param sizes: Vertices counts. ( Tuple )
+	:param repeats: Repeats count. ( Integer )
+	:param names: Benchmarks names, all the benchmarks if not given. ( List )
+	:return: Results. ( Dictionary )
+	"""
+
+	workspace = maya.scene.SCENE.workspace
+	maya.scene.SCENE.workspace = tempfile.mkdtemp(prefix="snippets_benchmarks_")
+	os.environ.setdefault("USER", "benchmarks")
+
+	results = {"date" : time.strftime("%Y-%m-%d %H:%M:%S"),
+				"python" : platform.python_version(),
+				"platform" : platform.platform(),
+				"sizes" : list(sizes),
+				"benchmarks" : {}}
+	try:
+		for name, benchmark in BENCHMARKS:
+			if names and not name in names:
+				continue
+
+			benchmarkResults = {}
+			for size in sizes:
+				benchmarkResults[str(size)] = runBenchmark(benchmark, size, repeats)
+				LOGGER.info("{0} | '{1}' benchmark, '{2}' vertices: '{3:.4f}' seconds, '{4}' commands calls.".format(
+				__name__, name, benchmarkResults[str(size)]["vertices"], benchmarkResults[str(size)]["time"],
+				benchmarkResults[str(size)]["calls"]))
+				if "operationTime" in benchmarkResults[str(size)]:
+					LOGGER.info("{0} | '{1}' benchmark, '{2}' size: '{3:.6f}' seconds per operation.".format(
+					__name__, name, size, benchmarkResults[str(size)]["operationTime"]))
+
+			vertices = [benchmarkResults[str(size)]["vertices"] for size in sizes]
+			results["benchmarks"][name] = {"sizes" : benchmarkResults,
+										"timeExponent" : getScalingExponent(vertices,
+													[benchmarkResults[str(size)]["time"] for size in sizes]),
+										"callsExponent" : getScalingExponent(vertices,
+													[benchmarkResults[str(size)]["calls"] for size in sizes])}
+	finally:
+		shutil.rmtree(maya.scene.SCENE.workspace, ignore_errors=True)
+		maya.scene.SCENE.workspace = workspace
+		cmds.file(new=True, force=True)
+	return results
+
+@core.executionTrace
+def getRegressions(results, baseline, threshold=Constants.benchmarksRegressionThreshold):
+	"""
+	This definition compares given results to given baseline and returns the regressions beyond given threshold.
+
+	The times shorter than :attr:`snippets.globals.constants.Constants.benchmarksMinimumTime` are too noisy
+	to be compared, the calls counts are always compared.
+
+	:param results: Results. ( Dictionary )
+	:param baseline: Baseline results. ( Dictionary )
+	:param threshold: Tolerated relative growth. ( Float )
+	:return: Regressions. ( List )
+	"""
+
+	regressions = []
+	for name, benchmark in sorted(results["benchmarks"].iteritems()):
+		baselineBenchmark = baseline.get("benchmarks", {}).get(name)
+		if baselineBenchmark is None:
+			continue
+
+		for size, result in sorted(benchmark["sizes"].iteritems(), key=lambda item: int(item[0])):
+			baselineResult = baselineBenchmark["sizes"].get(size)
+			if baselineResult is None:
+				continue
+
+			if max(result["time"], baselineResult["time"]) >= Constants.benchmarksMinimumTime and \
+			result["time"] > baselineResult["time"] * (1. + threshold):
+				regressions.append("'{0}' benchmark, '{1}' size: time '{2:.4f}' seconds > '{3:.4f}' seconds!".format(
+				name, size, result["time"], baselineResult["time"]))
+			if result["calls"] > baselineResult["calls"] * (1. + threshold):
+				regressions.append("'{0}' benchmark, '{1}' size: calls '{2}' > '{3}'!".format(
+				name, size, result["calls"], baselineResult["calls"]))
+	return regressions
+
+def main(arguments=None):
+	"""
+	This definition runs the benchmarks from the command line.
+
+	:param arguments: Command line arguments. ( List )
+	:return: Exit code, 1 if a regression is found. ( Integer )
+	"""
+
+	parser = optparse.OptionParser(usage="%prog [options]")
+	parser.add_option("-s", "--sizes", default=",".join(str(size) for size in Constants.benchmarksSizes),
+					help="Comma separated vertices counts.")
+	parser.add_option("-r", "--repeats", type="int", default=Constants.benchmarksRepeats,
+					help="Repeats count, the best time is kept.")
+	parser.add_option("-b", "--benchmarks", default=None, help="Comma separated benchmarks names.")
+	parser.add_option("-o", "--output", default=Constants.benchmarksFile, help="Results JSON file.")
+	parser.add_option("-c", "--baseline", default=None, help="Baseline JSON file to compare with.")
+	parser.add_option("-t", "--threshold", type="float", default=Constants.benchmarksRegressionThreshold,
+					help="Tolerated relative growth before failing.")
+	options, arguments = parser.parse_args(arguments)
+
+	if not LOGGER.handlers:
+		consoleHandler = logging.StreamHandler(sys.stdout)
+		consoleHandler.setFormatter(core.LOGGING_DEFAULT_FORMATTER)
+		LOGGER.addHandler(consoleHandler)
+		LOGGER.setLevel(logging.INFO)
+
+	results = runBenchmarks([int(size) for size in options.sizes.split(",")],
+							options.repeats,
+							options.benchmarks and options.benchmarks.split(",") or None)
+
+	with open(options.output, "w") as file:
+		json.dump(results, file, indent=4, sort_keys=True)
+	LOGGER.info("{0} | Benchmarks results written into '{1}' file!".format(__name__, options.output))
+
+	if not options.baseline:
+		return 0
+
+	with open(options.baseline) as file:
+		regressions = getRegressions(results, json.load(file), options.threshold)
+	for regression in regressions:
+		LOGGER.error("!> {0} | {1}".format(__name__, regression))
+	if regressions:
+		return 1
+
+	LOGGER.info("{0} | No regression found against '{1}' baseline!".format(__name__, options.baseline))
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**commandsProfiler.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Commands profiler module.
+
+**Others:**
+	The :class:`CommandsProfiler` class replaces the functions of a commands module, usually :mod:`maya.cmds`,
+	with wrappers recording the calls count, the cumulative time and optionally the Python call sites of each command.
+	The original functions are restored on exit, any module exposing functions can be profiled.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import logging
+import sys
+import time
+
+try:
+	import maya.cmds as cmds
+except ImportError:
+	cmds = None
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "CommandsProfiler"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class CommandsProfiler(object):
+	"""
+	This class is the **CommandsProfiler** class, it is a context manager profiling the commands module calls
+	made within its block.
+
+	Usage::
+
+		with CommandsProfiler(cmds, callSites=True) as commandsProfiler:
+			collapseComponents.collapseComponents(components)
+		commandsProfiler.logReport()
+	"""
+
+	@core.executionTrace
+	def __init__(self, commands=cmds, callSites=False):
+		"""
+		This method initializes the class.
+
+		:param commands: Commands module. ( Module )
+		:param callSites: Record the commands call sites. ( Boolean )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__commands = commands
+		self.__callSites = callSites
+
+		self.__statistics = {}
+		self.__functions = {}
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def commands(self):
+		"""
+		This method is the property for **self.__commands** attribute.
+
+		:return: self.__commands. ( Module )
+		"""
+
+		return self.__commands
+
+	@commands.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def commands(self, value):
+		"""
+		This method is the setter method for **self.__commands** attribute.
+
+		:param value: Attribute value. ( Module )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "commands"))
+
+	@commands.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def commands(self):
+		"""
+		This method is the deleter method for **self.__commands** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "commands"))
+
+	@property
+	def statistics(self):
+		"""
+		This method is the property for **self.__statistics** attribute.
+
+		:return: self.__statistics. ( Dictionary )
+		"""
+
+		return self.__statistics
+
+	@statistics.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def statistics(self, value):
+		"""
+		This method is the setter method for **self.__statistics** attribute.
+
+		:param value: Attribute value. ( Dictionary )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "statistics"))
+
+	@statistics.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def statistics(self):
+		"""
+		This method is the deleter method for **self.__statistics** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "statistics"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def __enter__(self):
+		"""
+		This method reimplements the context manager entry, the commands are wrapped.
+
+		:return: Self. ( CommandsProfiler )
+		"""
+
+		self.install()
+		return self
+
+	def __exit__(self, *args):
+		"""
+		This method reimplements the context manager exit, the commands are restored.
+
+		:param \*args: Exception type, value and traceback. ( \* )
+		:return: Exceptions are propagated. ( Boolean )
+		"""
+
+		self.uninstall()
+		return False
+
+	def __getCommandWrapper(self, name, function):
+		"""
+		This method returns given command profiling wrapper.
+
+		:param name: Command name. ( String )
+		:param function: Command function. ( Object )
+		:return: Profiling wrapper. ( Object )
+		"""
+
+		statistics = self.__statistics.setdefault(name, {"calls" : 0, "time" : 0., "callSites" : {}})
+		recordCallSites = self.__callSites
+		callSites = statistics["callSites"]
+
+		def commandWrapper(*args, **kwargs):
+			"""
+			This definition is the profiling wrapper.
+
+			:param \*args: Arguments. ( \* )
+			:param \*\*kwargs: Keywords arguments. ( \*\* )
+			:return: Command return value. ( Object )
+			"""
+
+			if recordCallSites:
+				frame = sys._getframe(1)
+				callSite = (frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+				callSites[callSite] = callSites.get(callSite, 0) + 1
+
+			startTime = time.time()
+			try:
+				return function(*args, **kwargs)
+			finally:
+				statistics["time"] += time.time() - startTime
+				statistics["calls"] += 1
+
+		commandWrapper.__name__ = name
+		commandWrapper.__doc__ = getattr(function, "__doc__", None)
+		return commandWrapper
+
+	@core.executionTrace
+	def install(self):
+		"""
+		This method replaces the commands module functions with the profiling wrappers.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if self.__commands is None or self.__functions:
+			return False
+
+		for name, value in vars(self.__commands).items():
+			if name.startswith("_") or not callable(value):
+				continue
+
+			self.__functions[name] = value
+			setattr(self.__commands, name, self.__getCommandWrapper(name, value))
+		return True
+
+	@core.executionTrace
+	def uninstall(self):
+		"""
+		This method restores the commands module functions.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if not self.__functions:
+			return False
+
+		for name, function in self.__functions.iteritems():
+			setattr(self.__commands, name, function)
+		self.__functions = {}
+		return True
+
+	@core.executionTrace
+	def clear(self):
+		"""
+		This method clears the statistics.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		for statistics in self.__statistics.itervalues():
+			statistics["calls"] = 0
+			statistics["time"] = 0.
+			statistics["callSites"].clear()
+		return True
+
+	@core.executionTrace
+	def getCallsCount(self):
+		"""
+		This method returns the commands calls count.
+
+		:return: Calls count. ( Integer )
+		"""
+
+		return sum(statistics["calls"] for statistics in self.__statistics.itervalues())
+
+	@core.executionTrace
+	def getReport(self, count=None):
+		"""
+		This method returns the called commands sorted from the most expensive one.
+
+		:param count: Commands count. ( Integer )
+		:return: Commands names, calls counts, cumulative times and call sites sorted from the most frequent. ( List )
+		"""
+
+		report = []
+		for name, statistics in self.__statistics.iteritems():
+			if not statistics["calls"]:
+				continue
+
+			callSites = sorted(statistics["callSites"].iteritems(), key=lambda item: item[1], reverse=True)
+			report.append({"command" : name,
+							"calls" : statistics["calls"],
+							"time" : statistics["time"],
+							"callSites" : [("{0}:{1} ({2})".format(*callSite), calls) for callSite, calls in callSites]})
+		report = sorted(report, key=lambda command: (command["time"], command["calls"]), reverse=True)
+		return count is None and report or report[:count]
+
+	@core.executionTrace
+	def logReport(self, title=None, count=Constants.commandsReportCount):
+		"""
+		This method logs the hottest commands.
+
+		:param title: Report title. ( String )
+		:param count: Commands count. ( Integer )
+		:return: Method success. ( Boolean )
+		"""
+
+		report = self.getReport(count)
+		if not report:
+			return False
+
+		LOGGER.info(Constants.loggingSeparators)
+		LOGGER.info("{0} | {1}'{2}' commands calls!".format(self.__class__.__name__,
+															title and "{0}: ".format(title) or "",
+															self.getCallsCount()))
+		for command in report:
+			LOGGER.info("{0} | '{1}' command: '{2}' calls, '{3:.3f}' seconds.".format(
+			self.__class__.__name__, command["command"], command["calls"], command["time"]))
+			for callSite, calls in command["callSites"][:Constants.commandsReportCallSitesCount]:
+				LOGGER.info("{0} | \t'{1}': '{2}' calls.".format(self.__class__.__name__, callSite, calls))
+		LOGGER.info(Constants.loggingSeparators)
+		return True
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**common.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Common module.
+
+**Others:**
+	The files written here are shared by every Maya session of the user, they are written atomically and the
+	read / modify / write sequences are guarded by advisory lock files.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import contextlib
+import logging
+import os
+import threading
+import time
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "writeFile", "lockFile"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+@core.executionTrace
+def writeFile(file, content, mode="w"):
+	"""
+	This definition writes given content into given file.
+
+	The content is written into a temporary file renamed over given file so that the concurrent Maya sessions
+	never read a partial file.
+
+	:param file: File. ( String )
+	:param content: Content. ( String )
+	:param mode: File opening mode, "w" or "wb". ( String )
+	:return: Definition success. ( Boolean )
+	"""
+
+	directory = os.path.dirname(file)
+	if directory and not os.path.exists(directory):
+		os.makedirs(directory)
+
+	temporaryFile = "{0}.{1}.{2}".format(file, os.getpid(), threading.currentThread().ident)
+	with open(temporaryFile, mode) as handle:
+		handle.write(content)
+	# Windows refuses to rename over an existing file.
+	if os.name == "nt" and os.path.exists(file):
+		os.remove(file)
+	os.rename(temporaryFile, file)
+	return True
+
+@contextlib.contextmanager
+def lockFile(file, timeout=Constants.lockFileTimeout, wait=0.):
+	"""
+	This definition is a context manager acquiring an advisory lock on given file.
+
+	The lock is a file created next to given file, a lock older than given timeout is considered left over
+	by a dead session and is broken.
+
+	Usage::
+
+		with lockFile(file) as locked:
+			if locked:
+				...
+
+	:param file: File. ( String )
+	:param timeout: Lock timeout in seconds. ( Integer )
+	:param wait: Duration in seconds to wait for the lock before giving up. ( Float )
+	:return: Lock acquired. ( Boolean )
+	"""
+
+	lock = "{0}.{1}".format(file, Constants.lockFileExtension)
+	directory = os.path.dirname(lock)
+	if directory and not os.path.exists(directory):
+		os.makedirs(directory)
+
+	descriptor = None
+	deadline = time.time() + wait
+	while True:
+		try:
+			descriptor = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+			break
+		except OSError:
+			try:
+				if time.time() - os.path.getmtime(lock) > timeout:
+					LOGGER.debug("> Breaking '{0}' stale lock file.".format(lock))
+					os.remove(lock)
+					continue
+			except OSError:
+				pass
+
+		if time.time() >= deadline:
+			break
+		time.sleep(Constants.lockFilePollingInterval)
+
+	if descriptor is None:
+		yield False
+		return
+
+	try:
+		os.close(descriptor)
+		yield True
+	finally:
+		try:
+			os.remove(lock)
+		except OSError:
+			pass
@@ -52,6 +52,11 @@ import foundations.exceptions
 import snippets.libraries.common
 from snippets.globals.runtimeGlobals import RuntimeGlobals
 from snippets.managers.modulesManager import ModulesManager
+from snippets.managers.modulesWatcher import ModulesWatcher
+from snippets.managers.profilesManager import ProfilesManager
+from snippets.managers.timingsManager import TimingsManager
+from snippets.managers.usageManager import UsageManager
+from snippets.managers.usageManager import prewarmModules
 
 #**********************************************************************************************************************
 #***	Module attributes.
@@ -85,19 +90,67 @@ def _setModulesManager():
 	"""
 
 	if not isinstance(RuntimeGlobals.modulesManager, ModulesManager):
-		RuntimeGlobals.modulesManager = ModulesManager([RuntimeGlobals.librariesDirectory])
+		RuntimeGlobals.modulesManager = ModulesManager([RuntimeGlobals.librariesDirectory],
+														RuntimeGlobals.interfacesIndexFile,
+														RuntimeGlobals.bytecodeCacheDirectory)
 		RuntimeGlobals.modulesManager.registerAll()
 
+@core.executionTrace
+def _setUsageManager():
+	"""
+	This definition sets the global usage manager instance.
+	"""
+
+	if not isinstance(RuntimeGlobals.usageManager, UsageManager):
+		RuntimeGlobals.usageManager = UsageManager(RuntimeGlobals.usageFile)
+		RuntimeGlobals.usageManager.load()
+		RuntimeGlobals.usageManager.start()
+
+@core.executionTrace
+def _setModulesWatcher(interval):
+	"""
+	This definition sets and starts the global modules watcher instance.
+
+	:param interval: Polling interval in seconds. ( Float )
+	"""
+
+	if not isinstance(RuntimeGlobals.modulesWatcher, ModulesWatcher):
+		RuntimeGlobals.modulesWatcher = ModulesWatcher(modulesManager=RuntimeGlobals.modulesManager, interval=interval)
+	RuntimeGlobals.modulesWatcher.start()
+
 @core.executionTrace
 @foundations.exceptions.exceptionsHandler(None, False, Exception)
-def run():
+def run(watch=False, interval=Constants.modulesWatcherInterval, profile=True,
+		countCommands=Constants.profilesCountCommands):
 	"""
 	This definition starts the Application.
 
+	:param watch: Watch the libraries directories and register the changed modules. ( Boolean )
+	:param interval: Modules watcher polling interval in seconds. ( Float )
+	:param profile: Profile the interfaces executions. ( Boolean )
+	:param countCommands: Count the Maya commands calls of the profiled executions. ( Boolean )
 	:return: Definition success. ( Boolean )
 	"""
 
+	if not isinstance(RuntimeGlobals.timingsManager, TimingsManager):
+		RuntimeGlobals.timingsManager = TimingsManager()
+
+	if profile and not isinstance(RuntimeGlobals.profilesManager, ProfilesManager):
+		RuntimeGlobals.profilesManager = ProfilesManager(countCommands=countCommands)
+
 	RuntimeGlobals.librariesDirectory = os.path.join(os.path.dirname(__file__), Constants.librariesDirectory)
 	RuntimeGlobals.resourcesDirectory = os.path.join(os.path.dirname(__file__), Constants.resourcesDirectory)
+	RuntimeGlobals.userApplicationDatasDirectory = os.path.join(os.path.expanduser("~"),
+																Constants.userApplicationDatasDirectory)
+	RuntimeGlobals.interfacesIndexFile = os.path.join(RuntimeGlobals.userApplicationDatasDirectory,
+													Constants.interfacesIndexFile)
+	RuntimeGlobals.bytecodeCacheDirectory = os.path.join(RuntimeGlobals.userApplicationDatasDirectory,
+														Constants.bytecodeCacheDirectory)
+	RuntimeGlobals.usageFile = os.path.join(RuntimeGlobals.userApplicationDatasDirectory, Constants.usageFile)
 
 	_setModulesManager()
+	_setUsageManager()
+	prewarmModules(RuntimeGlobals.modulesManager, RuntimeGlobals.usageManager)
+	watch and _setModulesWatcher(interval)
+
+	RuntimeGlobals.timingsManager.logReport()
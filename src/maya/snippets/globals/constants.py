@@ -47,6 +47,52 @@ class Constants():
 	libraryExtension = "py"
 	libraryCompiledExtension = "pyc"
 
+	userApplicationDatasDirectory = ".snippets"
+
+	lockFileExtension = "lock"
+	lockFileTimeout = 60
+	lockFilePollingInterval = 0.05
+
+	interfacesPattern = r"^I[A-Z]\w+"
+	interfacesDiscovery = "static"
+
+	interfacesIndexFile = "interfaces.idx"
+	interfacesIndexVersion = 2
+
+	bytecodeCacheDirectory = "bytecode"
+
+	timingsReportCount = 10
+	timingsLogSize = 1024
+
+	tracerSamplingRate = 100
+
+	searchEngineResultsCount = 25
+	searchEngineUsageWeight = 2.
+
+	usageFile = "usage.jsonl"
+	usageCompactionThreshold = 512
+	usageLockWait = 1.
+	usagePrewarmCount = 8
+	usagePrewarmDelay = 2000
+
+	profilesLogSize = 1024
+	profilesCountCommands = False
+
+	commandsReportCount = 10
+	commandsReportCallSitesCount = 3
+
+	benchmarksFile = "benchmarks.json"
+	benchmarksSizes = (1024, 4096, 16384)
+	benchmarksRepeats = 3
+	benchmarksRegressionThreshold = 0.25
+	benchmarksMinimumTime = 0.05
+
+	modulesWatcherInterval = 5.0
+	modulesWatcherSettleDelay = 0.5
+
+	modulesScannerThreads = 8
+	modulesScannerIgnoredDirectories = (".git", ".hg", ".svn", "CVS", "__pycache__")
+
 	librariesDirectory = "libraries"
 	resourcesDirectory = "resources"
 
@@ -44,8 +44,17 @@ class RuntimeGlobals():
 	popupUiFile = None
 
 	modulesManager = None
+	modulesWatcher = None
+	timingsManager = None
+	usageManager = None
+	profilesManager = None
 
 	librariesDirectory = None
 	resourcesDirectory = None
+	userApplicationDatasDirectory = None
+
+	interfacesIndexFile = None
+	bytecodeCacheDirectory = None
+	usageFile = None
 
 	popupPattern = None
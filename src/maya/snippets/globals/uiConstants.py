@@ -44,3 +44,7 @@ class UiConstants():
 	popupUiFile = "Popup.ui"
 
 	snippetsLoaderLogo = "images/Snippets_Loader_Logo.png"
+
+	searchDelay = 150
+	searchLatencyBuckets = (16, 33, 50, 100, 200, 500, 1000)
+	filterChunkSize = 256
@@ -6,6 +6,12 @@ import maya.OpenMaya as OpenMaya
 import os
 import pprint
 import re
+import time
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
@@ -18,12 +24,47 @@ __all__ = ["RESOURCES_DIRECTORY",
 				"CHECKER_IMAGE",
 				"DEFAULT_SCALE_COVERAGE = 0.98",
 				"MARI_NAME_FORMAT",
+				"DEFAULT_TEXTURE_RESOLUTION",
+				"DEFAULT_TEXEL_DENSITY_TOLERANCE",
+				"MESHES_AREAS_CACHE",
+				"MESHES_AREAS_CACHE_CALLBACKS",
+				"MESHES_AREAS_STALE_CALLBACKS",
 				"stacksHandler",
 				"getNode",
 				"isGeometry",
 				"getUVsFromComponents",
+				"getMFnMesh",
+				"getMeshUVs",
+				"getComponentsUVsIndices",
+				"getComponentsUVs",
+				"getFacesUVsIndices",
+				"getComponentsRanges",
 				"getFacesPerPatches",
+				"getFacesUVsAreas",
+				"getUVsShells",
+				"getUVsShellsStatistics",
+				"getComponentsUVsShells",
+				"setMeshUVs",
+				"transformUVsShells",
+				"getMeshPoints",
+				"getFacesVerticesIndices",
+				"getFacesTriangles",
+				"getFacesAreasFromTriangles",
+				"getFacesWorldAreas",
+				"getMeshObject",
+				"getMeshWorldMatrix",
+				"removeCallbacks",
+				"clearMeshesAreasCache",
+				"meshAreas_OnDirty",
+				"meshAreas_OnRemoval",
+				"meshesAreasCache_OnSceneChanged",
+				"getMeshCache",
+				"getObjectFacesAreas",
+				"getObjectAreas",
+				"getObjectsAreas",
 				"getObjectUVsArea",
+				"getObjectWorldArea",
+				"getUVDimsFromUVs",
 				"getComponentUVDims",
 				"getMariPatchFromUVDims",
 				"getComponentsUVDims",
@@ -46,13 +87,25 @@ __all__ = ["RESOURCES_DIRECTORY",
 				"rotateComponentsUVs",
 				"moveComponentsUVs",
 				"mirrorComponentsUVs",
+				"getObjectsUVsShells",
 				"stackObjectsUVs",
 				"prescaleUVsShells",
 				"autoRatioUVsAreas",
+				"getTexelDensity",
+				"getObjectsTexelDensities",
+				"getUVsShellsTexelDensities",
+				"getObjectsMeanTexelDensity",
+				"getTexelDensityOutliers",
+				"printTexelDensityOutliers",
+				"IPrintTexelDensityOutliers",
+				"normalizeTexelDensity",
+				"INormalizeTexelDensity",
 				"addUVsChecker",
 				"removeUVsChecker",
 				"setUVsCheckerRepeats",
+				"getShadingEngines",
 				"getPatchShaderTree",
+				"getObjectPatchesMembers",
 				"assignMariShadersToObject",
 				"assignMariShaders",
 				"IAssignMariShaders",
@@ -92,6 +145,15 @@ DEFAULT_SCALE_COVERAGE = 0.98
 
 MARI_NAME_FORMAT = "_%s"
 
+DEFAULT_TEXTURE_RESOLUTION = 4096
+DEFAULT_TEXEL_DENSITY_TOLERANCE = 0.25
+
+MESHES_AREAS_CACHE = {}
+MESHES_AREAS_CACHE_CALLBACKS = []
+MESHES_AREAS_STALE_CALLBACKS = []
+
+COMPONENTS_RANGE_PATTERN = re.compile(r"^(?P<object>[^\.]+)\.(?P<type>\w+)\[(?P<start>\d+)(?::(?P<end>\d+))?\]$")
+
 def stacksHandler(object):
 	"""
 	This decorator is used to handle various Maya stacks.
@@ -182,48 +244,850 @@ def getUVsFromComponents(components, flatten=True):
 			return cmds.ls(cmds.polyListComponentConversion(components, toUV=True), fl=flatten)
 	return components
 
+def getMFnMesh(object):
+	"""
+	This definition returns given object mesh function set.
+
+	:param object: Object. ( String )
+	:return: Mesh function set. ( MFnMesh )
+	"""
+
+	selectionList = OpenMaya.MSelectionList()
+	selectionList.add(object)
+	dagPath = OpenMaya.MDagPath()
+	selectionList.getDagPath(0, dagPath)
+	return OpenMaya.MFnMesh(dagPath)
+
+def getMeshUVs(object):
+	"""
+	This definition returns given object UVs with one bulk query.
+
+	The UVs are returned as a ( n, 2 ) NumPy array or as a list of ( u, v ) tuples if NumPy is not available.
+
+	:param object: Object. ( String )
+	:return: UVs. ( Array / List )
+	"""
+
+	uArray = OpenMaya.MFloatArray()
+	vArray = OpenMaya.MFloatArray()
+	getMFnMesh(object).getUVs(uArray, vArray)
+	if numpy is None:
+		return list(zip(uArray, vArray))
+
+	uvs = numpy.empty((len(uArray), 2), dtype=numpy.float64)
+	uvs[:, 0] = uArray
+	uvs[:, 1] = vArray
+	return uvs
+
+def getComponentsUVsIndices(components):
+	"""
+	This definition returns given components UVs indices per object without flattening the components.
+
+	The indices are returned as sorted NumPy arrays or as sorted lists if NumPy is not available.
+
+	:param components: Components. ( Tuple / List / String )
+	:return: UVs indices per object. ( Dictionary )
+	"""
+
+	if isinstance(components, basestring):
+		components = [components]
+
+	uvs = []
+	others = []
+	for component in components:
+		match = COMPONENTS_RANGE_PATTERN.match(component)
+		if match and match.group("type") == "map":
+			uvs.append(match)
+		else:
+			others.append(component)
+	if others:
+		uvs.extend(COMPONENTS_RANGE_PATTERN.match(component)
+					for component in cmds.polyListComponentConversion(others, toUV=True))
+
+	ranges = {}
+	objects = {}
+	for match in uvs:
+		object = match.group("object")
+		if not object in objects:
+			objects[object] = getNode(object)
+		start = int(match.group("start"))
+		ranges.setdefault(objects[object], []).append((start, int(match.group("end") or start)))
+
+	indices = {}
+	for object, objectRanges in ranges.iteritems():
+		if numpy is None:
+			objectIndices = set()
+			for start, end in objectRanges:
+				objectIndices.update(xrange(start, end + 1))
+			indices[object] = sorted(objectIndices)
+		elif len(objectRanges) == 1:
+			indices[object] = numpy.arange(objectRanges[0][0], objectRanges[0][1] + 1)
+		else:
+			indices[object] = numpy.unique(numpy.concatenate([numpy.arange(start, end + 1)
+															for start, end in objectRanges]))
+	return indices
+
+def getComponentsUVs(components):
+	"""
+	This definition returns given components UVs per object, fetching each object UVs with one bulk query.
+
+	:param components: Components. ( Tuple / List / String )
+	:return: UVs per object. ( Dictionary )
+	"""
+
+	componentsUVs = {}
+	for object, indices in getComponentsUVsIndices(components).iteritems():
+		uvs = getMeshUVs(object)
+		if numpy is None:
+			componentsUVs[object] = [uvs[index] for index in indices if index < len(uvs)]
+		else:
+			componentsUVs[object] = uvs[indices[indices < len(uvs)]]
+	return componentsUVs
+
+def getFacesUVsIndices(object):
+	"""
+	This definition returns given object faces UVs counts and faces vertices UVs indices with one bulk query.
+
+	:param object: Object. ( String )
+	:return: Faces UVs counts, faces vertices UVs indices. ( Tuple )
+	"""
+
+	uvCounts = OpenMaya.MIntArray()
+	uvIds = OpenMaya.MIntArray()
+	getMFnMesh(object).getAssignedUVs(uvCounts, uvIds)
+	return uvCounts, uvIds
+
+def getComponentsRanges(object, type, indices):
+	"""
+	This definition returns given sorted components indices as compact components ranges names.
+
+	:param object: Object. ( String )
+	:param type: Components type, "vtx", "e", "f" or "map". ( String )
+	:param indices: Sorted components indices. ( Array / List )
+	:return: Components ranges names. ( List )
+	"""
+
+	if not len(indices):
+		return []
+
+	if numpy is None:
+		ranges = [[indices[0], indices[0]]]
+		for index in indices[1:]:
+			if index == ranges[-1][1] + 1:
+				ranges[-1][1] = index
+			else:
+				ranges.append([index, index])
+	else:
+		indices = numpy.asarray(indices)
+		breaks = numpy.nonzero(numpy.diff(indices) != 1)[0]
+		ranges = zip(indices[numpy.concatenate(([0], breaks + 1))].tolist(),
+					indices[numpy.concatenate((breaks, [len(indices) - 1]))].tolist())
+
+	return ["%s.%s[%s:%s]" % (object, type, start, end) for start, end in ranges]
+
 def getFacesPerPatches(object):
 	"""
 	This definition returns the faces per patches from given object.
 
+	The faces are bucketed from the bulk queried faces UVs indices and returned as compact faces ranges
+	that can be given directly to **cmds.sets**.
+
 	:param object: Object. ( String )
-	:return: Faces per patches. ( Dictionary )
+	:return: Faces ranges per patches. ( Dictionary )
+	"""
+
+	uvs = getMeshUVs(object)
+	uvCounts, uvIds = getFacesUVsIndices(object)
+	if numpy is None:
+		facesPerPatches = {}
+		offset = 0
+		for face, count in enumerate(uvCounts):
+			if count:
+				u, v = uvs[min(uvIds[offset:offset + count])]
+				facesPerPatches.setdefault(getMariPatchFromUVDims((int(math.floor(u)), int(math.floor(v)))), []).append(face)
+			offset += count
+		for patch, faces in facesPerPatches.iteritems():
+			facesPerPatches[patch] = getComponentsRanges(object, "f", faces)
+		return facesPerPatches
+
+	uvCounts = numpy.array(uvCounts, dtype=numpy.int64)
+	uvIds = numpy.array(uvIds, dtype=numpy.int64)
+	faces = numpy.nonzero(uvCounts)[0]
+	if not len(faces):
+		return {}
+
+	# The face patch is the patch of its lowest UV index, like the first UV of its flattened components.
+	firstUVs = numpy.minimum.reduceat(uvIds, (numpy.cumsum(uvCounts) - uvCounts)[faces])
+	uvDims = getUVDimsFromUVs(uvs[firstUVs])
+	patches = getMariPatchFromUVDims((uvDims[:, 0], uvDims[:, 1]))
+	order = numpy.argsort(patches, kind="mergesort")
+	uniquePatches, starts = numpy.unique(patches[order], return_index=True)
+	facesPerPatches = {}
+	for patch, start, end in zip(uniquePatches.tolist(), starts.tolist(), starts[1:].tolist() + [len(order)]):
+		facesPerPatches[patch] = getComponentsRanges(object, "f", faces[order[start:end]])
+	return facesPerPatches
+
+def getFacesUVsAreas(uvs, uvCounts, uvIds):
 	"""
+	This definition returns the faces UVs areas from given UVs and faces UVs indices.
 
-	faces = cmds.ls("%s.f[0:%s]" % (object, cmds.polyEvaluate(object, face=True)), fl=True)
-	facesPerPatches = {}
-	for face in faces:
-		map, patch = getComponentsMariPatches(face)[0]
-		if not patch in facesPerPatches:
-			facesPerPatches[patch] = [face]
-			continue
+	The faces areas are computed at once with the shoelace formula.
 
-		facesPerPatches[patch].append(face)
-	return facesPerPatches
+	:param uvs: UVs. ( Array / List )
+	:param uvCounts: Faces UVs counts. ( Array / List )
+	:param uvIds: Faces vertices UVs indices. ( Array / List )
+	:return: Faces UVs areas. ( Array / List )
+	"""
 
-def getObjectUVsArea(object):
+	if numpy is None:
+		areas = []
+		offset = 0
+		for count in uvCounts:
+			area = 0.
+			for i in xrange(count):
+				u, v = uvs[uvIds[offset + i]]
+				nextU, nextV = uvs[uvIds[offset + (i + 1) % count]]
+				area += u * nextV - nextU * v
+			areas.append(math.fabs(area) / 2.)
+			offset += count
+		return areas
+
+	uvCounts = numpy.asarray(uvCounts, dtype=numpy.int64)
+	uvIds = numpy.asarray(uvIds, dtype=numpy.int64)
+	areas = numpy.zeros(len(uvCounts), dtype=numpy.float64)
+	faces = numpy.nonzero(uvCounts)[0]
+	if not len(faces):
+		return areas
+
+	starts = (numpy.cumsum(uvCounts) - uvCounts)[faces]
+	nextIds = numpy.arange(1, len(uvIds) + 1)
+	nextIds[starts + uvCounts[faces] - 1] = starts
+	currentUVs, nextUVs = uvs[uvIds], uvs[uvIds[nextIds]]
+	crosses = currentUVs[:, 0] * nextUVs[:, 1] - nextUVs[:, 0] * currentUVs[:, 1]
+	areas[faces] = numpy.fabs(numpy.add.reduceat(crosses, starts)) / 2.
+	return areas
+
+def getUVsShells(object, uvCounts=None, uvIds=None):
+	"""
+	This definition returns given object UVs shells.
+
+	The shells are built with an union-find over the faces vertices UVs connectivity: the UVs of a face always
+	belong to the same shell. The UVs that are not assigned to any face are not part of any shell.
+
+	:param object: Object. ( String )
+	:param uvCounts: Faces UVs counts. ( Array / List )
+	:param uvIds: Faces vertices UVs indices. ( Array / List )
+	:return: UVs shells indices, -1 for unassigned UVs, shells count. ( Tuple )
+	"""
+
+	if uvCounts is None or uvIds is None:
+		uvCounts, uvIds = getFacesUVsIndices(object)
+	uvsCount = getMFnMesh(object).numUVs()
+
+	if numpy is None:
+		parents = list(range(uvsCount))
+
+		def find(index):
+			while parents[index] != index:
+				parents[index] = parents[parents[index]]
+				index = parents[index]
+			return index
+
+		assigned = [False] * uvsCount
+		offset = 0
+		for count in uvCounts:
+			for i in xrange(offset, offset + count):
+				assigned[uvIds[i]] = True
+				if i > offset:
+					root, otherRoot = find(uvIds[offset]), find(uvIds[i])
+					if root != otherRoot:
+						parents[max(root, otherRoot)] = min(root, otherRoot)
+			offset += count
+
+		shells = [-1] * uvsCount
+		roots = {}
+		for index in xrange(uvsCount):
+			if assigned[index]:
+				shells[index] = roots.setdefault(find(index), len(roots))
+		return shells, len(roots)
+
+	uvCounts = numpy.asarray(uvCounts, dtype=numpy.int64)
+	uvIds = numpy.asarray(uvIds, dtype=numpy.int64)
+	shells = numpy.empty(uvsCount, dtype=numpy.int64)
+	shells.fill(-1)
+	if not len(uvIds):
+		return shells, 0
+
+	# Each face vertex UV is linked to the next one of the same face.
+	links = numpy.ones(len(uvIds) - 1, dtype=bool)
+	links[(numpy.cumsum(uvCounts) - 1)[uvCounts > 0][:-1]] = False
+	sources, targets = uvIds[:-1][links], uvIds[1:][links]
+
+	parents = numpy.arange(uvsCount)
+	while True:
+		sourcesRoots, targetsRoots = parents[sources], parents[targets]
+		unlinked = sourcesRoots != targetsRoots
+		if not unlinked.any():
+			break
+
+		# Hooking: the highest roots are attached to the lowest ones, then the trees are compressed.
+		sourcesRoots, targetsRoots = sourcesRoots[unlinked], targetsRoots[unlinked]
+		numpy.minimum.at(parents,
+						numpy.maximum(sourcesRoots, targetsRoots),
+						numpy.minimum(sourcesRoots, targetsRoots))
+		while True:
+			grandParents = parents[parents]
+			if (grandParents == parents).all():
+				break
+			parents = grandParents
+
+	assigned = numpy.zeros(uvsCount, dtype=bool)
+	assigned[uvIds] = True
+	roots, shells[assigned] = numpy.unique(parents[assigned], return_inverse=True)
+	return shells, len(roots)
+
+def getUVsShellsStatistics(object, worldAreas=False):
+	"""
+	This definition returns given object UVs shells statistics.
+
+	The statistics dictionary holds the following keys:
+
+		- **uvs**: Object UVs.
+		- **shells**: UVs shells indices, -1 for unassigned UVs.
+		- **facesShells**: Faces shells indices, -1 for the faces without UVs.
+		- **boundingBoxes**: Shells bounding boxes as ( uMin, vMin, uMax, vMax ).
+		- **centers**: Shells bounding boxes centers.
+		- **areas**: Shells UVs areas.
+		- **patches**: Shells centers Mari patches.
+		- **worldAreas**: Shells world areas, only if requested.
+
+	The statistics are cached until the mesh becomes dirty and the shells world areas are summed from the cached
+	faces world areas, the returned arrays are shared with the cache and must not be modified in place.
+
+	:param object: Object. ( String )
+	:param worldAreas: Computes the shells world areas. ( Boolean )
+	:return: UVs shells statistics. ( Dictionary )
+	"""
+
+	datas = getMeshCache(object)
+	if datas.get("statistics") is None:
+		uvs = getMeshUVs(object)
+		uvCounts, uvIds = getFacesUVsIndices(object)
+		shells, count = getUVsShells(object, uvCounts, uvIds)
+		facesAreas = datas.get("facesUVsAreas")
+		if facesAreas is None:
+			facesAreas = datas["facesUVsAreas"] = getFacesUVsAreas(uvs, uvCounts, uvIds)
+			datas["areas"] = None
+
+		if numpy is None:
+			boundingBoxes = [[2 ** 8, 2 ** 8, -2 ** 8, -2 ** 8] for shell in xrange(count)]
+			for (u, v), shell in zip(uvs, shells):
+				if shell == -1:
+					continue
+
+				boundingBox = boundingBoxes[shell]
+				boundingBox[:] = min(u, boundingBox[0]), min(v, boundingBox[1]), max(u, boundingBox[2]), max(v, boundingBox[3])
+			centers = [((uMin + uMax) / 2., (vMin + vMax) / 2.) for uMin, vMin, uMax, vMax in boundingBoxes]
+			areas = [0.] * count
+			facesShells = [-1] * len(uvCounts)
+			offset = 0
+			for face, (faceCount, area) in enumerate(zip(uvCounts, facesAreas)):
+				if faceCount:
+					facesShells[face] = shells[uvIds[offset]]
+					areas[facesShells[face]] += area
+				offset += faceCount
+			patches = [getMariPatchFromUVDims(uvDims) for uvDims in getUVDimsFromUVs(centers)]
+		else:
+			assigned = numpy.nonzero(shells != -1)[0]
+			order = assigned[numpy.argsort(shells[assigned], kind="mergesort")]
+			starts = numpy.searchsorted(shells[order], numpy.arange(count))
+			boundingBoxes = numpy.hstack((numpy.minimum.reduceat(uvs[order], starts),
+										numpy.maximum.reduceat(uvs[order], starts)))
+			centers = (boundingBoxes[:, :2] + boundingBoxes[:, 2:]) / 2.
+			uvCounts = numpy.asarray(uvCounts, dtype=numpy.int64)
+			faces = numpy.nonzero(uvCounts)[0]
+			facesShells = numpy.empty(len(uvCounts), dtype=numpy.int64)
+			facesShells.fill(-1)
+			facesShells[faces] = shells[numpy.asarray(uvIds, dtype=numpy.int64)[(numpy.cumsum(uvCounts) - uvCounts)[faces]]]
+			areas = numpy.bincount(facesShells[faces], weights=facesAreas[faces], minlength=count)
+			uvDims = getUVDimsFromUVs(centers)
+			patches = getMariPatchFromUVDims((uvDims[:, 0], uvDims[:, 1]))
+
+		datas["statistics"] = {"uvs" : uvs,
+							"shells" : shells,
+							"facesShells" : facesShells,
+							"boundingBoxes" : boundingBoxes,
+							"centers" : centers,
+							"areas" : areas,
+							"patches" : patches}
+
+	statistics = dict(datas["statistics"])
+	if worldAreas:
+		facesShells, facesWorldAreas = statistics["facesShells"], getObjectFacesAreas(object, datas)[1]
+		if numpy is None:
+			shellsWorldAreas = [0.] * len(statistics["areas"])
+			for shell, area in zip(facesShells, facesWorldAreas):
+				if shell != -1:
+					shellsWorldAreas[shell] += area
+		else:
+			faces = numpy.nonzero(facesShells != -1)[0]
+			shellsWorldAreas = numpy.bincount(facesShells[faces],
+											weights=facesWorldAreas[faces],
+											minlength=len(statistics["areas"]))
+		statistics["worldAreas"] = shellsWorldAreas
+	return statistics
+
+def getComponentsUVsShells(components):
+	"""
+	This definition returns given components UVs shells statistics per object along the touched shells indices.
+
+	:param components: Components. ( Tuple / List / String )
+	:return: UVs shells statistics, touched shells indices per object. ( Dictionary )
+	"""
+
+	componentsShells = {}
+	for object, indices in getComponentsUVsIndices(components).iteritems():
+		statistics = getUVsShellsStatistics(object)
+		shells = statistics["shells"]
+		if numpy is None:
+			touchedShells = sorted(set(shells[index] for index in indices if index < len(shells)) - set((-1,)))
+		else:
+			touchedShells = numpy.unique(shells[indices[indices < len(shells)]])
+			touchedShells = touchedShells[touchedShells != -1]
+		componentsShells[object] = (statistics, touchedShells)
+	return componentsShells
+
+def setMeshUVs(object, uvs):
 	"""
-	This definition returns given object UVs area.
+	This definition sets given object UVs with one bulk write.
+
+	The UVs are written through the API and are not recorded by the undo queue.
 
-	:param object: Object to retrieve UVs area. ( String )
-	:return: UVs area. ( Integer )
+	:param object: Object. ( String )
+	:param uvs: UVs. ( Array / List )
+	:return: Definition succes. ( Boolean )
+	"""
+
+	uArray = OpenMaya.MFloatArray()
+	vArray = OpenMaya.MFloatArray()
+	if numpy is None:
+		us, vs = zip(*uvs)
+	else:
+		us, vs = uvs[:, 0].tolist(), uvs[:, 1].tolist()
+	OpenMaya.MScriptUtil.createFloatArrayFromList(us, uArray)
+	OpenMaya.MScriptUtil.createFloatArrayFromList(vs, vArray)
+	getMFnMesh(object).setUVs(uArray, vArray)
+	getMeshCache(object).clear()
+	return True
+
+def transformUVsShells(object, statistics, shells, pivots, scales, offsets, undoable=False):
+	"""
+	This definition transforms given object UVs shells in one pass and writes the UVs back with one bulk write.
+
+	Each shell UVs are scaled around the shell pivot and then offseted. The bulk write is not recorded by the undo
+	queue, the undoable mode issues instead one **cmds.polyTweakUV** with each transformed UV offset on their compact
+	UVs ranges.
+
+	:param object: Object. ( String )
+	:param statistics: Object UVs shells statistics. ( Dictionary )
+	:param shells: Shells indices to transform. ( Array / List )
+	:param pivots: Shells pivots. ( Array / List )
+	:param scales: Shells scales. ( Array / List )
+	:param offsets: Shells offsets. ( Array / List )
+	:param undoable: Transforms the shells with undoable commands. ( Boolean )
+	:return: Definition succes. ( Boolean )
+	"""
+
+	if not len(shells):
+		return True
+
+	uvs, uvsShells = statistics["uvs"], statistics["shells"]
+	if numpy is None:
+		transforms = dict(zip(shells, zip(pivots, scales, offsets)))
+		indices = []
+		uvs = list(uvs)
+		for index, shell in enumerate(uvsShells):
+			if not shell in transforms:
+				continue
+
+			(pivotU, pivotV), (scaleU, scaleV), (offsetU, offsetV) = transforms[shell]
+			u, v = uvs[index]
+			uvs[index] = ((u - pivotU) * scaleU + pivotU + offsetU, (v - pivotV) * scaleV + pivotV + offsetV)
+			indices.append(index)
+	else:
+		# The lookup last item maps the unassigned UVs shell index -1 to no transformation.
+		lookup = numpy.empty(len(statistics["areas"]) + 1, dtype=numpy.int64)
+		lookup.fill(-1)
+		lookup[numpy.asarray(shells)] = numpy.arange(len(shells))
+		transforms = lookup[uvsShells]
+		indices = numpy.nonzero(transforms != -1)[0]
+		transforms = transforms[indices]
+		pivots = numpy.asarray(pivots, dtype=numpy.float64)[transforms]
+		uvs = uvs.copy()
+		uvs[indices] = ((uvs[indices] - pivots) * numpy.asarray(scales, dtype=numpy.float64)[transforms] +
+						pivots + numpy.asarray(offsets, dtype=numpy.float64)[transforms])
+
+	if not undoable:
+		return setMeshUVs(object, uvs)
+
+	if not len(indices):
+		return True
+
+	if numpy is None:
+		uvsOffsets = [(uvs[index][0] - statistics["uvs"][index][0], uvs[index][1] - statistics["uvs"][index][1])
+					for index in indices]
+	else:
+		uvsOffsets = (uvs[indices] - statistics["uvs"][indices]).tolist()
+	cmds.polyTweakUV(getComponentsRanges(object, "map", indices), uv=uvsOffsets)
+	return True
+
+def getMeshPoints(object, space=OpenMaya.MSpace.kWorld):
+	"""
+	This definition returns given object points with one bulk query.
+
+	The points are returned as a ( n, 3 ) NumPy array or as a list of ( x, y, z ) tuples if NumPy is not available.
+
+	:param object: Object. ( String )
+	:param space: Points space. ( Integer )
+	:return: Points. ( Array / List )
+	"""
+
+	points = OpenMaya.MPointArray()
+	getMFnMesh(object).getPoints(points, space)
+	points = [(point.x, point.y, point.z) for point in points]
+	if numpy is None:
+		return points
+
+	return numpy.array(points, dtype=numpy.float64).reshape(-1, 3)
+
+def getFacesVerticesIndices(object):
+	"""
+	This definition returns given object faces vertices counts and faces vertices indices with one bulk query.
+
+	:param object: Object. ( String )
+	:return: Faces vertices counts, faces vertices indices. ( Tuple )
+	"""
+
+	vertexCounts = OpenMaya.MIntArray()
+	vertices = OpenMaya.MIntArray()
+	getMFnMesh(object).getVertices(vertexCounts, vertices)
+	return vertexCounts, vertices
+
+def getFacesTriangles(points, vertexCounts, vertices):
+	"""
+	This definition returns the faces triangles from given points and faces vertices indices.
+
+	The faces are fan triangulated, each triangle is returned as its face index and the cross product of its edges,
+	the cross product norm being twice the triangle area.
+
+	:param points: Points. ( Array / List )
+	:param vertexCounts: Faces vertices counts. ( Array / List )
+	:param vertices: Faces vertices indices. ( Array / List )
+	:return: Triangles faces indices, triangles cross products. ( Tuple )
+	"""
+
+	if numpy is None:
+		faces = []
+		crosses = []
+		offset = 0
+		for face, count in enumerate(vertexCounts):
+			x, y, z = points[vertices[offset]]
+			for i in xrange(1, count - 1):
+				x1, y1, z1 = (a - b for a, b in zip(points[vertices[offset + i]], (x, y, z)))
+				x2, y2, z2 = (a - b for a, b in zip(points[vertices[offset + i + 1]], (x, y, z)))
+				faces.append(face)
+				crosses.append((y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2))
+			offset += count
+		return faces, crosses
+
+	vertexCounts = numpy.asarray(vertexCounts, dtype=numpy.int64)
+	vertices = numpy.asarray(vertices, dtype=numpy.int64)
+	faces = numpy.repeat(numpy.arange(len(vertexCounts)), vertexCounts)
+	starts = (numpy.cumsum(vertexCounts) - vertexCounts)[faces]
+	local = numpy.arange(len(vertices)) - starts
+	# Each face vertex but the first and the last one starts a triangle with the face first vertex and the next one.
+	seconds = numpy.nonzero((local >= 1) & (local <= vertexCounts[faces] - 2))[0]
+	firsts = points[vertices[starts[seconds]]]
+	return faces[seconds], numpy.cross(points[vertices[seconds]] - firsts, points[vertices[seconds + 1]] - firsts)
+
+def getFacesAreasFromTriangles(triangles, facesCount, matrix=None):
+	"""
+	This definition returns the faces areas from given faces triangles, optionally transformed by given matrix.
+
+	A triangle cross product is transformed by the matrix cofactors, this avoids querying and transforming
+	the points again when only the matrix changes.
+
+	:param triangles: Triangles faces indices, triangles cross products. ( Tuple )
+	:param facesCount: Faces count. ( Integer )
+	:param matrix: Row major 4x4 matrix as 16 values. ( Tuple / List )
+	:return: Faces areas. ( Array / List )
+	"""
+
+	faces, crosses = triangles
+	if numpy is None:
+		cofactors = None
+		if matrix is not None:
+			rows = matrix[0:3], matrix[4:7], matrix[8:11]
+			cofactors = [(y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2)
+						for (x1, y1, z1), (x2, y2, z2) in ((rows[1], rows[2]), (rows[2], rows[0]), (rows[0], rows[1]))]
+		areas = [0.] * facesCount
+		for face, (x, y, z) in zip(faces, crosses):
+			if cofactors is not None:
+				x, y, z = (x * cofactors[0][i] + y * cofactors[1][i] + z * cofactors[2][i] for i in xrange(3))
+			areas[face] += math.sqrt(x * x + y * y + z * z) / 2.
+		return areas
+
+	if matrix is not None:
+		rows = numpy.asarray(matrix, dtype=numpy.float64).reshape(4, 4)[:3, :3]
+		crosses = numpy.dot(crosses, numpy.cross(rows[[1, 2, 0]], rows[[2, 0, 1]]))
+	return numpy.bincount(faces, weights=numpy.sqrt((crosses ** 2).sum(axis=1)) / 2., minlength=facesCount)
+
+def getFacesWorldAreas(points, vertexCounts, vertices):
+	"""
+	This definition returns the faces areas from given points and faces vertices indices.
+
+	The faces are fan triangulated and the triangles areas are computed at once.
+
+	:param points: Points. ( Array / List )
+	:param vertexCounts: Faces vertices counts. ( Array / List )
+	:param vertices: Faces vertices indices. ( Array / List )
+	:return: Faces areas. ( Array / List )
+	"""
+
+	return getFacesAreasFromTriangles(getFacesTriangles(points, vertexCounts, vertices), len(vertexCounts))
+
+def getMeshObject(object):
+	"""
+	This definition returns given object mesh shape dependency node.
+
+	:param object: Object. ( String )
+	:return: Mesh shape dependency node. ( MObject )
+	"""
+
+	selectionList = OpenMaya.MSelectionList()
+	selectionList.add(object)
+	dagPath = OpenMaya.MDagPath()
+	selectionList.getDagPath(0, dagPath)
+	dagPath.extendToShape()
+	selectionList = OpenMaya.MSelectionList()
+	selectionList.add(dagPath.fullPathName())
+	meshObject = OpenMaya.MObject()
+	selectionList.getDependNode(0, meshObject)
+	return meshObject
+
+def getMeshWorldMatrix(object):
+	"""
+	This definition returns given object mesh shape world matrix.
+
+	:param object: Object. ( String )
+	:return: Row major 4x4 matrix as 16 values. ( Tuple )
 	"""
 
 	selectionList = OpenMaya.MSelectionList()
 	selectionList.add(object)
-	selectionListIterator = OpenMaya.MItSelectionList(selectionList)
 	dagPath = OpenMaya.MDagPath()
-	selectionListIterator.getDagPath(dagPath, OpenMaya.MObject())
-	meshPolygonIterator = OpenMaya.MItMeshPolygon(dagPath)
-	scriptUtil = OpenMaya.MScriptUtil()
-	scriptUtil.createFromDouble(0.0)
-	areaPointer = scriptUtil.asDoublePtr()
-	uvsArea = 0
-	while not meshPolygonIterator.isDone():
-		meshPolygonIterator.getUVArea(areaPointer)
-		uvsArea += OpenMaya.MScriptUtil().getDouble(areaPointer)
-		meshPolygonIterator.next()
-	return uvsArea
+	selectionList.getDagPath(0, dagPath)
+	matrix = dagPath.inclusiveMatrix()
+	return tuple(matrix(row, column) for row in xrange(4) for column in xrange(4))
+
+def removeCallbacks(callbacks):
+	"""
+	This definition removes given callbacks, the callbacks already removed by Maya are ignored.
+
+	:param callbacks: Callbacks ids. ( List )
+	:return: Definition success. ( Boolean )
+	"""
+
+	for callback in callbacks:
+		try:
+			OpenMaya.MMessage.removeCallback(callback)
+		except RuntimeError:
+			pass
+	return True
+
+def clearMeshesAreasCache():
+	"""
+	This definition clears the meshes areas cache and removes the meshes callbacks.
+
+	:return: Definition success. ( Boolean )
+	"""
+
+	for cache in MESHES_AREAS_CACHE.itervalues():
+		MESHES_AREAS_STALE_CALLBACKS.extend(cache["callbacks"])
+	MESHES_AREAS_CACHE.clear()
+	removeCallbacks(MESHES_AREAS_STALE_CALLBACKS)
+	del MESHES_AREAS_STALE_CALLBACKS[:]
+	return True
+
+def meshAreas_OnDirty(node, hashCode):
+	"""
+	This definition is triggered when a mesh with cached areas becomes dirty.
+
+	:param node: Mesh shape dependency node. ( MObject )
+	:param hashCode: Mesh shape handle hash code. ( Integer )
+	"""
+
+	if hashCode in MESHES_AREAS_CACHE:
+		MESHES_AREAS_CACHE[hashCode]["datas"].clear()
+
+def meshAreas_OnRemoval(node, hashCode):
+	"""
+	This definition is triggered when a mesh with cached areas is about to be removed.
+
+	The mesh callbacks cannot be removed while one of them executes, they are removed on next areas query.
+
+	:param node: Mesh shape dependency node. ( MObject )
+	:param hashCode: Mesh shape handle hash code. ( Integer )
+	"""
+
+	cache = MESHES_AREAS_CACHE.pop(hashCode, None)
+	if cache is not None:
+		MESHES_AREAS_STALE_CALLBACKS.extend(cache["callbacks"])
+
+def meshesAreasCache_OnSceneChanged(clientData=None):
+	"""
+	This definition is triggered before a new scene is created or opened.
+
+	:param clientData: Client data. ( Object )
+	"""
+
+	clearMeshesAreasCache()
+
+def getMeshCache(object):
+	"""
+	This definition returns given object mesh cached datas.
+
+	The datas dictionary is emptied when the mesh becomes dirty, the cache entry and its callbacks are released
+	when the mesh is removed and before a new scene is created or opened.
+
+	:param object: Object. ( String )
+	:return: Mesh cached datas. ( Dictionary )
+	"""
+
+	if not MESHES_AREAS_CACHE_CALLBACKS:
+		for message in (OpenMaya.MSceneMessage.kBeforeNew, OpenMaya.MSceneMessage.kBeforeOpen):
+			MESHES_AREAS_CACHE_CALLBACKS.append(OpenMaya.MSceneMessage.addCallback(message,
+																				meshesAreasCache_OnSceneChanged))
+	if MESHES_AREAS_STALE_CALLBACKS:
+		removeCallbacks(MESHES_AREAS_STALE_CALLBACKS)
+		del MESHES_AREAS_STALE_CALLBACKS[:]
+
+	meshObject = getMeshObject(object)
+	handle = OpenMaya.MObjectHandle(meshObject)
+	hashCode = handle.hashCode()
+	cache = MESHES_AREAS_CACHE.get(hashCode)
+	if cache is not None and not (cache["handle"].isValid() and cache["handle"].object() == meshObject):
+		removeCallbacks(cache["callbacks"])
+		cache = None
+	if cache is None:
+		cache = MESHES_AREAS_CACHE[hashCode] = {"handle" : handle,
+												"callbacks" : (OpenMaya.MNodeMessage.addNodeDirtyCallback(meshObject,
+																									meshAreas_OnDirty,
+																									hashCode),
+															OpenMaya.MNodeMessage.addNodePreRemovalCallback(meshObject,
+																									meshAreas_OnRemoval,
+																									hashCode)),
+												"datas" : {}}
+	return cache["datas"]
+
+def getObjectFacesAreas(object, datas=None):
+	"""
+	This definition returns given object faces UVs and world areas.
+
+	The faces UVs areas and the object space triangles are computed from the bulk queried UVs, points and faces
+	arrays and cached until the mesh becomes dirty. The faces world areas are cached along the world matrix they were
+	computed with: a shape is not reliably dirtied when one of its ancestors moves, the matrix is compared on each
+	call instead.
+
+	:param object: Object. ( String )
+	:param datas: Object mesh cached datas. ( Dictionary )
+	:return: Faces UVs areas, faces world areas. ( Tuple )
+	"""
+
+	if datas is None:
+		datas = getMeshCache(object)
+
+	if datas.get("facesUVsAreas") is None:
+		uvCounts, uvIds = getFacesUVsIndices(object)
+		datas["facesUVsAreas"] = getFacesUVsAreas(getMeshUVs(object), uvCounts, uvIds)
+		datas["areas"] = None
+	if datas.get("triangles") is None:
+		vertexCounts, vertices = getFacesVerticesIndices(object)
+		datas["facesCount"] = len(vertexCounts)
+		datas["triangles"] = getFacesTriangles(getMeshPoints(object, OpenMaya.MSpace.kObject), vertexCounts, vertices)
+		datas["matrix"] = None
+
+	matrix = getMeshWorldMatrix(object)
+	if datas["matrix"] != matrix:
+		datas["facesWorldAreas"] = getFacesAreasFromTriangles(datas["triangles"], datas["facesCount"], matrix)
+		datas["matrix"] = matrix
+		datas["areas"] = None
+	return datas["facesUVsAreas"], datas["facesWorldAreas"]
+
+def getObjectAreas(object):
+	"""
+	This definition returns given object UVs and world areas.
+
+	:param object: Object. ( String )
+	:return: UVs area, world area. ( Tuple )
+	"""
+
+	datas = getMeshCache(object)
+	uvsAreas, worldAreas = getObjectFacesAreas(object, datas)
+	if datas.get("areas") is None:
+		if numpy is None:
+			datas["areas"] = (sum(uvsAreas), sum(worldAreas))
+		else:
+			datas["areas"] = (float(uvsAreas.sum()), float(worldAreas.sum()))
+	return datas["areas"]
+
+def getObjectsAreas(objects):
+	"""
+	This definition returns given objects UVs and world areas.
+
+	:param objects: Objects. ( Tuple / List / String )
+	:return: UVs and world areas per object. ( Dictionary )
+	"""
+
+	if isinstance(objects, basestring):
+		objects = [objects]
+
+	return dict((object, getObjectAreas(object)) for object in objects)
+
+def getObjectUVsArea(object):
+	"""
+	This definition returns given object UVs area, given objects total UVs area if a list is given.
+
+	:param object: Object to retrieve UVs area. ( String / Tuple / List )
+	:return: UVs area. ( Float )
+	"""
+
+	return sum(uvsArea for uvsArea, worldArea in getObjectsAreas(object).itervalues())
+
+def getObjectWorldArea(object):
+	"""
+	This definition returns given object world area, given objects total world area if a list is given.
+
+	:param object: Object to retrieve world area. ( String / Tuple / List )
+	:return: World area. ( Float )
+	"""
+
+	return sum(worldArea for uvsArea, worldArea in getObjectsAreas(object).itervalues())
+
+def getUVDimsFromUVs(uvs):
+	"""
+	This definition returns given UVs UVDims.
+
+	The UVs coordinates are floored like in the UVs tools so that a negative UV belongs to a negative UVDim.
+
+	:param uvs: UVs. ( Array / List )
+	:return: UVDims. ( Array / List )
+	"""
+
+	if numpy is None:
+		return [(int(math.floor(u)), int(math.floor(v))) for u, v in uvs]
+
+	return numpy.floor(numpy.asarray(uvs, dtype=numpy.float64)).astype(numpy.int64)
 
 def getComponentUVDims(component):
 	"""
@@ -234,14 +1098,16 @@ def getComponentUVDims(component):
 	"""
 
 	u, v = cmds.polyEditUV(component, q=True, uValue=True, vValue=True)
-	return int(u), int(v)
+	return int(math.floor(u)), int(math.floor(v))
 
 def getMariPatchFromUVDims(uvDims):
 	"""
 	This definition returns the Mari patch of the given component from UVDims.
 
+	The UVDims can also be given as two NumPy arrays, the Mari patches are then returned as an array.
+
 	:param uvDims: UVDims to convert to Mari Patch. ( Tuple )
-	:return: Mari patch. ( Integer )
+	:return: Mari patch. ( Integer / Array )
 	"""
 
 	uDim, vDim = uvDims
@@ -251,15 +1117,23 @@ def getComponentsUVDims(components):
 	"""
 	This definition returns given components UVDims.
 
+	The UVs are fetched with one bulk query per object and the UVs names are generated from their indices.
+
 	:param components: Components. ( Tuple / List )
 	:return: Components UVDims. ( List )
 	"""
 
-	uvs = getUVsFromComponents(components)
 	uvDims = []
-	for uv in uvs:
-		uDim, vDim = getComponentUVDims(uv)
-		uvDims.append((uv, (uDim, vDim)))
+	for object, indices in getComponentsUVsIndices(components).iteritems():
+		uvs = getMeshUVs(object)
+		if numpy is None:
+			indices = [index for index in indices if index < len(uvs)]
+			objectUVDims = getUVDimsFromUVs([uvs[index] for index in indices])
+		else:
+			indices = indices[indices < len(uvs)]
+			objectUVDims = [tuple(uvDim) for uvDim in getUVDimsFromUVs(uvs[indices]).tolist()]
+			indices = indices.tolist()
+		uvDims.extend(("%s.map[%s]" % (object, index), uvDim) for index, uvDim in zip(indices, objectUVDims))
 	return uvDims
 
 def getComponentsMariPatches(components):
@@ -284,8 +1158,16 @@ def getComponentsOccupationAsUVDims(components):
 	:return: Components occupation. ( Tuple )
 	"""
 
-	shells = getComponentsUVDims(components)
-	return tuple(set((shell[1] for shell in shells)))
+	uvDims = set()
+	for uvs in getComponentsUVs(components).itervalues():
+		if not len(uvs):
+			continue
+
+		if numpy is None:
+			uvDims.update(getUVDimsFromUVs(uvs))
+		else:
+			uvDims.update(tuple(uvDim) for uvDim in numpy.unique(getUVDimsFromUVs(uvs), axis=0).tolist())
+	return tuple(uvDims)
 
 def getComponentsOccupationAsMariPatches(components):
 	"""
@@ -295,8 +1177,7 @@ def getComponentsOccupationAsMariPatches(components):
 	:return: Components occupation. ( Tuple )
 	"""
 
-	mariPatches = getComponentsMariPatches(components)
-	return tuple(set((patch[1] for patch in mariPatches)))
+	return tuple(set(getMariPatchFromUVDims(uvDims) for uvDims in getComponentsOccupationAsUVDims(components)))
 
 def printComponentsOccupationAsUvDims():
 	"""
@@ -336,14 +1217,18 @@ def getComponentsBoundingBox(components):
 	:return: Components Bounding Box. ( Tuple )
 	"""
 
-	uvs = getUVsFromComponents(components)
 	uMin, vMin, uMax, vMax = 2 ** 8, 2 ** 8, -2 ** 8, -2 ** 8
-	for uv in uvs:
-		u, v = cmds.polyEditUV(uv, q=True, uValue=True, vValue=True)
-		uMin = min(u, uMin)
-		uMax = max(u, uMax)
-		vMin = min(v, vMin)
-		vMax = max(v, vMax)
+	for uvs in getComponentsUVs(components).itervalues():
+		if not len(uvs):
+			continue
+
+		if numpy is None:
+			us, vs = zip(*uvs)
+			uMin, vMin, uMax, vMax = min(min(us), uMin), min(min(vs), vMin), max(max(us), uMax), max(max(vs), vMax)
+		else:
+			minimum, maximum = uvs.min(axis=0), uvs.max(axis=0)
+			uMin, vMin = min(float(minimum[0]), uMin), min(float(minimum[1]), vMin)
+			uMax, vMax = max(float(maximum[0]), uMax), max(float(maximum[1]), vMax)
 	return uMin, vMin, uMax, vMax
 
 def getComponentsUVsCenter(components):
@@ -363,7 +1248,7 @@ def printComponentsUvsCenterAsUvDims():
 	"""
 
 	selection = cmds.ls(sl=True, l=True)
-	selection and pprint.pprint(tuple([int(value) for value in getComponentsUVsCenter(selection)]))
+	selection and pprint.pprint(tuple([int(math.floor(value)) for value in getComponentsUVsCenter(selection)]))
 
 def IPrintComponentsUvsCenterAsUvDims():
 	"""
@@ -378,7 +1263,7 @@ def printComponentsUvsCenterAsMariPatch():
 	"""
 
 	selection = cmds.ls(sl=True, l=True)
-	selection and pprint.pprint(getMariPatchFromUVDims((int(value) for value in getComponentsUVsCenter(selection))))
+	selection and pprint.pprint(getMariPatchFromUVDims([int(math.floor(value)) for value in getComponentsUVsCenter(selection)]))
 
 def IPrintComponentsUvsCenterAsMariPatch():
 	"""
@@ -402,7 +1287,7 @@ def scaleComponentsUVs(components, su=1, sv=1):
 		su = 1e-15
 	if sv == 0.0:
 		sv = 1e-15
-	uvs = getUVsFromComponents(components)
+	uvs = getUVsFromComponents(components, flatten=False)
 	uCenter, vCenter = getComponentsUVsCenter(uvs)
 	cmds.polyEditUV(uvs, pu=uCenter, pv=vCenter, su=su, sv=sv)
 	return True
@@ -416,7 +1301,7 @@ def centerComponentsUVs(components):
 	:return: Definition succes. ( Boolean )
 	"""
 
-	uvs = getUVsFromComponents(components)
+	uvs = getUVsFromComponents(components, flatten=False)
 	uMin, vMin, uMax, vMax = getComponentsBoundingBox(uvs)
 	uCenter, vCenter = (uMin + uMax) / 2.0, (vMin + vMax) / 2.0
 	uTargetCenter, vTargetCenter = math.floor(uCenter), math.floor(vCenter)
@@ -424,15 +1309,37 @@ def centerComponentsUVs(components):
 	return True
 
 @stacksHandler
-def scaleCenterComponentsUVs(components, coverage=DEFAULT_SCALE_COVERAGE):
+def scaleCenterComponentsUVs(components, coverage=DEFAULT_SCALE_COVERAGE, shells=False):
 	"""
 	This definition scales / centers given components UVs.
 
 	:param components: Components. ( Tuple / List )
+	:param coverage: Patch coverage. ( Float )
+	:param shells: Scales / centers each touched UVs shell in its own patch. ( Boolean )
 	:return: Definition succes. ( Boolean )
 	"""
 
-	uvs = getUVsFromComponents(components)
+	if shells:
+		for object, (statistics, touchedShells) in getComponentsUVsShells(components).iteritems():
+			if numpy is None:
+				pivots, scales, offsets = [], [], []
+				for shell in touchedShells:
+					uMin, vMin, uMax, vMax = statistics["boundingBoxes"][shell]
+					uCenter, vCenter = statistics["centers"][shell]
+					scaleFactor = 1 / max(math.fabs(uMin - uMax), math.fabs(vMin - vMax), 1e-15) * coverage
+					pivots.append((uCenter, vCenter))
+					scales.append((scaleFactor, scaleFactor))
+					offsets.append((math.floor(uCenter) + 0.5 - uCenter, math.floor(vCenter) + 0.5 - vCenter))
+			else:
+				boundingBoxes = statistics["boundingBoxes"][touchedShells]
+				pivots = statistics["centers"][touchedShells]
+				scaleFactors = 1 / numpy.maximum((boundingBoxes[:, 2:] - boundingBoxes[:, :2]).max(axis=1), 1e-15) * coverage
+				scales = numpy.column_stack((scaleFactors, scaleFactors))
+				offsets = numpy.floor(pivots) + 0.5 - pivots
+			transformUVsShells(object, statistics, touchedShells, pivots, scales, offsets, True)
+		return True
+
+	uvs = getUVsFromComponents(components, flatten=False)
 	uMin, vMin, uMax, vMax = getComponentsBoundingBox(uvs)
 	uCenter, vCenter = (uMin + uMax) / 2.0, (vMin + vMax) / 2.0
 	uTargetCenter, vTargetCenter = math.floor(uCenter), math.floor(vCenter)
@@ -454,7 +1361,7 @@ def rotateComponentsUVs(components, value, clockWise=True):
 	:return: Definition succes. ( Boolean )
 	"""
 
-	uvs = getUVsFromComponents(components)
+	uvs = getUVsFromComponents(components, flatten=False)
 	uCenter, vCenter = getComponentsUVsCenter(uvs)
 	if not clockWise:
 		value = -value
@@ -495,16 +1402,34 @@ def moveComponentsUVs(components, u=0, v=0):
 	return True
 
 @stacksHandler
-def mirrorComponentsUVs(components, horizontal=True):
+def mirrorComponentsUVs(components, horizontal=True, shells=False):
 	"""
 	This definition mirrors given components UVs.
 
 	:param components: Components. ( Tuple / List )
 	:param horizontal: Horizontal mirror. ( Boolean )
+	:param shells: Mirrors each touched UVs shell in its own patch. ( Boolean )
 	:return: Definition succes. ( Boolean )
 	"""
 
-	uvs = getUVsFromComponents(components)
+	if shells:
+		scale = horizontal and (-1., 1.) or (1., -1.)
+		for object, (statistics, touchedShells) in getComponentsUVsShells(components).iteritems():
+			if numpy is None:
+				pivots = [(math.floor(statistics["centers"][shell][0]) + 0.5, math.floor(statistics["centers"][shell][1]) + 0.5)
+						for shell in touchedShells]
+			else:
+				pivots = numpy.floor(statistics["centers"][touchedShells]) + 0.5
+			transformUVsShells(object,
+							statistics,
+							touchedShells,
+							pivots,
+							[scale] * len(pivots),
+							[(0., 0.)] * len(pivots),
+							True)
+		return True
+
+	uvs = getUVsFromComponents(components, flatten=False)
 	uCenter, vCenter = (math.floor(value) for value in getComponentsUVsCenter(uvs))
 	if horizontal:
 		cmds.polyEditUV(uvs, pu=uCenter + 0.5, pv=vCenter + 0.5, su= -1)
@@ -513,28 +1438,58 @@ def mirrorComponentsUVs(components, horizontal=True):
 	return True
 
 
+def getObjectsUVsShells(objects):
+	"""
+	This definition returns given objects UVs shells as stackable items.
+
+	:param objects: Objects. ( Tuple / List )
+	:return: Objects UVs shells as ( object, statistics, shell, boundingBox ) tuples. ( List )
+	"""
+
+	shells = []
+	for object in objects:
+		object = getNode(object)
+		statistics = getUVsShellsStatistics(object)
+		for shell, boundingBox in enumerate(statistics["boundingBoxes"]):
+			shells.append((object, statistics, shell, tuple(float(value) for value in boundingBox)))
+	return shells
+
 @stacksHandler
-def stackObjectsUVs(objects, alignement="center", horizontal=True, margin=0):
+def stackObjectsUVs(objects, alignement="center", horizontal=True, margin=0, shells=False):
 	"""
 	This definition stacks given objects UVs.
 
 	:param objects: Objects. ( Tuple / List )
 	:param alignement: Alignement ( "bottom", "top", "left", "right", "center" ). ( String )
 	:param horizontal: Horizontal stack. ( Boolean )
+	:param shells: Stacks the objects UVs shells instead of the objects. ( Boolean )
 	:return: Definition succes. ( Boolean )
 	"""
 
 	if not objects:
 		return
 
-	uvs = getUVsFromComponents(objects.pop(0))
-	uCenter, vCenter = getComponentsUVsCenter(uvs)
-	uMin, vMin, uMax, vMax = getComponentsBoundingBox(uvs)
+	if shells:
+		items = getObjectsUVsShells(objects)
+		if not items:
+			return
+	else:
+		items = [(getUVsFromComponents(object, flatten=False),) for object in objects]
+
+	item = items.pop(0)
+	if shells:
+		uMin, vMin, uMax, vMax = item[-1]
+	else:
+		uMin, vMin, uMax, vMax = getComponentsBoundingBox(item[0])
 	uBorder = uMax - uMin + uMin
 	vBorder = vMax - vMin + vMin
-	for object in objects:
-		uvs = getUVsFromComponents(object)
-		currentUMin, currentVMin, currentUMax, currentVMax = getComponentsBoundingBox(uvs)
+	transforms = {}
+	for item in items:
+		uvs = item[0]
+		if shells:
+			currentUMin, currentVMin, currentUMax, currentVMax = item[-1]
+		else:
+			currentUMin, currentVMin, currentUMax, currentVMax = getComponentsBoundingBox(uvs)
 		if horizontal:
 			offsetU = uBorder - currentUMin + margin
 			if alignement == "bottom":
@@ -553,7 +1508,19 @@ def stackObjectsUVs(objects, alignement="center", horizontal=True, margin=0):
 			elif alignement == "right":
 				offsetU = uMax - currentUMax
 			vBorder = vBorder + currentVMax - currentVMin + margin
-		cmds.polyEditUV(uvs, u=offsetU, v=offsetV)
+		if shells:
+			transforms.setdefault(uvs, (item[1], []))[1].append((item[2], (offsetU, offsetV)))
+		else:
+			cmds.polyEditUV(uvs, u=offsetU, v=offsetV)
+
+	for object, (statistics, offsets) in transforms.iteritems():
+		transformUVsShells(object,
+						statistics,
+						[shell for shell, offset in offsets],
+						[(0., 0.)] * len(offsets),
+						[(1., 1.)] * len(offsets),
+						[offset for shell, offset in offsets],
+						True)
 	return True
 
 @stacksHandler
@@ -565,7 +1532,7 @@ def prescaleUVsShells(object):
 	:return: Definition succes. ( Boolean )
 	"""
 
-	uvs = getUVsFromComponents(object)
+	uvs = getUVsFromComponents(object, flatten=False)
 	uMin, vMin, uMax, vMax = getComponentsBoundingBox(uvs)
 	uCenter, vCenter = (uMin + uMax) / 2.0, (vMin + vMax) / 2.0
 	width, height = uMax - uMin, vMax - vMin
@@ -595,17 +1562,226 @@ def autoRatioUVsAreas(objects):
 
 	if not objects:
 		return
+	areas = getObjectsAreas(objects)
 	baseObject = objects.pop(0)
-	area = cmds.polyEvaluate(baseObject, worldArea=True)
-	uvsArea = getObjectUVsArea(baseObject)
+	uvsArea, area = areas[baseObject]
 
 	for object in objects:
-		currentArea = cmds.polyEvaluate(object, worldArea=True)
-		currentUVsArea = getObjectUVsArea(object)
+		currentUVsArea, currentArea = areas[object]
 		scaleFactor = math.sqrt(((currentArea * uvsArea) / currentUVsArea) / area)
 		scaleComponentsUVs(object, su=scaleFactor, sv=scaleFactor)
 	return True
 
+def getTexelDensity(uvsArea, worldArea, resolution=DEFAULT_TEXTURE_RESOLUTION):
+	"""
+	This definition returns the texel density from given UVs and world areas.
+
+	The texel density is the texture pixels count per world unit for given texture resolution.
+
+	:param uvsArea: UVs area. ( Float )
+	:param worldArea: World area. ( Float )
+	:param resolution: Texture resolution. ( Integer )
+	:return: Texel density. ( Float )
+	"""
+
+	if uvsArea <= 0 or worldArea <= 0:
+		return 0.
+
+	return math.sqrt(uvsArea / worldArea) * resolution
+
+def getObjectsTexelDensities(objects, resolution=DEFAULT_TEXTURE_RESOLUTION):
+	"""
+	This definition returns given objects texel densities from their cached areas.
+
+	:param objects: Objects. ( Tuple / List / String )
+	:param resolution: Texture resolution. ( Integer )
+	:return: Texel density per object. ( Dictionary )
+	"""
+
+	return dict((object, getTexelDensity(uvsArea, worldArea, resolution))
+				for object, (uvsArea, worldArea) in getObjectsAreas(objects).iteritems())
+
+def getUVsShellsTexelDensities(object, resolution=DEFAULT_TEXTURE_RESOLUTION):
+	"""
+	This definition returns given object UVs shells texel densities.
+
+	:param object: Object. ( String )
+	:param resolution: Texture resolution. ( Integer )
+	:return: UVs shells statistics, shells texel densities. ( Tuple )
+	"""
+
+	statistics = getUVsShellsStatistics(object, worldAreas=True)
+	if numpy is None:
+		densities = [getTexelDensity(uvsArea, worldArea, resolution)
+					for uvsArea, worldArea in zip(statistics["areas"], statistics["worldAreas"])]
+	else:
+		uvsAreas, worldAreas = statistics["areas"], statistics["worldAreas"]
+		densities = numpy.zeros(len(uvsAreas), dtype=numpy.float64)
+		valid = (uvsAreas > 0) & (worldAreas > 0)
+		densities[valid] = numpy.sqrt(uvsAreas[valid] / worldAreas[valid]) * resolution
+	return statistics, densities
+
+def getObjectsMeanTexelDensity(objects, resolution=DEFAULT_TEXTURE_RESOLUTION):
+	"""
+	This definition returns given objects world area weighted texel density.
+
+	:param objects: Objects. ( Tuple / List / String )
+	:param resolution: Texture resolution. ( Integer )
+	:return: Texel density. ( Float )
+	"""
+
+	areas = getObjectsAreas(objects).values()
+	return getTexelDensity(sum(uvsArea for uvsArea, worldArea in areas),
+						sum(worldArea for uvsArea, worldArea in areas),
+						resolution)
+
+def getTexelDensityOutliers(objects,
+							density=None,
+							resolution=DEFAULT_TEXTURE_RESOLUTION,
+							tolerance=DEFAULT_TEXEL_DENSITY_TOLERANCE,
+							shells=True):
+	"""
+	This definition returns given objects texel density outliers.
+
+	An outlier is an object or an UVs shell whose texel density deviates from the reference density more than
+	given relative tolerance, outliers are sorted from the worst one.
+
+	:param objects: Objects. ( Tuple / List / String )
+	:param density: Reference texel density, objects mean texel density if not provided. ( Float )
+	:param resolution: Texture resolution. ( Integer )
+	:param tolerance: Relative tolerance. ( Float )
+	:param shells: Checks the UVs shells instead of the objects. ( Boolean )
+	:return: Reference density, outliers as ( object, shell, density, ratio ) tuples. ( Tuple )
+	"""
+
+	if isinstance(objects, basestring):
+		objects = [objects]
+
+	if density is None:
+		density = getObjectsMeanTexelDensity(objects, resolution)
+	if not density:
+		return density, []
+
+	outliers = []
+	for object in objects:
+		if not shells:
+			objectDensity = getObjectsTexelDensities(object, resolution)[object]
+			if math.fabs(objectDensity / density - 1) > tolerance:
+				outliers.append((object, None, objectDensity, objectDensity / density))
+			continue
+
+		statistics, densities = getUVsShellsTexelDensities(object, resolution)
+		if numpy is None:
+			outliers.extend((object, shell, shellDensity, shellDensity / density)
+							for shell, shellDensity in enumerate(densities)
+							if math.fabs(shellDensity / density - 1) > tolerance)
+		else:
+			ratios = densities / density
+			indices = numpy.nonzero(numpy.fabs(ratios - 1) > tolerance)[0]
+			outliers.extend(zip([object] * len(indices), indices.tolist(), densities[indices].tolist(), ratios[indices].tolist()))
+	return density, sorted(outliers, key=lambda outlier: -math.fabs(math.log(max(outlier[3], 1e-15))))
+
+def printTexelDensityOutliers(resolution=DEFAULT_TEXTURE_RESOLUTION, tolerance=DEFAULT_TEXEL_DENSITY_TOLERANCE):
+	"""
+	This definition prints selected objects UVs shells texel density outliers.
+
+	:param resolution: Texture resolution. ( Integer )
+	:param tolerance: Relative tolerance. ( Float )
+	"""
+
+	selection = cmds.ls(sl=True, l=True)
+	if not selection:
+		return
+
+	meshes = cmds.listRelatives(selection, allDescendents=True, fullPath=True, type="mesh")
+	if not meshes:
+		return
+
+	density, outliers = getTexelDensityOutliers(meshes, resolution=resolution, tolerance=tolerance)
+	print("%s | Reference texel density: '%.3f' pixels per unit, '%s' outliers UVs shells!" % (__name__, density, len(outliers)))
+	for object, shell, shellDensity, ratio in outliers:
+		print("%s | '%s' object, '%s' UVs shell: '%.3f' pixels per unit, '%.3f' ratio." % (__name__, object, shell, shellDensity, ratio))
+
+def IPrintTexelDensityOutliers():
+	"""
+	This definition is the printTexelDensityOutliers definition Interface.
+	"""
+
+	printTexelDensityOutliers()
+
+@stacksHandler
+def normalizeTexelDensity(objects, density=None, resolution=DEFAULT_TEXTURE_RESOLUTION, shells=True, undoable=True):
+	"""
+	This definition rescales given objects UVs to given texel density.
+
+	The UVs are rescaled with one undoable **cmds.polyTweakUV** command per object. When undoable is False,
+	the UVs are written with one bulk write per object through the API and cannot be undone.
+
+	:param objects: Objects. ( Tuple / List / String )
+	:param density: Target texel density, objects mean texel density if not provided. ( Float )
+	:param resolution: Texture resolution. ( Integer )
+	:param shells: Rescales each UVs shell around its center instead of each object UVs around their center. ( Boolean )
+	:param undoable: Rescales the UVs with undoable commands. ( Boolean )
+	:return: Definition succes. ( Boolean )
+	"""
+
+	if isinstance(objects, basestring):
+		objects = [objects]
+
+	startTime = time.time()
+	if density is None:
+		density = getObjectsMeanTexelDensity(objects, resolution)
+	if not density:
+		return
+
+	shellsCount = 0
+	for object in objects:
+		if shells:
+			statistics, densities = getUVsShellsTexelDensities(object, resolution)
+			if numpy is None:
+				indices = [shell for shell, shellDensity in enumerate(densities) if shellDensity]
+				scales = [(density / densities[shell], density / densities[shell]) for shell in indices]
+				pivots = [statistics["centers"][shell] for shell in indices]
+			else:
+				indices = numpy.nonzero(densities)[0]
+				scales = numpy.repeat((density / densities[indices])[:, numpy.newaxis], 2, axis=1)
+				pivots = statistics["centers"][indices]
+		else:
+			objectDensity = getObjectsTexelDensities(object, resolution)[object]
+			if not objectDensity:
+				continue
+
+			statistics = getUVsShellsStatistics(object)
+			indices = range(len(statistics["areas"]))
+			uMin, vMin, uMax, vMax = getComponentsBoundingBox(object)
+			scales = [(density / objectDensity, density / objectDensity)] * len(indices)
+			pivots = [((uMin + uMax) / 2., (vMin + vMax) / 2.)] * len(indices)
+		transformUVsShells(object, statistics, indices, pivots, scales, [(0., 0.)] * len(indices), undoable)
+		shellsCount += len(indices)
+
+	print("%s | Normalized '%s' UVs shells to '%.3f' pixels per unit texel density in '%.3f' seconds!" % (__name__, shellsCount, density, time.time() - startTime))
+	return True
+
+@stacksHandler
+def INormalizeTexelDensity():
+	"""
+	This definition is the normalizeTexelDensity definition Interface.
+	"""
+
+	selection = cmds.ls(sl=True, l=True)
+	if not selection:
+		return
+
+	meshes = cmds.listRelatives(selection, allDescendents=True, fullPath=True, type="mesh")
+	if not meshes:
+		return
+
+	density = getObjectsMeanTexelDensity(meshes)
+	result = cmds.promptDialog(title="Texel Density", message="Enter Pixels Per Unit:", text="%.3f" % density, button=["OK", "Cancel"], defaultButton="OK", cancelButton="Cancel", dismissString="Cancel")
+	if result == "OK":
+		density = cmds.promptDialog(query=True, text=True)
+		density and normalizeTexelDensity(meshes, float(density))
+
 @stacksHandler
 def addUVsChecker(items, uRepeats=4, vRepeats=4):
 	"""
@@ -689,18 +1865,32 @@ def setUVsCheckerRepeats(uRepeats=None, vRepeats=None):
 	vRepeats and cmds.setAttr("UVsChecker_Place2dTexture.repeatV", vRepeats)
 	return True
 
+def getShadingEngines():
+	"""
+	This definition returns the scene shading engines lookup table.
+
+	:return: Shading engines full names per short names. ( Dictionary )
+	"""
+
+	return dict((shadingEngine.split("|")[-1], shadingEngine) for shadingEngine in cmds.ls(type="shadingEngine", l=True) or [])
+
 @stacksHandler
-def getPatchShaderTree(patch, prefix):
+def getPatchShaderTree(patch, prefix, shadingEngines=None):
 	"""
 	This definition builds the patch shader tree of given patch.
 
 	:param patch: Patch. ( Integer )
 	:param prefix: Name prefix. ( String )
+	:param shadingEngines: Shading engines lookup table from :func:`getShadingEngines`, updated with the created shading engine. ( Dictionary )
 	:return: Tree shading engine. ( String )
 	"""
 
 	name = "%s%s" % (prefix, patch)
-	shadingEngine = getNode("%sSG" % name)
+	if shadingEngines is None:
+		shadingEngine = getNode("%sSG" % name)
+	else:
+		shadingEngine = shadingEngines.get("%sSG" % name)
+
 	if not shadingEngine:
 		lambert = cmds.shadingNode("lambert", asShader=True)
 		shadingEngine = cmds.sets(renderable=True, noSurfaceShader=True, empty=True)
@@ -708,8 +1898,25 @@ def getPatchShaderTree(patch, prefix):
 
 		cmds.rename(lambert, name)
 		shadingEngine = cmds.rename(shadingEngine, "%sSG" % name)
+		if shadingEngines is not None:
+			shadingEngines["%sSG" % name] = shadingEngine
 	return shadingEngine
 
+def getObjectPatchesMembers(object):
+	"""
+	This definition returns the members to assign to each patch shading engine for given object:
+	the object itself if its faces occupy one patch, its faces ranges otherwise.
+
+	:param object: Object. ( String )
+	:return: Members per patches. ( Dictionary )
+	"""
+
+	facesPerPatches = getFacesPerPatches(object)
+	if len(facesPerPatches) == 1:
+		patch, faces = facesPerPatches.popitem()
+		return {patch : [object]}
+	return facesPerPatches
+
 @stacksHandler
 def assignMariShadersToObject(object, prefix):
 	"""
@@ -720,15 +1927,9 @@ def assignMariShadersToObject(object, prefix):
 	:return: Definition success. ( Boolean )
 	"""
 
-	patches = getComponentsOccupationAsMariPatches(object)
-	if len(patches) == 1:
-		patch = patches[0]
-		shadingEngine = getPatchShaderTree(patch, prefix)
-		cmds.sets(object, e=True, forceElement=shadingEngine)
-	else:
-		for patch, faces in getFacesPerPatches(object).items():
-			shadingEngine = getPatchShaderTree(patch, prefix)
-			cmds.sets(faces, e=True, forceElement=shadingEngine)
+	shadingEngines = getShadingEngines()
+	for patch, members in getObjectPatchesMembers(object).iteritems():
+		cmds.sets(members, e=True, forceElement=getPatchShaderTree(patch, prefix, shadingEngines))
 	return True
 
 @stacksHandler
@@ -736,25 +1937,40 @@ def assignMariShaders(objects, prefix):
 	"""
 	This definition assigns the Mari shaders to given objects.
 
+	The patches occupancy of every object is computed first, each needed shading engine is then created once
+	and all its members from all the objects are assigned with one **cmds.sets** call.
+
 	:param objects: Objects. ( List )
 	:param prefix: Shader prefix name. ( String )
 	:return: Definition success. ( Boolean )
 	"""
 
+	startTime = time.time()
+
 	mainProgressBar = mel.eval('$tmp = $gMainProgressBar')
 	cmds.progressBar(mainProgressBar, edit=True, beginProgress=True, isInterruptable=True, status="Assigning Mari shaders ...", maxValue=len(objects))
 
-	success = True
+	membersPerPatches = {}
+	facesCount = 0
 	for object in objects:
 		if cmds.progressBar(mainProgressBar, query=True, isCancelled=True):
-					break
+			break
 
-		cmds.progressBar(mainProgressBar, edit=True, status="Assigning Mari shaders to '%s' ..." % object, step=1)
-		success *= assignMariShadersToObject(object, prefix)
+		cmds.progressBar(mainProgressBar, edit=True, status="Analysing '%s' patches ..." % object, step=1)
+		for patch, members in getObjectPatchesMembers(object).iteritems():
+			membersPerPatches.setdefault(patch, []).extend(members)
+		facesCount += cmds.polyEvaluate(object, face=True)
+
+	cmds.progressBar(mainProgressBar, edit=True, status="Assigning Mari shaders ...")
+	shadingEngines = getShadingEngines()
+	for patch, members in sorted(membersPerPatches.iteritems()):
+		cmds.sets(members, e=True, forceElement=getPatchShaderTree(patch, prefix, shadingEngines))
 
 	cmds.progressBar(mainProgressBar, edit=True, endProgress=True)
 
-	return success
+	duration = time.time() - startTime
+	print("%s | Assigned '%s' Mari shaders to '%s' faces in '%.3f' seconds: '%d' faces per second!" % (__name__, len(membersPerPatches), facesCount, duration, facesCount / max(duration, 1e-6)))
+	return True
 
 @stacksHandler
 def IAssignMariShaders():
@@ -23,18 +23,20 @@
 #**********************************************************************************************************************
 #***	External imports.
 #**********************************************************************************************************************
-import inspect
 import logging
 import maya.cmds as cmds
 import maya.mel as mel
 import os
 import platform
 import re
+import time
 from PyQt4 import uic
 from PyQt4.QtCore import QProcess
 from PyQt4.QtCore import Qt
 from PyQt4.QtGui import QAction
+from PyQt4.QtGui import QFileDialog
 from PyQt4.QtGui import QPixmap
+from PyQt4.QtGui import QStringListModel
 
 #**********************************************************************************************************************
 #***	Internal imports.
@@ -42,13 +44,17 @@ from PyQt4.QtGui import QPixmap
 import foundations.core as core
 import foundations.exceptions
 import foundations.strings as strings
+import snippets.tracer as tracer
 import snippets.ui.common
 from foundations.environment import Environment
 from snippets.globals.constants import Constants
 from snippets.globals.runtimeGlobals import RuntimeGlobals
 from snippets.globals.uiConstants import UiConstants
+from snippets.managers.profilesManager import profile
+from snippets.managers.timingsManager import timing
 from snippets.ui.models import Interface
 from snippets.ui.models import InterfacesModel
+from snippets.ui.models import InterfacesProxyModel
 from snippets.ui.views import Interfaces_QListView
 from snippets.ui.widgets.search_QLineEdit import Search_QLineEdit
 
@@ -68,7 +74,8 @@ LOGGER = logging.getLogger(Constants.logger)
 
 RuntimeGlobals.loaderUiFile = snippets.ui.common.getResourcePath(UiConstants.loaderUiFile)
 if foundations.common.pathExists(RuntimeGlobals.loaderUiFile):
-	Ui_Loader_Setup, Ui_Loader_Type = uic.loadUiType(RuntimeGlobals.loaderUiFile)
+	with timing("ui", UiConstants.loaderUiFile):
+		Ui_Loader_Setup, Ui_Loader_Type = uic.loadUiType(RuntimeGlobals.loaderUiFile)
 else:
 	error = "'{0}' Ui file is not available!".format(RuntimeGlobals.loaderUiFile)
 	snippets.ui.common.messageBox("Error", "Error", error)
@@ -83,12 +90,13 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 	"""
 
 	@core.executionTrace
-	def __init__(self, parent=None, modulesManager=RuntimeGlobals.modulesManager):
+	def __init__(self, parent=None, modulesManager=RuntimeGlobals.modulesManager, usageManager=RuntimeGlobals.usageManager):
 		"""
 		This method initializes the class.
 		
 		:param parent: Parent object. ( QObject )
 		:param modulesManager: Modules Manager. ( ModulesManager )
+		:param usageManager: Usage Manager. ( UsageManager )
 		"""
 
 		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -96,13 +104,16 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		Ui_Loader_Type.__init__(self, parent)
 		Ui_Loader_Setup.__init__(self)
 
-		self.setupUi(self)
+		with timing("ui", self.__class__.__name__):
+			self.setupUi(self)
 
 		# --- Setting class attributes. ---
 		self.__container = parent
 		self.__modulesManager = modulesManager
+		self.__usageManager = usageManager
 
 		self.__model = None
+		self.__proxyModel = None
 		self.__view = None
 
 		self.__defaultText = "<center><br/><br/><h4>* * *</h4>Select a Snippet to display related informations!<h4>* * *</h4></center>"
@@ -113,6 +124,8 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		# --- Initialize Ui. ---
 		self.__initializeUI()
 
+		RuntimeGlobals.timingsManager and RuntimeGlobals.timingsManager.logReport()
+
 	#******************************************************************************************************************
 	#***	Attributes properties.
 	#******************************************************************************************************************
@@ -176,6 +189,36 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 
 		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("modulesManager"))
 
+	@property
+	def usageManager(self):
+		"""
+		This method is the property for **self.__usageManager** attribute.
+
+		:return: self.__usageManager. ( UsageManager )
+		"""
+
+		return self.__usageManager
+
+	@usageManager.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def usageManager(self, value):
+		"""
+		This method is the setter method for **self.__usageManager** attribute.
+
+		:param value: Attribute value. ( UsageManager )
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is read only!".format("usageManager"))
+
+	@usageManager.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def usageManager(self):
+		"""
+		This method is the deleter method for **self.__usageManager** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("usageManager"))
+
 	@property
 	def model(self):
 		"""
@@ -208,6 +251,38 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		raise foundations.exceptions.ProgrammingError(
 		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "model"))
 
+	@property
+	def proxyModel(self):
+		"""
+		This method is the property for **self.__proxyModel** attribute.
+
+		:return: self.__proxyModel. ( InterfacesProxyModel )
+		"""
+
+		return self.__proxyModel
+
+	@proxyModel.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def proxyModel(self, value):
+		"""
+		This method is the setter method for **self.__proxyModel** attribute.
+
+		:param value: Attribute value. ( InterfacesProxyModel )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "proxyModel"))
+
+	@proxyModel.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def proxyModel(self):
+		"""
+		This method is the deleter method for **self.__proxyModel** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "proxyModel"))
+
 	@property
 	def view(self):
 		"""
@@ -345,11 +420,13 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		hasattr(self.Search_lineEdit, "setPlaceholderText") and \
 		self.Search_lineEdit.setPlaceholderText("Enter Interface Name...")
 		self.Search_horizontalLayout.addWidget(self.Search_lineEdit)
+		self.Search_lineEdit.completer.setCaseSensitivity(Qt.CaseInsensitive)
 
 		self.__model = InterfacesModel(self)
+		self.__proxyModel = InterfacesProxyModel(self, self.__model)
 
 		self.Interfaces_listView.setParent(None)
-		self.Interfaces_listView = Interfaces_QListView(self, self.__model)
+		self.Interfaces_listView = Interfaces_QListView(self, self.__proxyModel)
 		self.Interfaces_listView.setObjectName("Interfaces_listView")
 		self.Interfaces_frame_splitter.insertWidget(0, self.Interfaces_listView)
 		self.__view = self.Interfaces_listView
@@ -370,7 +447,9 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		self.Reload_Snippets_pushButton.clicked.connect(self.__Reload_Snippets_pushButton__clicked)
 		self.__view.selectionModel().selectionChanged.connect(self.__view_selectionModel__selectionChanged)
 		self.__view.doubleClicked.connect(self.__view__doubleClicked)
-		self.Search_lineEdit.textChanged.connect(self.__Search_lineEdit__textChanged)
+		self.Search_lineEdit.searchRequested.connect(self.__Search_lineEdit__searchRequested)
+		if RuntimeGlobals.modulesWatcher:
+			RuntimeGlobals.modulesWatcher.modulesReloaded.connect(self.__modulesWatcher__modulesReloaded)
 
 	@core.executionTrace
 	def __view_addActions(self):
@@ -386,6 +465,10 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		exploreSnippetFolderAction.triggered.connect(self.__view_exploreSnippetFolderAction)
 		self.__view.addAction(exploreSnippetFolderAction)
 
+		exportExecutionsProfilesAction = QAction("Export Executions Profiles ...", self.__view)
+		exportExecutionsProfilesAction.triggered.connect(self.__view_exportExecutionsProfilesAction)
+		self.__view.addAction(exportExecutionsProfilesAction)
+
 	@core.executionTrace
 	def __view_editSnippetAction(self, checked):
 		"""
@@ -398,8 +481,7 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		if not interface:
 			return
 
-		self.editFile(interface.module.import_.__file__.replace(
-		Constants.libraryCompiledExtension, Constants.libraryExtension))
+		self.editFile(interface.module.file)
 
 	@core.executionTrace
 	def __view_exploreSnippetFolderAction(self, checked):
@@ -413,7 +495,24 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		if not interface:
 			return
 
-		self.exploreDirectory(os.path.dirname(interface.module.import_.__file__))
+		self.exploreDirectory(interface.module.path)
+
+	@core.executionTrace
+	def __view_exportExecutionsProfilesAction(self, checked):
+		"""
+		This method is triggered by **exportExecutionsProfilesAction** action.
+
+		:param checked: Checked state. ( Boolean )
+		"""
+
+		if not RuntimeGlobals.profilesManager:
+			return
+
+		file = strings.encode(QFileDialog.getSaveFileName(self,
+														"Export Executions Profiles:",
+														RuntimeGlobals.userApplicationDatasDirectory,
+														"JSON Files (*.json)"))
+		file and RuntimeGlobals.profilesManager.exportProfiles(file)
 
 	@core.executionTrace
 	def __Execute_Snippet_pushButton__clicked(self, checked):
@@ -433,8 +532,19 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		:param checked: Checked state. ( Boolean )
 		"""
 
-		self.__modulesManager.reloadAll()
-		self.setInterfaces()
+		changes = self.__modulesManager.reloadAll()
+		if changes:
+			self.updateInterfaces(changes)
+
+	@core.executionTrace
+	def __modulesWatcher__modulesReloaded(self, changes):
+		"""
+		This method is triggered when the modules watcher has reloaded changed modules.
+
+		:param changes: Modules changes. ( Dictionary )
+		"""
+
+		self.updateInterfaces(changes)
 
 	@core.executionTrace
 	def __view_selectionModel__selectionChanged(self, selectedItems, deselectedItems):
@@ -450,7 +560,15 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 			return
 
 		if hasattr(interface, "attribute"):
-			arguments = inspect.getargspec(interface.module.import_.__dict__[interface.attribute])
+			specification = interface.module.specifications[interface.attribute]
+			arguments = specification["arguments"]
+			statistics = RuntimeGlobals.profilesManager and \
+			RuntimeGlobals.profilesManager.getStatistics(interface.module.name, interface.attribute)
+			if statistics:
+				lastRunTime = "{0:.3f} seconds".format(statistics["last"])
+				averageRunTime = "{0:.3f} seconds over {1} executions".format(statistics["mean"], statistics["count"])
+			else:
+				lastRunTime = averageRunTime = "Not executed in this session"
 			content = """
 					<h4><center>{0}</center></h4>
 					<p>
@@ -472,18 +590,25 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 					<b>Keywords:</b> {8}
 					</p>
 					<p>
+					<b>Last run time:</b> {10}
+					<br/>
+					<b>Average run time:</b> {11}
+					</p>
+					<p>
 					<b>Documentation:</b> {9}
 					</p>
 					""".format(interface.name,
 						interface.module.name,
-						os.path.normpath(interface.module.import_.__file__),
+						os.path.normpath(interface.module.file),
 						self.getMethodName(interface.attribute),
 						interface.attribute,
-						arguments.args,
-						arguments.defaults,
-						arguments.varargs,
-						arguments.keywords,
-						interface.module.import_.__dict__[interface.attribute].__doc__)
+						arguments["args"],
+						arguments["defaults"],
+						arguments["varargs"],
+						arguments["keywords"],
+						specification["documentation"],
+						lastRunTime,
+						averageRunTime)
 		else:
 			content = self.__defaultText
 
@@ -501,16 +626,16 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		self.executeInterface()
 
 	@core.executionTrace
-	def __Search_lineEdit__textChanged(self, text):
+	def __Search_lineEdit__searchRequested(self, text):
 		"""
-		This method is triggered when **Search_lineEdit** Widget text changes.
+		This method is triggered when **Search_lineEdit** Widget requests a search.
 
 		:param text: Current text value. ( QString )
 		"""
 
-		self.setInterfaces(strings.encode(text))
+		self.__proxyModel.setFilter(strings.encode(text))
 
-	@core.executionTrace
+	@tracer.executionTrace
 	def getMethodName(self, name):
 		"""
 		This method gets the method name from the Interface.
@@ -525,28 +650,73 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 	@foundations.exceptions.exceptionsHandler(None, False, Exception)
 	def setInterfaces(self, pattern=".*", flags=re.IGNORECASE):
 		"""
-		This method sets the Model interfaces.
+		This method sets the Model interfaces, the Proxy Model filters them with given pattern.
 
 		:param pattern: Interface name. ( String )
 		:param flags: Regex filtering flags. ( Integer )
 		:return: Method success. ( Boolean )
 		"""
 
-		try:
-			pattern = re.compile(pattern, flags)
-		except Exception:
-			return
+		with timing("model"):
+			interfaces = []
+			for name, module in self.__modulesManager:
+				interfaces.extend(self.getModuleInterfaces(module))
+			self.__model.setInterfaces(interfaces)
+		self.__proxyModel.setFilter(pattern, flags, incremental=False)
+		self.setCompletions()
+		return True
+
+	@core.executionTrace
+	def setCompletions(self):
+		"""
+		This method sets the **Search_lineEdit** Widget completions with the Interfaces names
+		sorted from the most executed one.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		interfaces = [item for item in self.__model if hasattr(item, "attribute")]
+		if self.__usageManager:
+			interfaces = sorted(interfaces, key=lambda interface: \
+			-self.__usageManager.getCount(interface.module.name, interface.attribute))
+		self.Search_lineEdit.completer.setModel(QStringListModel([interface.name for interface in interfaces]))
+		return True
+
+	@tracer.executionTrace
+	def getModuleInterfaces(self, module):
+		"""
+		This method returns given module interfaces.
+
+		:param module: Module. ( Module )
+		:return: Interfaces. ( List )
+		"""
+
+		return [Interface(name=strings.getNiceName(self.getMethodName(interface)), attribute=interface, module=module)
+				for interface in module.interfaces or ()]
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def updateInterfaces(self, changes):
+		"""
+		This method updates the Model interfaces from given modules changes,
+		only the interfaces of the added, removed and changed modules are unregistered and registered.
+
+		:param changes: Modules changes as returned by :meth:`ModulesManager.reloadAll`. ( Dictionary )
+		:return: Method success. ( Boolean )
+		"""
 
-		self.__model.clear()
+		names = set(changes["removed"] + changes["changed"])
+		for interface in [item for item in self.__model if hasattr(item, "attribute") and item.module.name in names]:
+			self.__model.unregisterInterface(interface.name)
 
-		for name, module in self.__modulesManager:
-			if not module.interfaces:
+		for name in changes["added"] + changes["changed"]:
+			module = self.__modulesManager[name]
+			if not module:
 				continue
 
-			for interface in module.interfaces:
-				name = strings.getNiceName(self.getMethodName(interface))
-				if re.search(pattern, name):
-					self.__model.registerInterface(Interface(name=name, attribute=interface, module=module))
+			for interface in self.getModuleInterfaces(module):
+				self.__model.registerInterface(interface)
+		self.setCompletions()
 		return True
 
 	@core.executionTrace
@@ -557,7 +727,7 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		:return: Selected interface. ( Interface )
 		"""
 
-		items = [self.__model.getInterface(index) for index in self.__view.selectionModel().selectedIndexes()]
+		items = [self.__proxyModel.getInterface(index) for index in self.__view.selectionModel().selectedIndexes()]
 		return items and items[0]
 
 	@core.executionTrace
@@ -579,7 +749,11 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		LOGGER.info("{0} | Executing '{1}' Interface from '{2}' Module!".format(self.__class__.__name__,
 																			method,
 																			module.name))
-		module.import_.__dict__[method]()
+		startTime = time.time()
+		with profile(module.name, method):
+			module.import_.getAttribute(method)()
+		self.__usageManager and self.__usageManager.recordExecution(module.name, method, time.time() - startTime)
+		self.__view_selectionModel__selectionChanged(None, None)
 		return True
 
 	@core.executionTrace
@@ -0,0 +1,434 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**bytecodeCache.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Bytecode cache module.
+
+**Others:**
+	The libraries are usually deployed on read only shares where Python cannot write the compiled files
+	next to the sources. The :class:`BytecodeCache` class is a `PEP 302 <http://www.python.org/dev/peps/pep-0302/>`_
+	loader loading the registered modules from a per user cache directory, the compiled files are keyed
+	by the interpreter magic number and the source content hash and start with a regular compiled file header.
+	The :class:`BytecodeCacheImporter` class is the :data:`sys.path_hooks` importer of the registered modules
+	directories, the modules of any other :data:`sys.path` entry are imported as usual and in the usual order.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import binascii
+import glob
+import hashlib
+import imp
+import logging
+import marshal
+import os
+import pkgutil
+import struct
+import sys
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+import snippets.common
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "BytecodeCacheImporter", "BytecodeCache"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class BytecodeCacheImporter(object):
+	"""
+	This class is the **BytecodeCacheImporter** class, it is a `PEP 302 <http://www.python.org/dev/peps/pep-0302/>`_
+	importer for one registered modules directory.
+	"""
+
+	@core.executionTrace
+	def __init__(self, bytecodeCache, directory):
+		"""
+		This method initializes the class.
+
+		:param bytecodeCache: Bytecode cache. ( BytecodeCache )
+		:param directory: Modules directory. ( String )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__bytecodeCache = bytecodeCache
+		self.__directory = directory
+
+		# The directory modules not registered in the cache are imported as usual.
+		self.__importer = pkgutil.ImpImporter(directory)
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def directory(self):
+		"""
+		This method is the property for **self.__directory** attribute.
+
+		:return: self.__directory. ( String )
+		"""
+
+		return self.__directory
+
+	@directory.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def directory(self, value):
+		"""
+		This method is the setter method for **self.__directory** attribute.
+
+		:param value: Attribute value. ( String )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "directory"))
+
+	@directory.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def directory(self):
+		"""
+		This method is the deleter method for **self.__directory** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "directory"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	# PEP 302 interface, the method names are imposed.
+	def find_module(self, fullname, path=None):
+		"""
+		This method returns the loader of given module.
+
+		:param fullname: Module name. ( String )
+		:param path: Package path. ( List )
+		:return: Loader. ( Object )
+		"""
+
+		file = self.__bytecodeCache.modules.get(fullname)
+		if file is not None and os.path.dirname(file) == self.__directory:
+			return self.__bytecodeCache
+
+		return self.__importer.find_module(fullname)
+
+class BytecodeCache(object):
+	"""
+	This class is the **BytecodeCache** class, it is a `PEP 302 <http://www.python.org/dev/peps/pep-0302/>`_
+	loader for the registered modules.
+	"""
+
+	@core.executionTrace
+	def __init__(self, directory=None):
+		"""
+		This method initializes the class.
+
+		:param directory: Cache root directory. ( String )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__directory = None
+		self.directory = directory
+
+		self.__modules = {}
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def directory(self):
+		"""
+		This method is the property for **self.__directory** attribute.
+
+		:return: self.__directory. ( String )
+		"""
+
+		return self.__directory
+
+	@directory.setter
+	@foundations.exceptions.exceptionsHandler(None, False, AssertionError)
+	def directory(self, value):
+		"""
+		This method is the setter method for **self.__directory** attribute.
+
+		:param value: Attribute value. ( String )
+		"""
+
+		if value is not None:
+			assert type(value) in (str, unicode), "'{0}' Attribute: '{1}' type is not 'str' or 'unicode'!".format(
+			"directory", value)
+			# Compiled files of different interpreters versions never collide.
+			value = os.path.join(value, binascii.hexlify(imp.get_magic()).decode("ascii"))
+		self.__directory = value
+
+	@directory.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def directory(self):
+		"""
+		This method is the deleter method for **self.__directory** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("directory"))
+
+	@property
+	def modules(self):
+		"""
+		This method is the property for **self.__modules** attribute.
+
+		:return: self.__modules. ( Dictionary )
+		"""
+
+		return self.__modules
+
+	@modules.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def modules(self, value):
+		"""
+		This method is the setter method for **self.__modules** attribute.
+
+		:param value: Attribute value. ( Dictionary )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "modules"))
+
+	@modules.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def modules(self):
+		"""
+		This method is the deleter method for **self.__modules** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "modules"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	@core.executionTrace
+	def install(self):
+		"""
+		This method installs the importer hook into :data:`sys.path_hooks`.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if self.getImporter in sys.path_hooks:
+			return False
+
+		sys.path_hooks.insert(0, self.getImporter)
+		for directory in set(os.path.dirname(file) for file in self.__modules.itervalues()):
+			self.resetImporter(directory)
+		return True
+
+	@core.executionTrace
+	def uninstall(self):
+		"""
+		This method removes the importer hook from :data:`sys.path_hooks` and the cached importers.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if not self.getImporter in sys.path_hooks:
+			return False
+
+		sys.path_hooks.remove(self.getImporter)
+		for directory, importer in sys.path_importer_cache.items():
+			if isinstance(importer, BytecodeCacheImporter):
+				del(sys.path_importer_cache[directory])
+		return True
+
+	@core.executionTrace
+	def getImporter(self, directory):
+		"""
+		This method returns the importer of given :data:`sys.path` entry if it is a registered modules directory.
+
+		:param directory: :data:`sys.path` entry. ( String )
+		:return: Importer. ( BytecodeCacheImporter )
+		"""
+
+		if self.__directory is None or not directory in set(os.path.dirname(file) for file in self.__modules.itervalues()):
+			raise ImportError("'{0}' is not a registered modules directory!".format(directory))
+
+		return BytecodeCacheImporter(self, directory)
+
+	@core.executionTrace
+	def resetImporter(self, directory):
+		"""
+		This method discards the cached regular importer of given directory so that the importer hook is queried.
+
+		:param directory: Modules directory. ( String )
+		:return: Method success. ( Boolean )
+		"""
+
+		if not isinstance(sys.path_importer_cache.get(directory), BytecodeCacheImporter):
+			sys.path_importer_cache.pop(directory, None)
+		return True
+
+	@core.executionTrace
+	def registerModule(self, name, file):
+		"""
+		This method registers given module so that it is imported through the cache.
+
+		:param name: Module name. ( String )
+		:param file: Module source file. ( String )
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__modules[name] = file
+		self.getImporter in sys.path_hooks and self.resetImporter(os.path.dirname(file))
+		return True
+
+	@core.executionTrace
+	def unregisterModule(self, name):
+		"""
+		This method unregisters given module.
+
+		:param name: Module name. ( String )
+		:return: Method success. ( Boolean )
+		"""
+
+		if name in self.__modules:
+			del(self.__modules[name])
+		return True
+
+	@core.executionTrace
+	def getCacheFile(self, name, hash):
+		"""
+		This method returns the compiled file of given module source hash.
+
+		:param name: Module name. ( String )
+		:param hash: Module source hash. ( String )
+		:return: Compiled file. ( String )
+		"""
+
+		return os.path.join(self.__directory, "{0}-{1}.{2}".format(name, hash, Constants.libraryCompiledExtension))
+
+	@core.executionTrace
+	def readCode(self, file):
+		"""
+		This method reads the code object stored in given compiled file.
+
+		:param file: Compiled file. ( String )
+		:return: Code object. ( Code )
+		"""
+
+		try:
+			with open(file, "rb") as handle:
+				if handle.read(4) != imp.get_magic():
+					return
+
+				handle.read(4)
+				return marshal.loads(handle.read())
+		except (IOError, EOFError, ValueError, TypeError):
+			return
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, IOError, OSError)
+	def writeCode(self, name, file, code, modificationTime=0):
+		"""
+		This method writes given code object into given compiled file and removes the outdated compiled files
+		of given module.
+
+		The compiled file starts with the interpreter magic number and given source modification time.
+
+		:param name: Module name. ( String )
+		:param file: Compiled file. ( String )
+		:param code: Code object. ( Code )
+		:param modificationTime: Source modification time. ( Integer )
+		:return: Method success. ( Boolean )
+		"""
+
+		if not os.path.exists(self.__directory):
+			os.makedirs(self.__directory)
+
+		for outdatedFile in glob.glob(self.getCacheFile(name, "*")):
+			os.remove(outdatedFile)
+
+		return snippets.common.writeFile(file,
+										imp.get_magic() + struct.pack("<I", int(modificationTime) & 0xFFFFFFFF) +
+										marshal.dumps(code),
+										"wb")
+
+	@core.executionTrace
+	def getCode(self, name):
+		"""
+		This method returns given module code object, compiling it and caching it if needed.
+
+		:param name: Module name. ( String )
+		:return: Code object. ( Code )
+		"""
+
+		file = self.__modules[name]
+		with open(file, "rU") as handle:
+			source = handle.read()
+
+		if not source.endswith("\n"):
+			source += "\n"
+
+		cacheFile = self.getCacheFile(name, hashlib.md5(source).hexdigest())
+		code = self.readCode(cacheFile)
+		if code is not None:
+			LOGGER.debug("> Loading '{0}' module from '{1}' compiled file.".format(name, cacheFile))
+			return code
+
+		LOGGER.debug("> Compiling '{0}' module into '{1}' compiled file.".format(name, cacheFile))
+		code = compile(source, file, "exec")
+		self.writeCode(name, cacheFile, code, os.path.getmtime(file))
+		return code
+
+	# PEP 302 interface, the method names are imposed.
+	def load_module(self, fullname):
+		"""
+		This method imports given module.
+
+		:param fullname: Module name. ( String )
+		:return: Module. ( Module )
+		"""
+
+		if fullname in sys.modules:
+			return sys.modules[fullname]
+
+		code = self.getCode(fullname)
+		module = imp.new_module(fullname)
+		module.__file__ = self.__modules[fullname]
+		module.__loader__ = self
+		sys.modules[fullname] = module
+		try:
+			exec(code, module.__dict__)
+		except:
+			del(sys.modules[fullname])
+			raise
+		return sys.modules[fullname]
@@ -0,0 +1,359 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**interfacesIndex.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Interfaces index module.
+
+**Others:**
+	The index is a json file caching the modules interfaces, their documentation and arguments,
+	it allows the modules manager to register the interfaces without importing the modules.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import hashlib
+import json
+import logging
+import os
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+import snippets.common
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "InterfacesIndex"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class InterfacesIndex(object):
+	"""
+	This class is the **InterfacesIndex** class.
+	"""
+
+	@core.executionTrace
+	def __init__(self, file=None):
+		"""
+		This method initializes the class.
+
+		:param file: Index file. ( String )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__file = None
+		self.file = file
+
+		self.__entries = {}
+		self.__dirty = False
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def file(self):
+		"""
+		This method is the property for **self.__file** attribute.
+
+		:return: self.__file. ( String )
+		"""
+
+		return self.__file
+
+	@file.setter
+	@foundations.exceptions.exceptionsHandler(None, False, AssertionError)
+	def file(self, value):
+		"""
+		This method is the setter method for **self.__file** attribute.
+
+		:param value: Attribute value. ( String )
+		"""
+
+		if value is not None:
+			assert type(value) in (str, unicode), "'{0}' Attribute: '{1}' type is not 'str' or 'unicode'!".format("file",
+																												value)
+		self.__file = value
+
+	@file.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def file(self):
+		"""
+		This method is the deleter method for **self.__file** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("file"))
+
+	@property
+	def entries(self):
+		"""
+		This method is the property for **self.__entries** attribute.
+
+		:return: self.__entries. ( Dictionary )
+		"""
+
+		return self.__entries
+
+	@entries.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def entries(self, value):
+		"""
+		This method is the setter method for **self.__entries** attribute.
+
+		:param value: Attribute value. ( Dictionary )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "entries"))
+
+	@entries.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def entries(self):
+		"""
+		This method is the deleter method for **self.__entries** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "entries"))
+
+	@property
+	def dirty(self):
+		"""
+		This method is the property for **self.__dirty** attribute.
+
+		:return: self.__dirty. ( Boolean )
+		"""
+
+		return self.__dirty
+
+	@dirty.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def dirty(self, value):
+		"""
+		This method is the setter method for **self.__dirty** attribute.
+
+		:param value: Attribute value. ( Boolean )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "dirty"))
+
+	@dirty.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def dirty(self):
+		"""
+		This method is the deleter method for **self.__dirty** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "dirty"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def __contains__(self, path):
+		"""
+		This method reimplements the :meth:`object.__contains__` method.
+
+		:param path: Module file path. ( String )
+		:return: Entry existence. ( Boolean )
+		"""
+
+		return path in self.__entries
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def __len__(self):
+		"""
+		This method reimplements the :meth:`object.__len__` method.
+
+		:return: Entries count. ( Integer )
+		"""
+
+		return len(self.__entries)
+
+	@core.executionTrace
+	def getFileSignature(self, path):
+		"""
+		This method returns given file signature.
+
+		:param path: File path. ( String )
+		:return: File modification time, file size. ( Tuple )
+		"""
+
+		stat = os.stat(path)
+		return stat.st_mtime, stat.st_size
+
+	@core.executionTrace
+	def getFileHash(self, path):
+		"""
+		This method returns given file content hash.
+
+		:param path: File path. ( String )
+		:return: File content hash. ( String )
+		"""
+
+		with open(path, "rb") as file:
+			return hashlib.md5(file.read()).hexdigest()
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def read(self):
+		"""
+		This method reads the index file.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__entries = {}
+		self.__dirty = False
+
+		if not self.__file or not os.path.exists(self.__file):
+			return False
+
+		LOGGER.debug("> Reading '{0}' interfaces index file.".format(self.__file))
+
+		try:
+			with open(self.__file, "r") as file:
+				content = json.load(file)
+		except ValueError:
+			LOGGER.warning("!> {0} | '{1}' interfaces index file is corrupted and will be rebuilt!".format(
+			self.__class__.__name__, self.__file))
+			return False
+
+		if content.get("version") != Constants.interfacesIndexVersion:
+			LOGGER.info("{0} | '{1}' interfaces index file is outdated and will be rebuilt!".format(
+			self.__class__.__name__, self.__file))
+			return False
+
+		self.__entries = content.get("entries", {})
+		return True
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def write(self):
+		"""
+		This method writes the index file if it has been modified.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if not self.__file or not self.__dirty:
+			return False
+
+		LOGGER.debug("> Writing '{0}' interfaces index file.".format(self.__file))
+
+		snippets.common.writeFile(self.__file,
+								json.dumps({"version" : Constants.interfacesIndexVersion, "entries" : self.__entries}))
+
+		self.__dirty = False
+		return True
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def getEntry(self, path):
+		"""
+		This method returns the index entry of given module file if it is still valid.
+
+		:param path: Module file path. ( String )
+		:return: Entry. ( Dictionary )
+		"""
+
+		entry = self.__entries.get(path)
+		if entry is None:
+			return
+
+		mtime, size = self.getFileSignature(path)
+		if entry.get("mtime") == mtime and entry.get("size") == size:
+			return entry
+
+		# The file has been touched, its content hash tells if it actually changed.
+		if entry.get("size") == size and entry.get("hash") == self.getFileHash(path):
+			LOGGER.debug("> '{0}' file has been touched but its content is unchanged.".format(path))
+			entry["mtime"] = mtime
+			self.__dirty = True
+			return entry
+
+		LOGGER.debug("> '{0}' interfaces index entry is stale.".format(path))
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def setEntry(self, path, name, interfaces):
+		"""
+		This method sets the index entry of given module file.
+
+		:param path: Module file path. ( String )
+		:param name: Module name. ( String )
+		:param interfaces: Interfaces specifications. ( List )
+		:return: Method success. ( Boolean )
+		"""
+
+		mtime, size = self.getFileSignature(path)
+		self.__entries[path] = {"name" : name,
+								"mtime" : mtime,
+								"size" : size,
+								"hash" : self.getFileHash(path),
+								"interfaces" : interfaces}
+		self.__dirty = True
+		return True
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def removeEntry(self, path):
+		"""
+		This method removes the index entry of given module file.
+
+		:param path: Module file path. ( String )
+		:return: Method success. ( Boolean )
+		"""
+
+		if path in self.__entries:
+			del(self.__entries[path])
+			self.__dirty = True
+		return True
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def purge(self, paths):
+		"""
+		This method removes the index entries not matching given module files.
+
+		:param paths: Module files paths. ( List )
+		:return: Method success. ( Boolean )
+		"""
+
+		paths = set(paths)
+		for path in self.__entries.keys():
+			if not path in paths:
+				self.removeEntry(path)
+		return True
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**interfacesParser.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Interfaces parser module.
+
+**Others:**
+	This module statically discovers the modules interfaces using the :mod:`ast` module,
+	nothing is imported or executed and it doesn't depend on Maya.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import ast
+import logging
+import re
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "getNodeRepresentation", "getArgumentName", "getFunctionSpecification", "getAll", "parseSource",
+		"parseFile"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+@core.executionTrace
+def getNodeRepresentation(node):
+	"""
+	This definition returns given expression node representation.
+
+	:param node: Expression node. ( Node )
+	:return: Node representation. ( String )
+	"""
+
+	try:
+		return repr(ast.literal_eval(node))
+	except ValueError:
+		pass
+
+	if isinstance(node, ast.Name):
+		return node.id
+	elif isinstance(node, ast.Attribute):
+		return "{0}.{1}".format(getNodeRepresentation(node.value), node.attr)
+	elif isinstance(node, ast.Call):
+		return "{0}(...)".format(getNodeRepresentation(node.func))
+	return "<{0}>".format(node.__class__.__name__)
+
+@core.executionTrace
+def getArgumentName(node):
+	"""
+	This definition returns given argument node name.
+
+	:param node: Argument node. ( Node )
+	:return: Argument name. ( String / List )
+	"""
+
+	# Python 2 stores the arguments as *Name* or *Tuple* nodes, Python 3 as *arg* nodes.
+	if isinstance(node, ast.Tuple):
+		return [getArgumentName(element) for element in node.elts]
+	return getattr(node, "id", None) or getattr(node, "arg", None)
+
+@core.executionTrace
+def getFunctionSpecification(node):
+	"""
+	This definition returns given function node specification.
+
+	:param node: Function node. ( FunctionDef )
+	:return: Function specification. ( Dictionary )
+	"""
+
+	arguments = node.args
+	varargs, keywords = arguments.vararg, arguments.kwarg
+	return {"name" : node.name,
+			"documentation" : ast.get_docstring(node),
+			"arguments" : {"args" : [getArgumentName(argument) for argument in arguments.args],
+						"varargs" : varargs is None and varargs or getArgumentName(varargs),
+						"keywords" : keywords is None and keywords or getArgumentName(keywords),
+						"defaults" : arguments.defaults and \
+									[getNodeRepresentation(default) for default in arguments.defaults] or None}}
+
+@core.executionTrace
+def getAll(node):
+	"""
+	This definition returns given module node **__all__** attribute value.
+
+	:param node: Module node. ( Module )
+	:return: **__all__** attribute value. ( List )
+	"""
+
+	for statement in node.body:
+		if not isinstance(statement, ast.Assign):
+			continue
+
+		if not [target for target in statement.targets if getattr(target, "id", None) == "__all__"]:
+			continue
+
+		try:
+			return list(ast.literal_eval(statement.value))
+		except ValueError:
+			LOGGER.debug("> '__all__' attribute is not a literal and will be ignored.")
+
+@core.executionTrace
+@foundations.exceptions.exceptionsHandler(None, False, SyntaxError)
+def parseSource(source, file="<string>"):
+	"""
+	This definition parses given module source and returns its interfaces specifications
+	and **__all__** attribute value.
+
+	Top level functions are parsed with their documentation and arguments, top level names bound
+	with an assignment or an import are returned without arguments.
+
+	:param source: Module source. ( String )
+	:param file: Module file used for error reporting. ( String )
+	:return: Interfaces specifications, **__all__** attribute value. ( Tuple )
+	"""
+
+	node = ast.parse(source, file)
+
+	pattern = re.compile(Constants.interfacesPattern)
+	specifications = {}
+	for statement in node.body:
+		if isinstance(statement, ast.FunctionDef):
+			if re.search(pattern, statement.name):
+				specifications[statement.name] = getFunctionSpecification(statement)
+			continue
+
+		names = []
+		if isinstance(statement, ast.Assign):
+			names = [target.id for target in statement.targets if isinstance(target, ast.Name)]
+		elif isinstance(statement, (ast.Import, ast.ImportFrom)):
+			names = [alias.asname or alias.name for alias in statement.names]
+
+		for name in names:
+			if re.search(pattern, name) and not name in specifications:
+				specifications[name] = {"name" : name,
+										"documentation" : None,
+										"arguments" : {"args" : [], "varargs" : None, "keywords" : None, "defaults" : None}}
+
+	return [specifications[name] for name in sorted(specifications)], getAll(node)
+
+@core.executionTrace
+@foundations.exceptions.exceptionsHandler(None, False, IOError, SyntaxError)
+def parseFile(file):
+	"""
+	This definition parses given module file and returns its interfaces specifications
+	and **__all__** attribute value.
+
+	:param file: Module file. ( String )
+	:return: Interfaces specifications, **__all__** attribute value. ( Tuple )
+	"""
+
+	with open(file, "rU") as handle:
+		source = handle.read()
+	return parseSource(source, file)
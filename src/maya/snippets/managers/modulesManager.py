@@ -23,10 +23,12 @@
 #**********************************************************************************************************************
 #***	External imports.
 #**********************************************************************************************************************
+import inspect
 import logging
 import os
 import re
 import sys
+import time
 
 #**********************************************************************************************************************
 #***	Internal imports.
@@ -34,8 +36,13 @@ import sys
 import foundations.core as core
 import foundations.exceptions
 import foundations.namespace as namespace
-from foundations.walkers import FilesWalker
+import snippets.tracer as tracer
 from snippets.globals.constants import Constants
+import snippets.managers.interfacesParser
+import snippets.managers.modulesScanner
+import snippets.managers.timingsManager
+from snippets.managers.bytecodeCache import BytecodeCache
+from snippets.managers.interfacesIndex import InterfacesIndex
 from snippets.globals.runtimeGlobals import RuntimeGlobals
 from snippets.globals.uiConstants import UiConstants
 
@@ -49,25 +56,290 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "Module", "ModulesManager"]
+__all__ = ["LOGGER", "LazyModule", "Module", "ModulesManager"]
 
 LOGGER = logging.getLogger(Constants.logger)
 
 #**********************************************************************************************************************
 #***	Module classes and definitions.
 #**********************************************************************************************************************
+class LazyModule(object):
+	"""
+	This class is the **LazyModule** class, it is a handle importing its module on first access.
+	"""
+
+	@core.executionTrace
+	def __init__(self, name=None, path=None):
+		"""
+		This method initializes the class.
+
+		:param name: Name of the module. ( String )
+		:param path: Path of the module. ( String )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__name = name
+		self.__path = path
+
+		self.__module = None
+		self.__importTime = None
+		self.__importDuration = None
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def name(self):
+		"""
+		This method is the property for **self.__name** attribute.
+
+		:return: self.__name. ( String )
+		"""
+
+		return self.__name
+
+	@name.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def name(self, value):
+		"""
+		This method is the setter method for **self.__name** attribute.
+
+		:param value: Attribute value. ( String )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "name"))
+
+	@name.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def name(self):
+		"""
+		This method is the deleter method for **self.__name** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "name"))
+
+	@property
+	def path(self):
+		"""
+		This method is the property for **self.__path** attribute.
+
+		:return: self.__path. ( String )
+		"""
+
+		return self.__path
+
+	@path.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def path(self, value):
+		"""
+		This method is the setter method for **self.__path** attribute.
+
+		:param value: Attribute value. ( String )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "path"))
+
+	@path.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def path(self):
+		"""
+		This method is the deleter method for **self.__path** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "path"))
+
+	@property
+	def module(self):
+		"""
+		This method is the property for **self.__module** attribute, the module is imported on first access.
+
+		:return: self.__module. ( Module )
+		"""
+
+		if self.__module is None:
+			self.load()
+		return self.__module
+
+	@module.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def module(self, value):
+		"""
+		This method is the setter method for **self.__module** attribute.
+
+		:param value: Attribute value. ( Module )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "module"))
+
+	@module.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def module(self):
+		"""
+		This method is the deleter method for **self.__module** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "module"))
+
+	@property
+	def imported(self):
+		"""
+		This method is the property for the module import state.
+
+		:return: Module import state. ( Boolean )
+		"""
+
+		return self.__module is not None
+
+	@property
+	def importTime(self):
+		"""
+		This method is the property for **self.__importTime** attribute.
+
+		:return: self.__importTime. ( Float )
+		"""
+
+		return self.__importTime
+
+	@importTime.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def importTime(self, value):
+		"""
+		This method is the setter method for **self.__importTime** attribute.
+
+		:param value: Attribute value. ( Float )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "importTime"))
+
+	@importTime.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def importTime(self):
+		"""
+		This method is the deleter method for **self.__importTime** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "importTime"))
+
+	@property
+	def importDuration(self):
+		"""
+		This method is the property for **self.__importDuration** attribute.
+
+		:return: self.__importDuration. ( Float )
+		"""
+
+		return self.__importDuration
+
+	@importDuration.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def importDuration(self, value):
+		"""
+		This method is the setter method for **self.__importDuration** attribute.
+
+		:param value: Attribute value. ( Float )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "importDuration"))
+
+	@importDuration.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def importDuration(self):
+		"""
+		This method is the deleter method for **self.__importDuration** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "importDuration"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def __getattr__(self, attribute):
+		"""
+		This method reimplements the :meth:`object.__getattr__` method, attributes are retrieved from the module.
+
+		:param attribute: Attribute name. ( String )
+		:return: Attribute value. ( Object )
+		"""
+
+		if attribute.startswith("_{0}__".format(self.__class__.__name__)):
+			raise AttributeError(attribute)
+
+		return getattr(self.module, attribute)
+
+	@core.executionTrace
+	def load(self):
+		"""
+		This method imports the module, any previously imported version is discarded.
+
+		:return: Module. ( Module )
+		"""
+
+		if self.__path not in sys.path:
+			sys.path.append(self.__path)
+
+		if self.__name in sys.modules:
+			del(sys.modules[self.__name])
+
+		LOGGER.debug("> Importing '{0}' module.".format(self.__name))
+
+		startTime = time.time()
+		with snippets.managers.timingsManager.timing("import", self.__name):
+			self.__module = __import__(self.__name)
+		self.__importTime = time.time()
+		self.__importDuration = self.__importTime - startTime
+
+		LOGGER.debug("> '{0}' module imported in '{1:.3f}' seconds.".format(self.__name, self.__importDuration))
+		return self.__module
+
+	@core.executionTrace
+	def unload(self):
+		"""
+		This method discards the imported module, it will be imported again on next access.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__module = None
+		self.__importTime = None
+		self.__importDuration = None
+		return True
+
+	@core.executionTrace
+	def getAttribute(self, attribute):
+		"""
+		This method returns given module attribute, importing the module if needed.
+
+		:param attribute: Attribute name. ( String )
+		:return: Attribute value. ( Object )
+		"""
+
+		return self.module.__dict__[attribute]
+
 class Module(object):
 	"""
 	This class is the **Module** class.
 	"""
 
 	@core.executionTrace
-	def __init__(self, name=None, path=None):
+	def __init__(self, name=None, path=None, file=None):
 		"""
 		This method initializes the class.
 
 		:param name: Name of the Component. ( String )
 		:param path: Path of the Component. ( String )
+		:param file: File of the Component. ( String )
 		"""
 
 		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -77,9 +349,12 @@ class Module(object):
 		self.name = name
 		self.paths = None
 		self.__paths = path
+		self.__file = None
+		self.file = file
 
-		self.__import = None
+		self.__import = LazyModule(name, path)
 		self.__interfaces = None
+		self.__specifications = {}
 
 	#******************************************************************************************************************
 	#***	Attributes properties.
@@ -151,12 +426,46 @@ class Module(object):
 
 		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("path"))
 
+	@property
+	def file(self):
+		"""
+		This method is the property for **self.__file** attribute.
+
+		:return: self.__file. ( String )
+		"""
+
+		return self.__file
+
+	@file.setter
+	@foundations.exceptions.exceptionsHandler(None, False, AssertionError)
+	def file(self, value):
+		"""
+		This method is the setter method for **self.__file** attribute.
+
+		:param value: Attribute value. ( String )
+		"""
+
+		if value is not None:
+			assert type(value) in (str, unicode), "'{0}' Attribute: '{1}' type is not 'str' or 'unicode'!".format("file",
+																												value)
+			assert os.path.exists(value), "'{0}' Attribute: '{1}' file doesn't exists!".format("file", value)
+		self.__file = value
+
+	@file.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def file(self):
+		"""
+		This method is the deleter method for **self.__file** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("file"))
+
 	@property
 	def import_(self):
 		"""
 		This method is the property for **self.___import_** attribute.
 
-		:return: self.__import. ( Module )
+		:return: self.__import. ( LazyModule )
 		"""
 
 		return self.__import
@@ -167,11 +476,11 @@ class Module(object):
 		"""
 		This method is the setter method for **self.___import_** attribute.
 
-		:param value: Attribute value. ( Module )
+		:param value: Attribute value. ( LazyModule )
 		"""
 
 		if value is not None:
-			assert type(value) is type(sys), "'{0}' Attribute: '{1}' type is not 'module'!".format("import", value)
+			assert type(value) is LazyModule, "'{0}' Attribute: '{1}' type is not 'LazyModule'!".format("import", value)
 		self.__import = value
 
 	@import_.deleter
@@ -212,17 +521,51 @@ class Module(object):
 
 		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("interfaces"))
 
+	@property
+	def specifications(self):
+		"""
+		This method is the property for **self.__specifications** attribute.
+
+		:return: self.__specifications. ( Dictionary )
+		"""
+
+		return self.__specifications
+
+	@specifications.setter
+	@foundations.exceptions.exceptionsHandler(None, False, AssertionError)
+	def specifications(self, value):
+		"""
+		This method is the setter method for **self.__specifications** attribute.
+
+		:param value: Attribute value. ( Dictionary )
+		"""
+
+		if value is not None:
+			assert type(value) is dict, "'{0}' Attribute: '{1}' type is not 'dict'!".format("specifications", value)
+		self.__specifications = value
+
+	@specifications.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def specifications(self):
+		"""
+		This method is the deleter method for **self.__specifications** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("specifications"))
+
 class ModulesManager(object):
 	"""
 	This class is the **ModulesManager** class.
 	"""
 
 	@core.executionTrace
-	def __init__(self, paths=None):
+	def __init__(self, paths=None, indexFile=None, bytecodeCacheDirectory=None):
 		"""
 		This method initializes the class.
 
 		:param path: Paths of the modules. ( Tuple / List )
+		:param indexFile: Interfaces index file. ( String )
+		:param bytecodeCacheDirectory: Bytecode cache directory. ( String )
 		"""
 
 		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -232,8 +575,18 @@ class ModulesManager(object):
 		self.__paths = paths
 
 		self.__modules = {}
+		self.__modulesByPath = {}
+		self.__modulesByInterface = {}
 		self.__libraryExtension = Constants.libraryExtension
 
+		self.__interfacesDiscovery = None
+		self.interfacesDiscovery = Constants.interfacesDiscovery
+		self.__interfacesIndex = InterfacesIndex(indexFile)
+		self.__interfacesIndex.read()
+
+		self.__bytecodeCache = BytecodeCache(bytecodeCacheDirectory)
+		bytecodeCacheDirectory and self.__bytecodeCache.install()
+
 	#******************************************************************************************************************
 	#***	Attributes properties.
 	#******************************************************************************************************************
@@ -293,6 +646,7 @@ class ModulesManager(object):
 		if value is not None:
 			assert type(value) is dict, "'{0}' Attribute: '{1}' type is not 'dict'!".format("modules", value)
 		self.__modules = value
+		self.__indexModules()
 
 	@modules.deleter
 	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
@@ -335,11 +689,108 @@ class ModulesManager(object):
 		raise foundations.exceptions.ProgrammingError(
 		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "libraryExtension"))
 
+	@property
+	def interfacesDiscovery(self):
+		"""
+		This method is the property for **self.__interfacesDiscovery** attribute.
+
+		:return: self.__interfacesDiscovery. ( String )
+		"""
+
+		return self.__interfacesDiscovery
+
+	@interfacesDiscovery.setter
+	@foundations.exceptions.exceptionsHandler(None, False, AssertionError)
+	def interfacesDiscovery(self, value):
+		"""
+		This method is the setter method for **self.__interfacesDiscovery** attribute.
+
+		:param value: Attribute value. ( String )
+		"""
+
+		if value is not None:
+			assert value in ("static", "import"), "'{0}' Attribute: '{1}' is not 'static' or 'import'!".format(
+			"interfacesDiscovery", value)
+		self.__interfacesDiscovery = value
+
+	@interfacesDiscovery.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def interfacesDiscovery(self):
+		"""
+		This method is the deleter method for **self.__interfacesDiscovery** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "interfacesDiscovery"))
+
+	@property
+	def interfacesIndex(self):
+		"""
+		This method is the property for **self.__interfacesIndex** attribute.
+
+		:return: self.__interfacesIndex. ( InterfacesIndex )
+		"""
+
+		return self.__interfacesIndex
+
+	@interfacesIndex.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def interfacesIndex(self, value):
+		"""
+		This method is the setter method for **self.__interfacesIndex** attribute.
+
+		:param value: Attribute value. ( InterfacesIndex )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "interfacesIndex"))
+
+	@interfacesIndex.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def interfacesIndex(self):
+		"""
+		This method is the deleter method for **self.__interfacesIndex** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "interfacesIndex"))
+
+	@property
+	def bytecodeCache(self):
+		"""
+		This method is the property for **self.__bytecodeCache** attribute.
+
+		:return: self.__bytecodeCache. ( BytecodeCache )
+		"""
+
+		return self.__bytecodeCache
+
+	@bytecodeCache.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def bytecodeCache(self, value):
+		"""
+		This method is the setter method for **self.__bytecodeCache** attribute.
+
+		:param value: Attribute value. ( BytecodeCache )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "bytecodeCache"))
+
+	@bytecodeCache.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def bytecodeCache(self):
+		"""
+		This method is the deleter method for **self.__bytecodeCache** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "bytecodeCache"))
+
 	#******************************************************************************************************************
 	#***	Class methods.
 	#******************************************************************************************************************
-	@core.executionTrace
-	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	@tracer.executionTrace
 	def __getitem__(self, name):
 		"""
 		This method reimplements the :meth:`object.__getitem__` method.
@@ -348,12 +799,9 @@ class ModulesManager(object):
 		:return: Module. ( Module )
 		"""
 
-		for module in self.__modules.itervalues():
-			if module.name == name:
-				return module
+		return self.__modules.get(name)
 
-	@core.executionTrace
-	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	@tracer.executionTrace
 	def __iter__(self):
 		"""
 		This method reimplements the :meth:`object.__iter__` method.
@@ -363,8 +811,7 @@ class ModulesManager(object):
 
 		return self.__modules.iteritems()
 
-	@core.executionTrace
-	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	@tracer.executionTrace
 	def __contains__(self, name):
 		"""
 		This method reimplements the :meth:`object.__contains__` method.
@@ -373,7 +820,7 @@ class ModulesManager(object):
 		:return: Module existence. ( Boolean )
 		"""
 
-		return self[name] and True or False
+		return name in self.__modules
 
 	@core.executionTrace
 	@foundations.exceptions.exceptionsHandler(None, False, Exception)
@@ -395,7 +842,74 @@ class ModulesManager(object):
 		:return: Modules list. ( List )
 		"""
 
-		return [module.name for module in self.iterkeys()]
+		return self.__modules.keys()
+
+	@tracer.executionTrace
+	def __indexModule(self, module):
+		"""
+		This method adds given module to the secondary indexes.
+
+		:param module: Module. ( Module )
+		"""
+
+		self.__modulesByPath[module.file] = module
+		self.__bytecodeCache.registerModule(module.name, module.file)
+		for interface in module.interfaces or ():
+			owner = self.__modulesByInterface.get(interface)
+			if owner is not None and owner is not module:
+				LOGGER.warning("!> {0} | '{1}' Interface is provided by both '{2}' and '{3}' Modules!".format(
+				self.__class__.__name__, interface, owner.name, module.name))
+				continue
+			self.__modulesByInterface[interface] = module
+
+	@core.executionTrace
+	def __unindexModule(self, module):
+		"""
+		This method removes given module from the secondary indexes.
+
+		:param module: Module. ( Module )
+		"""
+
+		if self.__modulesByPath.get(module.file) is module:
+			del(self.__modulesByPath[module.file])
+		self.__bytecodeCache.unregisterModule(module.name)
+		for interface in module.interfaces or ():
+			if self.__modulesByInterface.get(interface) is module:
+				del(self.__modulesByInterface[interface])
+
+	@core.executionTrace
+	def __indexModules(self):
+		"""
+		This method rebuilds the secondary indexes.
+		"""
+
+		self.__modulesByPath = {}
+		self.__modulesByInterface = {}
+		self.__bytecodeCache.modules.clear()
+		for module in (self.__modules or {}).itervalues():
+			self.__indexModule(module)
+
+	@core.executionTrace
+	def getModuleFromPath(self, path):
+		"""
+		This method returns the module registered with given file path.
+
+		:param path: Module file path. ( String )
+		:return: Module. ( Module )
+		"""
+
+		return self.__modulesByPath.get(path)
+
+	@core.executionTrace
+	def getModuleFromInterface(self, interface):
+		"""
+		This method returns the module providing given interface.
+
+		:param interface: Interface name. ( String )
+		:return: Module. ( Module )
+		"""
+
+		return self.__modulesByInterface.get(interface)
 
 	@core.executionTrace
 	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
@@ -408,12 +922,13 @@ class ModulesManager(object):
 		:return: Method success. ( Boolean )
 		"""
 
-		if name in self:
+		name = namespace.getNamespace(name, rootOnly=True) or name
+		if name in self.__modules:
 			raise foundations.exceptions.ProgrammingError("{0} | '{1}' module is already registered!".format(
 			self.__class__.__name__, name))
 
-		name = namespace.getNamespace(name, rootOnly=True)
-		self.__modules[name] = Module(name=name, path=os.path.dirname(path))
+		module = self.__modules[name] = Module(name=name, path=os.path.dirname(path), file=path)
+		self.__indexModule(module)
 		return True
 
 	@core.executionTrace
@@ -426,13 +941,29 @@ class ModulesManager(object):
 		:return: Method success. ( Boolean )
 		"""
 
-		if not name in self:
+		if not name in self.__modules:
 			raise foundations.exceptions.ProgrammingError("{0} | '{1}' module is not registered!".format(
 			self.__class__.__name__, name))
 
+		self.__unindexModule(self.__modules[name])
 		del(self.__modules[name])
 		return True
 
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def walkModules(self):
+		"""
+		This method walks the modules paths and returns the modules files.
+
+		The paths are scanned concurrently, when a module name is found in several paths
+		the first path wins.
+
+		:return: Modules names, paths. ( List )
+		"""
+
+		with snippets.managers.timingsManager.timing("walk"):
+			return snippets.managers.modulesScanner.scanDirectories(self.__paths, self.__libraryExtension) or []
+
 	@core.executionTrace
 	@foundations.exceptions.exceptionsHandler(None, False, Exception)
 	def registerModules(self):
@@ -441,14 +972,87 @@ class ModulesManager(object):
 		:return: Method success. ( Boolean )
 		"""
 
-		for directory in self.__paths:
-			filesWalker = FilesWalker(directory)
-			modules = filesWalker.walk(filtersIn=(r"\.{0}$".format(self.__libraryExtension),))
-
-			for name, path in modules.iteritems():
-				self.registerModule(name, path)
+		for name, path in self.walkModules():
+			self.registerModule(name, path)
 		return True
 
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, ImportError)
+	def importModule(self, module):
+		"""
+		This method imports given module.
+
+		:param module: Module. ( Module )
+		:return: Imported module. ( Module )
+		"""
+
+		return module.import_.load()
+
+	@core.executionTrace
+	def getInterfaceSpecification(self, name, object):
+		"""
+		This method returns given interface object specification.
+
+		:param name: Interface name. ( String )
+		:param object: Interface object. ( Object )
+		:return: Interface specification. ( Dictionary )
+		"""
+
+		try:
+			arguments = inspect.getargspec(object)
+			arguments = {"args" : arguments.args,
+						"varargs" : arguments.varargs,
+						"keywords" : arguments.keywords,
+						"defaults" : arguments.defaults and [repr(value) for value in arguments.defaults] or None}
+		except TypeError:
+			arguments = {"args" : [], "varargs" : None, "keywords" : None, "defaults" : None}
+
+		return {"name" : name,
+				"documentation" : inspect.getdoc(object),
+				"arguments" : arguments}
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, ImportError)
+	def parseModuleInterfaces(self, module):
+		"""
+		This method statically parses given module interfaces specifications without importing it.
+
+		:param module: Module. ( Module )
+		:return: Interfaces specifications. ( List )
+		"""
+
+		result = snippets.managers.interfacesParser.parseFile(module.file)
+		if result is None:
+			return
+
+		specifications, all = result
+		if all is not None:
+			for specification in specifications:
+				if not specification["name"] in all:
+					LOGGER.debug("> '{0}' Interface is not exported by '{1}' Module '__all__' attribute.".format(
+					specification["name"], module.name))
+		return specifications
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, ImportError)
+	def scanModuleInterfaces(self, module):
+		"""
+		This method imports given module and scans its interfaces specifications.
+
+		:param module: Module. ( Module )
+		:return: Interfaces specifications. ( List )
+		"""
+
+		import_ = self.importModule(module)
+
+		specifications = []
+		for attribute in sorted(import_.__dict__):
+			if not re.search(Constants.interfacesPattern, attribute):
+				continue
+
+			specifications.append(self.getInterfaceSpecification(attribute, import_.__dict__[attribute]))
+		return specifications
+
 	@core.executionTrace
 	@foundations.exceptions.exceptionsHandler(None, False, ImportError)
 	def registerModuleInterfaces(self, module):
@@ -459,19 +1063,33 @@ class ModulesManager(object):
 		:return: Method success. ( Boolean )
 		"""
 
-		if module.path not in sys.path:
-			sys.path.append(module.path)
+		entry = self.__interfacesIndex.getEntry(module.file)
+		if entry is not None:
+			LOGGER.debug("> Registering '{0}' module interfaces from index.".format(module.name))
+			specifications = entry["interfaces"]
+		else:
+			specifications = None
+			if self.__interfacesDiscovery == "static":
+				specifications = self.parseModuleInterfaces(module)
+				if specifications is None:
+					LOGGER.warning("!> {0} | '{1}' Module couldn't be parsed, falling back to import discovery!".format(
+					self.__class__.__name__, module.name))
+
+			if specifications is None:
+				specifications = self.scanModuleInterfaces(module)
 
-		if module.name in sys.modules:
-			del(sys.modules[module.name])
+			if specifications is None:
+				return
 
-		module.import_ = __import__(module.name)
+			self.__interfacesIndex.setEntry(module.file, module.name, specifications)
 
-		interfaces = [attribute for attribute in module.import_.__dict__ if re.search(r"^I[A-Z]\w+", attribute)]
-		if interfaces:
+		if specifications:
+			interfaces = [specification["name"] for specification in specifications]
 			LOGGER.info("{0} | Registering '{1}' Interfaces from '{2}' Module!".format(self.__class__.__name__,
 																						interfaces, module.name))
 			module.interfaces = interfaces
+			module.specifications = dict(((specification["name"], specification) for specification in specifications))
+			self.__indexModule(module)
 			return True
 
 	@core.executionTrace
@@ -484,7 +1102,11 @@ class ModulesManager(object):
 		"""
 
 		for name, module in self:
-			self.registerModuleInterfaces(module)
+			with snippets.managers.timingsManager.timing("interfaces", name):
+				self.registerModuleInterfaces(module)
+
+		self.__interfacesIndex.purge([module.file for module in self.__modules.itervalues()])
+		self.__interfacesIndex.write()
 		return True
 
 	@core.executionTrace
@@ -496,6 +1118,8 @@ class ModulesManager(object):
 		:return: Method success. ( Boolean )
 		"""
 
+		for module in self.__modules.values():
+			self.__unindexModule(module)
 		self.__modules = {}
 		return True
 
@@ -512,15 +1136,140 @@ class ModulesManager(object):
 		self.registerInterfaces()
 		return True
 
+	@core.executionTrace
+	def getFilePathIndex(self, file):
+		"""
+		This method returns the index of the modules path providing given module file.
+
+		The files the modules paths walk would skip are rejected: files with another extension
+		and files located in hidden or ignored directories.
+
+		:param file: Module file. ( String )
+		:return: Modules path index. ( Integer )
+		"""
+
+		if os.path.splitext(file)[1] != ".{0}".format(self.__libraryExtension):
+			return
+
+		for index, path in enumerate(self.__paths or ()):
+			path = os.path.normpath(path)
+			if not file.startswith(path + os.sep):
+				continue
+
+			directories = os.path.dirname(file[len(path) + 1:]).split(os.sep)
+			for directory in directories:
+				if directory.startswith(".") or directory in Constants.modulesScannerIgnoredDirectories:
+					return
+			return index
+
+	@core.executionTrace
+	def getFilesChanges(self, files):
+		"""
+		This method returns the changes of given modules files without walking the modules paths.
+
+		Each file is checked on its own: a missing registered file is removed, a new file is added
+		unless a module with the same name is provided by a preceding modules path. A module shadowed
+		by a removed file is only registered by the next modules paths walk.
+
+		:param files: Modules files. ( List )
+		:return: Added modules paths, removed modules names, changed modules names. ( Dictionary )
+		"""
+
+		registered = dict(((os.path.normpath(path), module) for path, module in self.__modulesByPath.iteritems()))
+
+		files = [file for file in sorted(set((os.path.normpath(path) for path in files)))
+				if self.getFilePathIndex(file) is not None]
+		existingFiles = sorted((file for file in files if os.path.isfile(file)),
+							key=lambda file: (self.getFilePathIndex(file), file))
+
+		changes = {"added" : [], "removed" : [], "changed" : []}
+		# The removed files are processed first so that a module moved to another file is not seen as shadowed.
+		for file in set(files).difference(existingFiles):
+			module = registered.get(file)
+			module is not None and changes["removed"].append(module.name)
+
+		for file in existingFiles:
+			module = registered.get(file)
+			if module is not None:
+				self.__interfacesIndex.getEntry(module.file) is None and changes["changed"].append(module.name)
+				continue
+
+			name = os.path.splitext(os.path.basename(file))[0]
+			module = self.__modules.get(namespace.getNamespace(name, rootOnly=True) or name)
+			if module is not None and not module.name in changes["removed"]:
+				moduleIndex = self.getFilePathIndex(os.path.normpath(module.file))
+				if moduleIndex is not None and moduleIndex <= self.getFilePathIndex(file):
+					LOGGER.warning("!> {0} | '{1}' module is shadowed by '{2}' module!".format(
+					self.__class__.__name__, file, module.file))
+					continue
+				changes["removed"].append(module.name)
+			changes["added"].append((name, file))
+		return changes
+
 	@core.executionTrace
 	@foundations.exceptions.exceptionsHandler(None, False, Exception)
-	def reloadAll(self):
+	def getChanges(self, files=None):
 		"""
-		This method reloads all modules and their interfaces.
+		This method compares the modules files with the registered modules and returns the changes.
 
-		:return: Method success. ( Boolean )
+		A registered module is changed when its file modification time or size differs from
+		the interfaces index entry and its content hash differs too.
+
+		:param files: Only check those modules files for changes, the modules paths are not walked. ( List )
+		:return: Added modules paths, removed modules names, changed modules names. ( Dictionary )
 		"""
 
-		self.unregisterAll()
-		self.registerAll()
-		return True
+		if files is not None:
+			return self.getFilesChanges(files)
+
+		walkedFiles = dict(((path, name) for name, path in self.walkModules()))
+		registered = dict(((path, module.name) for path, module in self.__modulesByPath.iteritems()))
+
+		changes = {"added" : [], "removed" : [], "changed" : []}
+		for path, name in walkedFiles.iteritems():
+			if not path in registered:
+				changes["added"].append((name, path))
+			elif self.__interfacesIndex.getEntry(path) is None:
+				changes["changed"].append(registered[path])
+
+		for path, name in registered.iteritems():
+			if not path in walkedFiles:
+				changes["removed"].append(name)
+		return changes
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def reloadAll(self, files=None):
+		"""
+		This method incrementally reloads the modules and their interfaces,
+		only added, removed and changed modules are processed.
+
+		Changed modules are registered again with a new lazy module handle and thus will be
+		imported again on their next access.
+
+		:param files: Only check those modules files for changes, the modules paths are not walked. ( List )
+		:return: Added, removed and changed modules names. ( Dictionary )
+		"""
+
+		changes = self.getChanges(files)
+
+		changed = [(name, self[name].file) for name in changes["changed"]]
+		for name in changes["removed"] + changes["changed"]:
+			self.__interfacesIndex.removeEntry(self[name].file)
+			self.unregisterModule(name)
+
+		added = []
+		for name, path in changes["added"] + changed:
+			if not self.registerModule(name, path):
+				continue
+
+			name = namespace.getNamespace(name, rootOnly=True) or name
+			self.registerModuleInterfaces(self[name])
+			added.append(name)
+		changes["added"] = [name for name in added if not name in changes["changed"]]
+
+		self.__interfacesIndex.write()
+
+		LOGGER.info("{0} | Reloaded modules: '{1}' added, '{2}' removed, '{3}' changed!".format(
+		self.__class__.__name__, changes["added"], changes["removed"], changes["changed"]))
+		return changes
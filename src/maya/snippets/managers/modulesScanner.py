@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**modulesScanner.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Modules scanner module.
+
+**Others:**
+	The modules paths are scanned concurrently by worker threads, this hides the latency of network shares
+	when several paths are defined. *os.scandir* is used when available, then the *scandir* package
+	and finally *os.listdir*.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import logging
+import os
+import Queue
+import stat
+import threading
+import time
+
+try:
+	from os import scandir
+except ImportError:
+	try:
+		from scandir import scandir
+	except ImportError:
+		scandir = None
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "listDirectory", "scanDirectory", "scanDirectories"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+@core.executionTrace
+def listDirectory(directory):
+	"""
+	This definition lists given directory and returns its sub directories and files.
+
+	:param directory: Directory to list. ( String )
+	:return: Sub directories paths, files paths. ( Tuple )
+	"""
+
+	directories, files = [], []
+	if scandir is not None:
+		for entry in scandir(directory):
+			try:
+				isDirectory = entry.is_dir()
+			except OSError:
+				continue
+			if isDirectory:
+				directories.append(entry.path)
+			else:
+				files.append(entry.path)
+	else:
+		for name in os.listdir(directory):
+			path = os.path.join(directory, name)
+			try:
+				isDirectory = stat.S_ISDIR(os.stat(path).st_mode)
+			except OSError:
+				continue
+			if isDirectory:
+				directories.append(path)
+			else:
+				files.append(path)
+	return directories, files
+
+@core.executionTrace
+@foundations.exceptions.exceptionsHandler(None, False, Exception)
+def scanDirectory(directory, extension=Constants.libraryExtension,
+				ignoredDirectories=Constants.modulesScannerIgnoredDirectories):
+	"""
+	This definition recursively scans given directory and returns the modules files sorted by path.
+
+	Hidden and ignored directories are pruned before being entered.
+
+	:param directory: Directory to scan. ( String )
+	:param extension: Modules files extension. ( String )
+	:param ignoredDirectories: Ignored directories names. ( Tuple )
+	:return: Modules names, paths. ( List )
+	"""
+
+	extension = ".{0}".format(extension)
+	modules = []
+	stack = [directory]
+	while stack:
+		path = stack.pop()
+		try:
+			directories, files = listDirectory(path)
+		except OSError as error:
+			LOGGER.warning("!> {0} | '{1}' directory cannot be scanned: '{2}'!".format(__name__, path, error))
+			continue
+
+		for subDirectory in directories:
+			name = os.path.basename(subDirectory)
+			if name.startswith(".") or name in ignoredDirectories:
+				continue
+			stack.append(subDirectory)
+
+		for file in files:
+			name, fileExtension = os.path.splitext(os.path.basename(file))
+			if fileExtension == extension:
+				modules.append((name, file))
+	return sorted(modules, key=lambda module: module[1])
+
+@core.executionTrace
+@foundations.exceptions.exceptionsHandler(None, False, Exception)
+def scanDirectories(directories, extension=Constants.libraryExtension,
+					ignoredDirectories=Constants.modulesScannerIgnoredDirectories, threads=Constants.modulesScannerThreads):
+	"""
+	This definition concurrently scans given directories and returns the modules files.
+
+	Results are merged in directories order: when a module name is found in several directories,
+	the first directory wins and the other modules files are shadowed.
+
+	:param directories: Directories to scan. ( List )
+	:param extension: Modules files extension. ( String )
+	:param ignoredDirectories: Ignored directories names. ( Tuple )
+	:param threads: Maximum threads count. ( Integer )
+	:return: Modules names, paths. ( List )
+	"""
+
+	directories = [directory for directory in directories or () if os.path.isdir(directory)]
+	if not directories:
+		return []
+
+	startTime = time.time()
+	scan = lambda directory: scanDirectory(directory, extension, ignoredDirectories) or []
+	if len(directories) == 1 or threads < 2:
+		results = [scan(directory) for directory in directories]
+	else:
+		# Plain threads are used since a threads pool takes about 100ms to shut down.
+		results = [None] * len(directories)
+		queue = Queue.Queue()
+		for index in range(len(directories)):
+			queue.put(index)
+
+		def work():
+			while True:
+				try:
+					index = queue.get_nowait()
+				except Queue.Empty:
+					return
+				results[index] = scan(directories[index])
+
+		workers = [threading.Thread(target=work) for i in range(min(threads, len(directories)) - 1)]
+		for worker in workers:
+			worker.setDaemon(True)
+			worker.start()
+		work()
+		for worker in workers:
+			worker.join()
+
+	modules = []
+	paths = {}
+	for result in results:
+		for name, path in result:
+			if name in paths:
+				LOGGER.warning("!> {0} | '{1}' module is shadowed by '{2}' module!".format(__name__, path, paths[name]))
+				continue
+			paths[name] = path
+			modules.append((name, path))
+
+	LOGGER.info("{0} | Scanned '{1}' directories and found '{2}' modules in '{3:.3f}' seconds!".format(
+	__name__, len(directories), len(modules), time.time() - startTime))
+	return modules
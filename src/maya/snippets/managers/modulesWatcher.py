@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**modulesWatcher.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Modules watcher module.
+
+**Others:**
+	The watcher polls the modules manager paths from a background thread, *pyinotify* is used
+	to wake the thread up when it is available. Changes are batched and handed to the modules manager
+	on the Qt main thread through a queued signal.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import logging
+import os
+import threading
+from PyQt4.QtCore import QObject
+from PyQt4.QtCore import Qt
+from PyQt4.QtCore import pyqtSignal
+
+try:
+	import pyinotify
+except ImportError:
+	pyinotify = None
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "ModulesWatcher"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class ModulesWatcher(QObject):
+	"""
+	This class is a `QObject <http://doc.qt.nokia.com/qobject.html>`_ subclass watching
+	the modules manager paths and reloading it when modules files change.
+	"""
+
+	# Custom signals definitions.
+	filesChanged = pyqtSignal(list)
+	modulesReloaded = pyqtSignal(dict)
+
+	@core.executionTrace
+	def __init__(self, parent=None, modulesManager=None, interval=Constants.modulesWatcherInterval, inotify=True):
+		"""
+		This method initializes the class.
+
+		:param parent: Parent object. ( QObject )
+		:param modulesManager: Modules Manager. ( ModulesManager )
+		:param interval: Polling interval in seconds. ( Float )
+		:param inotify: Use *pyinotify* to wake up the polling thread if available. ( Boolean )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		QObject.__init__(self, parent)
+
+		# --- Setting class attributes. ---
+		self.__modulesManager = modulesManager
+		self.__interval = None
+		self.interval = interval
+		self.__inotify = inotify and pyinotify is not None
+
+		self.__thread = None
+		self.__stopEvent = threading.Event()
+		self.__wakeEvent = threading.Event()
+		self.__notifier = None
+
+		# Signals / Slots.
+		self.filesChanged.connect(self.__filesChanged, Qt.QueuedConnection)
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def modulesManager(self):
+		"""
+		This method is the property for **self.__modulesManager** attribute.
+
+		:return: self.__modulesManager. ( ModulesManager )
+		"""
+
+		return self.__modulesManager
+
+	@modulesManager.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def modulesManager(self, value):
+		"""
+		This method is the setter method for **self.__modulesManager** attribute.
+
+		:param value: Attribute value. ( ModulesManager )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "modulesManager"))
+
+	@modulesManager.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def modulesManager(self):
+		"""
+		This method is the deleter method for **self.__modulesManager** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "modulesManager"))
+
+	@property
+	def interval(self):
+		"""
+		This method is the property for **self.__interval** attribute.
+
+		:return: self.__interval. ( Float )
+		"""
+
+		return self.__interval
+
+	@interval.setter
+	@foundations.exceptions.exceptionsHandler(None, False, AssertionError)
+	def interval(self, value):
+		"""
+		This method is the setter method for **self.__interval** attribute.
+
+		:param value: Attribute value. ( Float )
+		"""
+
+		if value is not None:
+			assert type(value) in (int, float), "'{0}' attribute: '{1}' type is not 'int' or 'float'!".format(
+			"interval", value)
+			assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("interval", value)
+		self.__interval = value
+
+	@interval.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def interval(self):
+		"""
+		This method is the deleter method for **self.__interval** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "interval"))
+
+	@property
+	def inotify(self):
+		"""
+		This method is the property for **self.__inotify** attribute.
+
+		:return: self.__inotify. ( Boolean )
+		"""
+
+		return self.__inotify
+
+	@inotify.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def inotify(self, value):
+		"""
+		This method is the setter method for **self.__inotify** attribute.
+
+		:param value: Attribute value. ( Boolean )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "inotify"))
+
+	@inotify.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def inotify(self):
+		"""
+		This method is the deleter method for **self.__inotify** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "inotify"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	@core.executionTrace
+	def __filesChanged(self, files):
+		"""
+		This method is triggered on the main thread when the watched files change.
+
+		:param files: Changed files. ( List )
+		"""
+
+		LOGGER.debug("> Watched files changed: '{0}'.".format(files))
+
+		changes = self.__modulesManager.reloadAll(set(files))
+		if changes and [value for value in changes.itervalues() if value]:
+			self.modulesReloaded.emit(changes)
+
+	@core.executionTrace
+	def getSnapshot(self):
+		"""
+		This method returns the modules files signatures of the modules manager paths.
+
+		:return: Modules files signatures. ( Dictionary )
+		"""
+
+		extension = ".{0}".format(self.__modulesManager.libraryExtension)
+		snapshot = {}
+		for directory in self.__modulesManager.paths or ():
+			for root, directories, files in os.walk(directory):
+				for file in files:
+					if not file.endswith(extension):
+						continue
+
+					path = os.path.join(root, file)
+					try:
+						stat = os.stat(path)
+					except OSError:
+						continue
+					snapshot[path] = (stat.st_mtime, stat.st_size)
+		return snapshot
+
+	@core.executionTrace
+	def __startNotifier(self):
+		"""
+		This method starts the *pyinotify* notifier waking up the polling thread.
+		"""
+
+		wakeEvent = self.__wakeEvent
+
+		class EventHandler(pyinotify.ProcessEvent):
+			"""
+			This class wakes up the polling thread on file system events.
+			"""
+
+			def process_default(self, event):
+				"""
+				This method processes the file system events.
+
+				:param event: Event. ( Event )
+				"""
+
+				wakeEvent.set()
+
+		watchManager = pyinotify.WatchManager()
+		mask = pyinotify.IN_CREATE | pyinotify.IN_DELETE | pyinotify.IN_MODIFY | \
+				pyinotify.IN_MOVED_FROM | pyinotify.IN_MOVED_TO | pyinotify.IN_CLOSE_WRITE
+		for directory in self.__modulesManager.paths or ():
+			watchManager.add_watch(directory, mask, rec=True, auto_add=True)
+		self.__notifier = pyinotify.ThreadedNotifier(watchManager, EventHandler())
+		self.__notifier.setDaemon(True)
+		self.__notifier.start()
+
+	@core.executionTrace
+	def __watch(self):
+		"""
+		This method is the polling thread loop.
+		"""
+
+		previous = self.getSnapshot()
+		batch = set()
+		while not self.__stopEvent.isSet():
+			self.__wakeEvent.wait(self.__interval)
+			if self.__stopEvent.isSet():
+				break
+
+			woken = self.__wakeEvent.isSet()
+			self.__wakeEvent.clear()
+
+			# Letting the files settle so that a deployment is processed as a single batch.
+			if woken:
+				self.__stopEvent.wait(Constants.modulesWatcherSettleDelay)
+
+			snapshot = self.getSnapshot()
+			changed = set(path for path in set(snapshot) | set(previous) if snapshot.get(path) != previous.get(path))
+			previous = snapshot
+
+			if changed:
+				batch.update(changed)
+				continue
+
+			if batch:
+				LOGGER.info("{0} | '{1}' watched files changed!".format(self.__class__.__name__, len(batch)))
+				self.filesChanged.emit(sorted(batch))
+				batch = set()
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def start(self):
+		"""
+		This method starts the watcher.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if self.__thread is not None and self.__thread.isAlive():
+			return False
+
+		LOGGER.debug("> Starting '{0}' with '{1}' seconds interval.".format(self.__class__.__name__, self.__interval))
+
+		self.__stopEvent.clear()
+		if self.__inotify:
+			self.__startNotifier()
+
+		self.__thread = threading.Thread(target=self.__watch, name=self.__class__.__name__)
+		self.__thread.setDaemon(True)
+		self.__thread.start()
+		return True
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def stop(self):
+		"""
+		This method stops the watcher.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if self.__thread is None:
+			return False
+
+		LOGGER.debug("> Stopping '{0}'.".format(self.__class__.__name__))
+
+		self.__stopEvent.set()
+		self.__wakeEvent.set()
+		self.__thread.join()
+		self.__thread = None
+
+		if self.__notifier is not None:
+			self.__notifier.stop()
+			self.__notifier = None
+		return True
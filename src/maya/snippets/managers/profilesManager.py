@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**profilesManager.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Profiles Manager module.
+
+**Others:**
+	The interfaces executions wall time, CPU time, peak resident memory growth and the :mod:`maya.cmds` calls
+	profiled by :class:`snippets.commandsProfiler.CommandsProfiler` are recorded into a rolling per session log
+	that can be exported to a JSON file. The peak resident memory growth is how much an execution raised the
+	process high water mark, not the memory it allocated.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import collections
+import contextlib
+import json
+import logging
+import os
+import time
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+from snippets.commandsProfiler import CommandsProfiler
+from snippets.globals.constants import Constants
+from snippets.globals.runtimeGlobals import RuntimeGlobals
+from snippets.managers.timingsManager import getPeakMemory
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "getCpuTime", "ProfilesManager", "profile"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def getCpuTime():
+	"""
+	This definition returns the process user and system CPU time in seconds.
+
+	:return: CPU time. ( Float )
+	"""
+
+	times = os.times()
+	return times[0] + times[1]
+
+class ProfilesManager(object):
+	"""
+	This class is the **ProfilesManager** class, it records the interfaces executions profiles.
+	"""
+
+	@core.executionTrace
+	def __init__(self, size=Constants.profilesLogSize, countCommands=Constants.profilesCountCommands, commands=None):
+		"""
+		This method initializes the class.
+
+		:param size: Rolling log size. ( Integer )
+		:param countCommands: Count the commands calls. ( Boolean )
+		:param commands: Commands module, :mod:`maya.cmds` if not given. ( Module )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__profiles = collections.deque(maxlen=size)
+		self.__countCommands = None
+		self.countCommands = countCommands
+		self.__commands = commands
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def profiles(self):
+		"""
+		This method is the property for **self.__profiles** attribute.
+
+		:return: self.__profiles. ( Deque )
+		"""
+
+		return self.__profiles
+
+	@profiles.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def profiles(self, value):
+		"""
+		This method is the setter method for **self.__profiles** attribute.
+
+		:param value: Attribute value. ( Deque )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "profiles"))
+
+	@profiles.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def profiles(self):
+		"""
+		This method is the deleter method for **self.__profiles** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "profiles"))
+
+	@property
+	def countCommands(self):
+		"""
+		This method is the property for **self.__countCommands** attribute.
+
+		:return: self.__countCommands. ( Boolean )
+		"""
+
+		return self.__countCommands
+
+	@countCommands.setter
+	@foundations.exceptions.exceptionsHandler(None, False, AssertionError)
+	def countCommands(self, value):
+		"""
+		This method is the setter method for **self.__countCommands** attribute.
+
+		:param value: Attribute value. ( Boolean )
+		"""
+
+		if value is not None:
+			assert type(value) is bool, "'{0}' Attribute: '{1}' type is not 'bool'!".format("countCommands", value)
+		self.__countCommands = value
+
+	@countCommands.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def countCommands(self):
+		"""
+		This method is the deleter method for **self.__countCommands** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "countCommands"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	@contextlib.contextmanager
+	def profile(self, module, interface):
+		"""
+		This method is a context manager profiling its block as given interface execution.
+
+		:param module: Module name. ( String )
+		:param interface: Interface name. ( String )
+		"""
+
+		profile = {"module" : module,
+					"interface" : interface,
+					"startTime" : time.time(),
+					"commands" : None,
+					"hottestCommands" : None}
+		commandsProfiler = None
+		if self.__countCommands:
+			commandsProfiler = self.__commands is None and CommandsProfiler() or CommandsProfiler(self.__commands)
+			commandsProfiler.install()
+
+		peakMemory = getPeakMemory()
+		cpuTime = getCpuTime()
+		try:
+			yield profile
+		finally:
+			profile["wallTime"] = time.time() - profile["startTime"]
+			profile["cpuTime"] = getCpuTime() - cpuTime
+			profile["peakMemoryGrowth"] = getPeakMemory() - peakMemory
+			if commandsProfiler is not None:
+				commandsProfiler.uninstall()
+				profile["commands"] = commandsProfiler.getCallsCount()
+				profile["hottestCommands"] = commandsProfiler.getReport(Constants.commandsReportCount)
+				if LOGGER.isEnabledFor(logging.DEBUG):
+					commandsProfiler.logReport("'{0}' Interface from '{1}' Module".format(interface, module))
+			self.__profiles.append(profile)
+
+			LOGGER.debug("> '{0}' Interface from '{1}' Module: '{2:.3f}' seconds wall time, '{3:.3f}' seconds CPU time, \
+'{4}' kilobytes peak memory growth, '{5}' commands.".format(interface, module, profile["wallTime"],
+										profile["cpuTime"], profile["peakMemoryGrowth"], profile["commands"]))
+
+	@core.executionTrace
+	def getProfiles(self, module, interface):
+		"""
+		This method returns given interface profiles.
+
+		:param module: Module name. ( String )
+		:param interface: Interface name. ( String )
+		:return: Profiles. ( List )
+		"""
+
+		return [profile for profile in self.__profiles
+				if profile["interface"] == interface and profile["module"] == module]
+
+	@core.executionTrace
+	def getStatistics(self, module, interface):
+		"""
+		This method returns given interface executions count, last and mean wall time.
+
+		:param module: Module name. ( String )
+		:param interface: Interface name. ( String )
+		:return: Statistics. ( Dictionary )
+		"""
+
+		profiles = self.getProfiles(module, interface)
+		if not profiles:
+			return
+
+		return {"count" : len(profiles),
+				"last" : profiles[-1]["wallTime"],
+				"mean" : sum(profile["wallTime"] for profile in profiles) / len(profiles)}
+
+	@core.executionTrace
+	def clear(self):
+		"""
+		This method clears the profiles.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__profiles.clear()
+		return True
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, IOError)
+	def exportProfiles(self, file):
+		"""
+		This method exports the profiles into given JSON file.
+
+		:param file: Export file. ( String )
+		:return: Method success. ( Boolean )
+		"""
+
+		with open(file, "w") as handle:
+			json.dump(list(self.__profiles), handle, indent=4, sort_keys=True)
+
+		LOGGER.info("{0} | '{1}' profiles exported into '{2}' file!".format(
+		self.__class__.__name__, len(self.__profiles), file))
+		return True
+
+@contextlib.contextmanager
+def profile(module, interface):
+	"""
+	This definition is a context manager profiling its block with the global profiles manager if it is set.
+
+	:param module: Module name. ( String )
+	:param interface: Interface name. ( String )
+	"""
+
+	if RuntimeGlobals.profilesManager is None:
+		yield
+		return
+
+	with RuntimeGlobals.profilesManager.profile(module, interface):
+		yield
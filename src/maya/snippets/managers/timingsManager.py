@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**timingsManager.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Timings Manager module.
+
+**Others:**
+	The startup phases are timed along the growth of the process peak resident memory: it is not the memory
+	allocated by a phase but how much a phase raised the process high water mark, a phase reusing freed
+	memory reports no growth.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import collections
+import contextlib
+import ctypes
+import logging
+import os
+import sys
+import time
+
+try:
+	import resource
+except ImportError:
+	resource = None
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+from snippets.globals.constants import Constants
+from snippets.globals.runtimeGlobals import RuntimeGlobals
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "ProcessMemoryCounters", "getPeakMemory", "TimingsManager", "timing"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class ProcessMemoryCounters(ctypes.Structure):
+	"""
+	This class is the **ProcessMemoryCounters** class mapping Windows **PROCESS_MEMORY_COUNTERS** structure.
+	"""
+
+	_fields_ = [("cb", ctypes.c_ulong),
+				("PageFaultCount", ctypes.c_ulong),
+				("PeakWorkingSetSize", ctypes.c_size_t),
+				("WorkingSetSize", ctypes.c_size_t),
+				("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+				("QuotaPagedPoolUsage", ctypes.c_size_t),
+				("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+				("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+				("PagefileUsage", ctypes.c_size_t),
+				("PeakPagefileUsage", ctypes.c_size_t)]
+
+def getPeakMemory():
+	"""
+	This definition returns the process peak resident memory in kilobytes.
+
+	:return: Peak resident memory. ( Integer )
+	"""
+
+	if resource is not None:
+		memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+		# Mac Os X reports bytes where Linux reports kilobytes.
+		return sys.platform == "darwin" and memory / 1024 or memory
+
+	if os.name == "nt":
+		getProcessMemoryInfo = ctypes.windll.psapi.GetProcessMemoryInfo
+		getProcessMemoryInfo.argtypes = (ctypes.c_void_p, ctypes.POINTER(ProcessMemoryCounters), ctypes.c_ulong)
+		getCurrentProcess = ctypes.windll.kernel32.GetCurrentProcess
+		getCurrentProcess.restype = ctypes.c_void_p
+		counters = ProcessMemoryCounters()
+		counters.cb = ctypes.sizeof(counters)
+		if getProcessMemoryInfo(getCurrentProcess(), ctypes.byref(counters), counters.cb):
+			return counters.PeakWorkingSetSize / 1024
+	return 0
+
+class TimingsManager(object):
+	"""
+	This class is the **TimingsManager** class, it records the startup phases timings.
+
+	The phases are summed as the timings are recorded while only the latest timings are kept: some blocks
+	are timed again each time the interfaces Models are refreshed.
+	"""
+
+	@core.executionTrace
+	def __init__(self, logSize=Constants.timingsLogSize):
+		"""
+		This method initializes the class.
+
+		:param logSize: Kept timings count. ( Integer )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__logSize = logSize
+		self.__startTime = time.time()
+		self.__timings = collections.deque(maxlen=self.__logSize)
+		self.__phases = {}
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def startTime(self):
+		"""
+		This method is the property for **self.__startTime** attribute.
+
+		:return: self.__startTime. ( Float )
+		"""
+
+		return self.__startTime
+
+	@startTime.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def startTime(self, value):
+		"""
+		This method is the setter method for **self.__startTime** attribute.
+
+		:param value: Attribute value. ( Float )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "startTime"))
+
+	@startTime.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def startTime(self):
+		"""
+		This method is the deleter method for **self.__startTime** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "startTime"))
+
+	@property
+	def timings(self):
+		"""
+		This method is the property for **self.__timings** attribute.
+
+		:return: self.__timings. ( Deque )
+		"""
+
+		return self.__timings
+
+	@timings.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def timings(self, value):
+		"""
+		This method is the setter method for **self.__timings** attribute.
+
+		:param value: Attribute value. ( Deque )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "timings"))
+
+	@timings.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def timings(self):
+		"""
+		This method is the deleter method for **self.__timings** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "timings"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	@core.executionTrace
+	def record(self, phase, name, duration, peakMemoryGrowth=0):
+		"""
+		This method records given timing.
+
+		:param phase: Phase name. ( String )
+		:param name: Timed object name. ( String )
+		:param duration: Wall time in seconds. ( Float )
+		:param peakMemoryGrowth: Peak resident memory growth in kilobytes. ( Integer )
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__timings.append({"phase" : phase,
+								"name" : name or phase,
+								"duration" : duration,
+								"peakMemoryGrowth" : peakMemoryGrowth})
+
+		statistics = self.__phases.setdefault(phase, {"duration" : 0., "peakMemoryGrowth" : 0, "count" : 0})
+		statistics["duration"] += duration
+		statistics["peakMemoryGrowth"] += peakMemoryGrowth
+		statistics["count"] += 1
+		return True
+
+	@contextlib.contextmanager
+	def timing(self, phase, name=None):
+		"""
+		This method is a context manager timing its block.
+
+		:param phase: Phase name. ( String )
+		:param name: Timed object name. ( String )
+		"""
+
+		peakMemory = getPeakMemory()
+		startTime = time.time()
+		try:
+			yield
+		finally:
+			self.record(phase, name, time.time() - startTime, getPeakMemory() - peakMemory)
+
+	@core.executionTrace
+	def clear(self):
+		"""
+		This method clears the recorded timings.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__startTime = time.time()
+		self.__timings.clear()
+		self.__phases = {}
+		return True
+
+	@core.executionTrace
+	def getReport(self):
+		"""
+		This method returns the timings report.
+
+		The phases cover every recorded timing while the kept timings are sorted from the slowest to the fastest.
+
+		:return: Timings report. ( Dictionary )
+		"""
+
+		return {"total" : time.time() - self.__startTime,
+				"peakMemory" : getPeakMemory(),
+				"phases" : dict((phase, dict(statistics)) for phase, statistics in self.__phases.iteritems()),
+				"timings" : sorted(self.__timings, key=lambda timing: timing["duration"], reverse=True)}
+
+	@core.executionTrace
+	def logReport(self, count=Constants.timingsReportCount):
+		"""
+		This method logs the timings report.
+
+		:param count: Slowest timings count to log. ( Integer )
+		:return: Method success. ( Boolean )
+		"""
+
+		report = self.getReport()
+
+		LOGGER.info(Constants.loggingSeparators)
+		LOGGER.info("{0} | Startup time: '{1:.3f}' seconds, peak resident memory: '{2}' kilobytes.".format(
+		self.__class__.__name__, report["total"], report["peakMemory"]))
+		for name, phase in sorted(report["phases"].iteritems(), key=lambda item: item[1]["duration"], reverse=True):
+			LOGGER.info("{0} | '{1}' phase: '{2:.3f}' seconds, '{3}' kilobytes peak memory growth, '{4}' timings.".format(
+			self.__class__.__name__, name, phase["duration"], phase["peakMemoryGrowth"], phase["count"]))
+		for timing in report["timings"][:count]:
+			LOGGER.info("{0} | '{1}' {2}: '{3:.3f}' seconds, '{4}' kilobytes peak memory growth.".format(
+			self.__class__.__name__, timing["name"], timing["phase"], timing["duration"], timing["peakMemoryGrowth"]))
+		LOGGER.info(Constants.loggingSeparators)
+		return True
+
+@contextlib.contextmanager
+def timing(phase, name=None):
+	"""
+	This definition is a context manager timing its block with the global timings manager if it is set.
+
+	:param phase: Phase name. ( String )
+	:param name: Timed object name. ( String )
+	"""
+
+	if RuntimeGlobals.timingsManager is None:
+		yield
+		return
+
+	with RuntimeGlobals.timingsManager.timing(phase, name):
+		yield
@@ -0,0 +1,488 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**usageManager.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Usage Manager module.
+
+**Others:**
+	The interfaces executions are appended to a JSON lines file by a background writer thread so that recording
+	an execution never blocks the Ui. The file is compacted into one record per interface once it holds
+	too many records, the file is shared by the concurrent Maya sessions thus the appends and the compaction
+	are guarded by an advisory lock file. The file is only accessed by the writer thread outside of the lock
+	guarding the in memory usages, the records that cannot be appended are kept and retried.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import functools
+import json
+import logging
+import os
+import Queue
+import threading
+import time
+from PyQt4.QtCore import QTimer
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+import snippets.common
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "UsageManager", "prewarmModules"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class UsageManager(object):
+	"""
+	This class is the **UsageManager** class, it stores the interfaces executions counts, last execution time
+	and execution durations.
+	"""
+
+	@core.executionTrace
+	def __init__(self, file=None, compactionThreshold=Constants.usageCompactionThreshold):
+		"""
+		This method initializes the class.
+
+		:param file: Usage file. ( String )
+		:param compactionThreshold: Records count triggering the file compaction. ( Integer )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__file = file
+		self.__compactionThreshold = None
+		self.compactionThreshold = compactionThreshold
+
+		self.__usages = {}
+		# Usages written into the file, they drive the compaction threshold.
+		self.__writtenUsages = {}
+		self.__records = 0
+		# Records waiting for the file lock.
+		self.__pendingRecords = []
+
+		# The in memory usages lock is never held during file accesses.
+		self.__lock = threading.Lock()
+		self.__fileLock = threading.Lock()
+		self.__queue = Queue.Queue()
+		self.__thread = None
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def file(self):
+		"""
+		This method is the property for **self.__file** attribute.
+
+		:return: self.__file. ( String )
+		"""
+
+		return self.__file
+
+	@file.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def file(self, value):
+		"""
+		This method is the setter method for **self.__file** attribute.
+
+		:param value: Attribute value. ( String )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "file"))
+
+	@file.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def file(self):
+		"""
+		This method is the deleter method for **self.__file** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "file"))
+
+	@property
+	def compactionThreshold(self):
+		"""
+		This method is the property for **self.__compactionThreshold** attribute.
+
+		:return: self.__compactionThreshold. ( Integer )
+		"""
+
+		return self.__compactionThreshold
+
+	@compactionThreshold.setter
+	@foundations.exceptions.exceptionsHandler(None, False, AssertionError)
+	def compactionThreshold(self, value):
+		"""
+		This method is the setter method for **self.__compactionThreshold** attribute.
+
+		:param value: Attribute value. ( Integer )
+		"""
+
+		if value is not None:
+			assert type(value) is int, "'{0}' Attribute: '{1}' type is not 'int'!".format("compactionThreshold", value)
+			assert value > 0, "'{0}' Attribute: '{1}' need to be exactly positive!".format("compactionThreshold", value)
+		self.__compactionThreshold = value
+
+	@compactionThreshold.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def compactionThreshold(self):
+		"""
+		This method is the deleter method for **self.__compactionThreshold** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "compactionThreshold"))
+
+	@property
+	def usages(self):
+		"""
+		This method is the property for **self.__usages** attribute.
+
+		:return: self.__usages. ( Dictionary )
+		"""
+
+		return self.__usages
+
+	@usages.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def usages(self, value):
+		"""
+		This method is the setter method for **self.__usages** attribute.
+
+		:param value: Attribute value. ( Dictionary )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "usages"))
+
+	@usages.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def usages(self):
+		"""
+		This method is the deleter method for **self.__usages** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "usages"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def __mergeRecord(self, usages, record):
+		"""
+		This method merges given record into given usages.
+
+		:param usages: Usages. ( Dictionary )
+		:param record: Record. ( Dictionary )
+		"""
+
+		usage = usages.setdefault((record["module"], record["interface"]), {"count" : 0, "lastUsed" : 0., "duration" : 0.})
+		usage["count"] += record["count"]
+		usage["lastUsed"] = max(usage["lastUsed"], record["lastUsed"])
+		usage["duration"] += record["duration"]
+
+	def __write(self):
+		"""
+		This method is the writer thread loop appending the queued records to the usage file.
+		"""
+
+		while True:
+			try:
+				# The pending records are retried when no record is queued.
+				record = self.__queue.get(timeout=self.__pendingRecords and Constants.usageLockWait or None)
+			except Queue.Empty:
+				self.__appendRecords()
+				continue
+
+			try:
+				if record is None:
+					self.__appendRecords()
+					return
+
+				self.__pendingRecords.append(record)
+				self.__appendRecords()
+				if self.__records >= max(self.__compactionThreshold, 2 * len(self.__writtenUsages)):
+					self.compact()
+			finally:
+				self.__queue.task_done()
+
+	@foundations.exceptions.exceptionsHandler(None, False, IOError, OSError)
+	def __appendRecords(self):
+		"""
+		This method appends the pending records to the usage file, they are kept if the file lock cannot be acquired.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if not self.__pendingRecords:
+			return True
+
+		with self.__fileLock:
+			with snippets.common.lockFile(self.__file, wait=Constants.usageLockWait) as locked:
+				if not locked:
+					LOGGER.warning("!> {0} | '{1}' file lock cannot be acquired, keeping '{2}' records!".format(
+					self.__class__.__name__, self.__file, len(self.__pendingRecords)))
+					return False
+
+				with open(self.__file, "a") as file:
+					file.write("".join("{0}\n".format(json.dumps(record)) for record in self.__pendingRecords))
+			for record in self.__pendingRecords:
+				self.__mergeRecord(self.__writtenUsages, record)
+			self.__records += len(self.__pendingRecords)
+			self.__pendingRecords = []
+		return True
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, IOError)
+	def load(self):
+		"""
+		This method loads the usage file, the malformed records are skipped.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if not self.__file or not os.path.exists(self.__file):
+			return False
+
+		records = []
+		with self.__fileLock:
+			with open(self.__file) as file:
+				for line in file:
+					try:
+						record = json.loads(line)
+						self.__mergeRecord(self.__writtenUsages, record)
+					except (ValueError, KeyError, TypeError):
+						continue
+					records.append(record)
+			self.__records = len(records)
+
+		with self.__lock:
+			for record in records:
+				self.__mergeRecord(self.__usages, record)
+		records = len(records)
+
+		LOGGER.debug("> Loaded '{0}' usage records from '{1}' file.".format(records, self.__file))
+		return True
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, IOError, OSError)
+	def compact(self):
+		"""
+		This method rewrites the usage file with one record per interface.
+
+		The file is read again under the lock so that the records appended by the other Maya sessions are kept,
+		the compaction is skipped if another session holds the lock.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if not self.__file or not os.path.exists(self.__file):
+			return False
+
+		with self.__fileLock:
+			with snippets.common.lockFile(self.__file) as locked:
+				if not locked:
+					LOGGER.debug("> '{0}' file is locked by another session, skipping compaction.".format(self.__file))
+					return False
+
+				usages = {}
+				with open(self.__file) as file:
+					for line in file:
+						try:
+							self.__mergeRecord(usages, json.loads(line))
+						except (ValueError, KeyError, TypeError):
+							continue
+
+				records = [{"module" : module, "interface" : interface, "count" : usage["count"],
+							"lastUsed" : usage["lastUsed"], "duration" : usage["duration"]}
+							for (module, interface), usage in sorted(usages.iteritems())]
+				snippets.common.writeFile(self.__file, "".join("{0}\n".format(json.dumps(record)) for record in records))
+			self.__writtenUsages = usages
+			self.__records = len(records)
+
+		LOGGER.debug("> Compacted '{0}' file into '{1}' usage records.".format(self.__file, len(records)))
+		return True
+
+	@core.executionTrace
+	def start(self):
+		"""
+		This method starts the writer thread.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if self.__thread is not None and self.__thread.isAlive():
+			return False
+
+		self.__thread = threading.Thread(target=self.__write, name=self.__class__.__name__)
+		self.__thread.setDaemon(True)
+		self.__thread.start()
+		return True
+
+	@core.executionTrace
+	def stop(self):
+		"""
+		This method writes the queued records and stops the writer thread.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		if self.__thread is None:
+			return False
+
+		self.__queue.put(None)
+		self.__thread.join()
+		self.__thread = None
+		return True
+
+	@core.executionTrace
+	def flush(self):
+		"""
+		This method blocks until the queued records are written, the records waiting for the file lock are
+		retried by the writer thread.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__thread is not None and self.__queue.join()
+		return True
+
+	@core.executionTrace
+	def recordExecution(self, module, interface, duration=0.):
+		"""
+		This method records given interface execution, the record is written by the writer thread.
+
+		:param module: Module name. ( String )
+		:param interface: Interface name. ( String )
+		:param duration: Execution duration in seconds. ( Float )
+		:return: Method success. ( Boolean )
+		"""
+
+		record = {"module" : module, "interface" : interface, "count" : 1, "lastUsed" : time.time(), "duration" : duration}
+		with self.__lock:
+			self.__mergeRecord(self.__usages, record)
+
+		if self.__file:
+			self.start()
+			self.__queue.put(record)
+		return True
+
+	@core.executionTrace
+	def getUsage(self, module, interface):
+		"""
+		This method returns given interface usage.
+
+		:param module: Module name. ( String )
+		:param interface: Interface name. ( String )
+		:return: Executions count, last execution time and mean execution duration. ( Dictionary )
+		"""
+
+		usage = self.__usages.get((module, interface))
+		if usage is None:
+			return {"count" : 0, "lastUsed" : None, "meanDuration" : None}
+
+		return {"count" : usage["count"],
+				"lastUsed" : usage["lastUsed"],
+				"meanDuration" : usage["duration"] / usage["count"]}
+
+	@core.executionTrace
+	def getCount(self, module, interface):
+		"""
+		This method returns given interface executions count.
+
+		:param module: Module name. ( String )
+		:param interface: Interface name. ( String )
+		:return: Executions count. ( Integer )
+		"""
+
+		usage = self.__usages.get((module, interface))
+		return usage and usage["count"] or 0
+
+	@core.executionTrace
+	def getRankedInterfaces(self, count=None):
+		"""
+		This method returns the interfaces sorted from the most executed and the most recently executed one.
+
+		:param count: Interfaces count. ( Integer )
+		:return: Modules names, interfaces names. ( List )
+		"""
+
+		with self.__lock:
+			interfaces = sorted(self.__usages, key=lambda key: (self.__usages[key]["count"],
+																self.__usages[key]["lastUsed"]), reverse=True)
+		return count is None and interfaces or interfaces[:count]
+
+@core.executionTrace
+def prewarmModules(modulesManager, usageManager, count=Constants.usagePrewarmCount, delay=Constants.usagePrewarmDelay):
+	"""
+	This definition imports the modules of the most executed interfaces one at a time from the Qt event loop,
+	the Ui stays responsive between two imports.
+
+	:param modulesManager: Modules Manager. ( ModulesManager )
+	:param usageManager: Usage Manager. ( UsageManager )
+	:param count: Modules count. ( Integer )
+	:param delay: Delay before the first import in milliseconds. ( Integer )
+	:return: Definition success. ( Boolean )
+	"""
+
+	names = []
+	for module, interface in usageManager.getRankedInterfaces():
+		if len(names) == count:
+			break
+
+		if module in names or not module in modulesManager:
+			continue
+
+		names.append(module)
+
+	def importModule(names):
+		"""
+		This definition imports the first given module and schedules the next one.
+
+		:param names: Modules names. ( List )
+		"""
+
+		module = modulesManager[names.pop(0)]
+		if module is not None and not module.import_.imported:
+			LOGGER.debug("> Prewarming '{0}' module.".format(module.name))
+			try:
+				module.import_.load()
+			except Exception as error:
+				LOGGER.warning("!> {0} | '{1}' module cannot be prewarmed: '{2}'!".format(__name__, module.name, error))
+
+		names and QTimer.singleShot(0, functools.partial(importModule, names))
+
+	names and QTimer.singleShot(delay, functools.partial(importModule, names))
+	return True
@@ -27,9 +27,11 @@ import logging
 import maya.cmds as cmds
 import maya.mel as mel
 import re
+import time
 from PyQt4 import uic
 from PyQt4.QtCore import QString
 from PyQt4.QtCore import Qt
+from PyQt4.QtGui import QCompleter
 from PyQt4.QtGui import QStringListModel
 from PyQt4.QtGui import QCursor
 
@@ -40,10 +42,14 @@ import foundations.common
 import foundations.core as core
 import foundations.exceptions
 import foundations.strings as strings
+import snippets.tracer as tracer
 import snippets.ui.common
 from snippets.globals.constants import Constants
 from snippets.globals.runtimeGlobals import RuntimeGlobals
 from snippets.globals.uiConstants import UiConstants
+from snippets.managers.profilesManager import profile
+from snippets.managers.timingsManager import timing
+from snippets.searchEngine import SearchEngine
 from snippets.ui.models import Interface
 from snippets.ui.models import InterfacesModel
 from snippets.ui.widgets.search_QLineEdit import Search_QLineEdit
@@ -64,7 +70,8 @@ LOGGER = logging.getLogger(Constants.logger)
 
 RuntimeGlobals.popupUiFile = snippets.ui.common.getResourcePath(UiConstants.popupUiFile)
 if foundations.common.pathExists(RuntimeGlobals.popupUiFile):
-	Ui_Popup_Setup, Ui_Popup_Type = uic.loadUiType(RuntimeGlobals.popupUiFile)
+	with timing("ui", UiConstants.popupUiFile):
+		Ui_Popup_Setup, Ui_Popup_Type = uic.loadUiType(RuntimeGlobals.popupUiFile)
 else:
 	error = "'{0}' Ui file is not available!".format(RuntimeGlobals.popupUiFile)
 	snippets.ui.common.messageBox("Error", "Error", error)
@@ -79,12 +86,13 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 	"""
 
 	@core.executionTrace
-	def __init__(self, parent=None, modulesManager=RuntimeGlobals.modulesManager):
+	def __init__(self, parent=None, modulesManager=RuntimeGlobals.modulesManager, usageManager=RuntimeGlobals.usageManager):
 		"""
 		This method initializes the class.
 		
 		:param parent: Parent object. ( QObject )
 		:param modulesManager: Modules Manager. ( ModulesManager )
+		:param usageManager: Usage Manager. ( UsageManager )
 		"""
 
 		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -92,15 +100,19 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		Ui_Popup_Type.__init__(self, parent)
 		Ui_Popup_Setup.__init__(self)
 
-		self.setupUi(self)
+		with timing("ui", self.__class__.__name__):
+			self.setupUi(self)
 
 		# --- Setting class attributes. ---
 		self.__container = parent
 		self.__modulesManager = modulesManager
+		self.__usageManager = usageManager
 
 		self.__model = None
 		self.__view = None
 
+		self.__searchEngine = SearchEngine()
+
 		# --- Initialize Ui. ---
 		self.__initializeUI()
 
@@ -167,6 +179,36 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 
 		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("modulesManager"))
 
+	@property
+	def usageManager(self):
+		"""
+		This method is the property for **self.__usageManager** attribute.
+
+		:return: self.__usageManager. ( UsageManager )
+		"""
+
+		return self.__usageManager
+
+	@usageManager.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def usageManager(self, value):
+		"""
+		This method is the setter method for **self.__usageManager** attribute.
+
+		:param value: Attribute value. ( UsageManager )
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is read only!".format("usageManager"))
+
+	@usageManager.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def usageManager(self):
+		"""
+		This method is the deleter method for **self.__usageManager** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("usageManager"))
+
 	@property
 	def model(self):
 		"""
@@ -199,6 +241,38 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		raise foundations.exceptions.ProgrammingError(
 		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "model"))
 
+	@property
+	def searchEngine(self):
+		"""
+		This method is the property for **self.__searchEngine** attribute.
+
+		:return: self.__searchEngine. ( SearchEngine )
+		"""
+
+		return self.__searchEngine
+
+	@searchEngine.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def searchEngine(self, value):
+		"""
+		This method is the setter method for **self.__searchEngine** attribute.
+
+		:param value: Attribute value. ( SearchEngine )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "searchEngine"))
+
+	@searchEngine.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def searchEngine(self):
+		"""
+		This method is the deleter method for **self.__searchEngine** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "searchEngine"))
+
 	#******************************************************************************************************************
 	#***	Class methods.
 	#******************************************************************************************************************
@@ -228,11 +302,14 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		self.Interfaces_lineEdit.setObjectName("Interfaces_lineEdit")
 		# self.Interfaces_lineEdit.setPlaceholderText("Enter Interface Name...")
 		self.Popup_Form_gridLayout.addWidget(self.Interfaces_lineEdit)
+		# The completions are ranked by the search engine.
+		self.Interfaces_lineEdit.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
 
 		self.setInterfaces()
 
 		# Signals / Slots.
 		self.Interfaces_lineEdit.returnPressed.connect(self.__Interfaces_lineEdit__returnPressed)
+		self.Interfaces_lineEdit.searchRequested.connect(self.__Interfaces_lineEdit__searchRequested)
 		self.Interfaces_lineEdit.completer.activated.connect(self.__Interfaces_lineEdit_completer__activated)
 
 	@core.executionTrace
@@ -243,6 +320,22 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 
 		self.__triggerInterface(self.Interfaces_lineEdit.text())
 
+	@core.executionTrace
+	def __Interfaces_lineEdit__searchRequested(self, text):
+		"""
+		This method is triggered when **Interfaces_lineEdit** Widget requests a search.
+
+		:param text: Search text. ( QString )
+		"""
+
+		name = strings.encode(text)
+		# Browsing the completions sets the line edit text to an Interface name.
+		if name in self.__model:
+			return
+
+		self.setCompletions(name)
+		self.Interfaces_lineEdit.hasFocus() and self.Interfaces_lineEdit.completer.complete()
+
 	@core.executionTrace
 	def __Interfaces_lineEdit_completer__activated(self, text):
 		"""
@@ -261,8 +354,8 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		:param name: Interface name. ( String )
 		"""
 		
-		pattern = RuntimeGlobals.popupPattern = name
-		interface = self.getInterface(strings.encode("^{0}$".format(pattern)))
+		RuntimeGlobals.popupPattern = name
+		interface = self.getInterface(strings.encode(name))
 		if not interface:
 			return
 
@@ -285,22 +378,44 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		except Exception:
 			return
 
-		self.__model.clear()
-
 		interfaces = []
-		for name, module in self.__modulesManager:
-			if not module.interfaces:
-				continue
-
-			for interface in module.interfaces:
-				name = strings.getNiceName(self.getMethodName(interface))
-				if re.search(pattern, name):
-					interfaces.append(name)
-					self.__model.registerInterface(Interface(name=name, attribute=interface, module=module))
-		self.Interfaces_lineEdit.completer.setModel(QStringListModel(sorted(interfaces)))
+		with timing("model"):
+			self.__searchEngine.clear()
+			for name, module in self.__modulesManager:
+				if not module.interfaces:
+					continue
+
+				for interface in module.interfaces:
+					name = strings.getNiceName(self.getMethodName(interface))
+					if re.search(pattern, name):
+						interfaces.append(Interface(name=name, attribute=interface, module=module))
+						self.__searchEngine.addDocument(name,
+														name,
+														module.name,
+														module.specifications.get(interface, {}).get("documentation"))
+						self.__usageManager and \
+						self.__searchEngine.setUsage(name, self.__usageManager.getCount(module.name, interface))
+			self.__model.setInterfaces(interfaces)
+		self.setCompletions()
 		return True
 
 	@core.executionTrace
+	def setCompletions(self, text=None):
+		"""
+		This method sets the **Interfaces_lineEdit** Widget completions with the Interfaces ranked against given text.
+
+		:param text: Search text. ( String )
+		:return: Method success. ( Boolean )
+		"""
+
+		if text:
+			names = self.__searchEngine.search(text)
+		else:
+			names = self.__searchEngine.search("", len(self.__searchEngine))
+		self.Interfaces_lineEdit.completer.setModel(QStringListModel(names))
+		return True
+
+	@tracer.executionTrace
 	def getMethodName(self, name):
 		"""
 		This method gets the method name from the Interface.
@@ -312,21 +427,20 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		return "{0}{1}".format(name[1].lower(), name[2:])
 
 	@core.executionTrace
-	def getInterface(self, pattern):
+	def getInterface(self, name):
 		"""
-		This method returns the Interface with given name.
+		This method returns the Interface with given name or the best ranked Interface matching given name.
 
-		:param pattern: Interface name. ( String )
-		:param flags: Regex filtering flags. ( Integer )
-		:return: Method success. ( Boolean )
+		:param name: Interface name or search text. ( String )
+		:return: Interface. ( Interface )
 		"""
 
-		for interface in self.__model:
-			if not hasattr(interface, "attribute"):
-				continue
+		interface = self.__model[name]
+		if hasattr(interface, "attribute"):
+			return interface
 
-			if re.search(pattern, interface.name):
-				return interface
+		for name in self.__searchEngine.search(name, 1):
+			return self.__model[name]
 
 	@core.executionTrace
 	@foundations.exceptions.exceptionsHandler(None, False, Exception)
@@ -347,5 +461,9 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		LOGGER.info("{0} | Executing '{1}' Interface from '{2}' Module!".format(self.__class__.__name__,
 																			method,
 																			module.name))
-		module.import_.__dict__[method]()
+		startTime = time.time()
+		with profile(module.name, method):
+			module.import_.getAttribute(method)()
+		self.__searchEngine.recordExecution(interface.name)
+		self.__usageManager and self.__usageManager.recordExecution(module.name, method, time.time() - startTime)
 		return True
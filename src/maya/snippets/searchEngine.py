@@ -0,0 +1,573 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**searchEngine.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Search engine module.
+
+**Others:**
+	The documents are indexed by characters of their name and module name, by bigrams, trigrams and words starts
+	characters of their name, trigrams of their module name, and by the words of their documentation. A query is
+	matched as a subsequence of the document name or module name, contiguous matches, words starts and prefixes
+	score higher, the execution counts boost the ranking.
+	The documents are scored by passes of decreasing score bound, from the names starting with the query to the
+	module names matches, and by decreasing rank within a pass so that each pass stops as soon as no remaining
+	document can enter the best ranked ones. The documents not matching a query are skipped on the next keystrokes.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import bisect
+import heapq
+import itertools
+import logging
+import math
+import re
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+import foundations.exceptions
+import snippets.tracer as tracer
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+			"WORDS_SEPARATORS",
+			"getBigrams",
+			"getTrigrams",
+			"getInitials",
+			"getSubsequencePattern",
+			"getSubsequenceScore",
+			"SearchEngine"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+WORDS_SEPARATORS = re.compile(r"[^\w]+")
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def getBigrams(text):
+	"""
+	This definition returns given text bigrams.
+
+	:param text: Text. ( String )
+	:return: Bigrams. ( Set )
+	"""
+
+	return set(text[i:i + 2] for i in xrange(len(text) - 1))
+
+def getTrigrams(text):
+	"""
+	This definition returns given text trigrams.
+
+	:param text: Text. ( String )
+	:return: Trigrams. ( Set )
+	"""
+
+	return set(text[i:i + 3] for i in xrange(len(text) - 2))
+
+def getInitials(text):
+	"""
+	This definition returns given text words starts characters.
+
+	:param text: Text. ( String )
+	:return: Characters. ( Set )
+	"""
+
+	return set(character for i, character in enumerate(text) if i == 0 or not text[i - 1].isalnum())
+
+def getSubsequencePattern(query):
+	"""
+	This definition returns a regular expression matching the texts having given query as a subsequence.
+
+	:param query: Lower case query without spaces. ( String )
+	:return: Pattern. ( RegexObject )
+	"""
+
+	return re.compile("".join("[^{0}]*{0}".format(re.escape(character)) for character in query))
+
+@tracer.executionTrace
+def getSubsequenceScore(query, text):
+	"""
+	This definition returns the score of given query as a subsequence of given text.
+
+	Contiguous characters and words starts score higher, gaps are penalized and a prefix match gets a bonus.
+
+	:param query: Lower case query without spaces. ( String )
+	:param text: Lower case text. ( String )
+	:return: Score or None if the query is not a subsequence of the text. ( Float )
+	"""
+
+	score = 0.
+	position = 0
+	previous = -2
+	for character in query:
+		index = text.find(character, position)
+		if index == -1:
+			return
+
+		if index == previous + 1:
+			score += 3.
+		elif index == 0 or not text[index - 1].isalnum():
+			score += 2.
+		else:
+			score += 1. - min(index - position, 5) * 0.1
+		previous = index
+		position = index + 1
+
+	if text.startswith(query):
+		score += 2.
+	# Shorter texts are better matches.
+	return score - len(text) * 0.01
+
+class SearchEngine(object):
+	"""
+	This class is the **SearchEngine** class.
+	"""
+
+	@core.executionTrace
+	def __init__(self):
+		"""
+		This method initializes the class.
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__documents = {}
+		self.__usages = {}
+
+		self.__characters = {}
+		self.__modulesCharacters = {}
+		self.__bigrams = {}
+		self.__trigrams = {}
+		self.__initials = {}
+		self.__words = {}
+		self.__sortedWords = []
+		self.__sortedNames = []
+
+		self.__ranking = None
+		self.__mismatches = ("", set())
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def documents(self):
+		"""
+		This method is the property for **self.__documents** attribute.
+
+		:return: self.__documents. ( Dictionary )
+		"""
+
+		return self.__documents
+
+	@documents.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def documents(self, value):
+		"""
+		This method is the setter method for **self.__documents** attribute.
+
+		:param value: Attribute value. ( Dictionary )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "documents"))
+
+	@documents.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def documents(self):
+		"""
+		This method is the deleter method for **self.__documents** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "documents"))
+
+	@property
+	def usages(self):
+		"""
+		This method is the property for **self.__usages** attribute.
+
+		:return: self.__usages. ( Dictionary )
+		"""
+
+		return self.__usages
+
+	@usages.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def usages(self, value):
+		"""
+		This method is the setter method for **self.__usages** attribute.
+
+		:param value: Attribute value. ( Dictionary )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "usages"))
+
+	@usages.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def usages(self):
+		"""
+		This method is the deleter method for **self.__usages** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "usages"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	@core.executionTrace
+	def __len__(self):
+		"""
+		This method reimplements the :meth:`object.__len__` method.
+
+		:return: Documents count. ( Integer )
+		"""
+
+		return len(self.__documents)
+
+	@core.executionTrace
+	def clear(self):
+		"""
+		This method removes the documents, the usages are kept.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__documents = {}
+		self.__characters = {}
+		self.__modulesCharacters = {}
+		self.__bigrams = {}
+		self.__trigrams = {}
+		self.__initials = {}
+		self.__words = {}
+		self.__sortedWords = []
+		self.__sortedNames = []
+		self.__ranking = None
+		self.__mismatches = ("", set())
+		return True
+
+	@tracer.executionTrace
+	def addDocument(self, key, name, module=None, documentation=None):
+		"""
+		This method indexes given document.
+
+		:param key: Document key. ( Object )
+		:param name: Document name. ( String )
+		:param module: Document module name. ( String )
+		:param documentation: Document documentation. ( String )
+		:return: Method success. ( Boolean )
+		"""
+
+		key in self.__documents and self.removeDocument(key)
+		self.__ranking = None
+		self.__mismatches = ("", set())
+
+		name, module = name.lower(), (module or "").lower()
+		self.__documents[key] = (name, module)
+		bisect.insort(self.__sortedNames, (name, key))
+
+		for character in set(name):
+			self.__characters.setdefault(character, set()).add(key)
+
+		for character in set(module):
+			self.__modulesCharacters.setdefault(character, set()).add(key)
+
+		for bigram in getBigrams(name):
+			self.__bigrams.setdefault(bigram, set()).add(key)
+
+		for trigram in getTrigrams(name) | getTrigrams(module):
+			self.__trigrams.setdefault(trigram, set()).add(key)
+
+		for character in getInitials(name):
+			self.__initials.setdefault(character, set()).add(key)
+
+		for word in set(WORDS_SEPARATORS.split((documentation or "").lower())):
+			if not word:
+				continue
+
+			if not word in self.__words:
+				bisect.insort(self.__sortedWords, word)
+			self.__words.setdefault(word, set()).add(key)
+		return True
+
+	@core.executionTrace
+	def removeDocument(self, key):
+		"""
+		This method removes given document from the index.
+
+		:param key: Document key. ( Object )
+		:return: Method success. ( Boolean )
+		"""
+
+		if not key in self.__documents:
+			return False
+
+		del(self.__sortedNames[bisect.bisect_left(self.__sortedNames, (self.__documents[key][0], key))])
+		del(self.__documents[key])
+		self.__ranking = None
+		self.__mismatches = ("", set())
+		for index in (self.__characters,
+					self.__modulesCharacters,
+					self.__bigrams,
+					self.__trigrams,
+					self.__initials,
+					self.__words):
+			for token in [token for token, keys in index.iteritems() if key in keys]:
+				index[token].discard(key)
+				if index[token]:
+					continue
+
+				del(index[token])
+				if index is self.__words:
+					self.__sortedWords.remove(token)
+		return True
+
+	@core.executionTrace
+	def setUsage(self, key, count):
+		"""
+		This method sets given document executions count.
+
+		:param key: Document key. ( Object )
+		:param count: Executions count. ( Integer )
+		:return: Method success. ( Boolean )
+		"""
+
+		if count:
+			self.__usages[key] = count
+		else:
+			self.__usages.pop(key, None)
+		self.__ranking = None
+		return True
+
+	@core.executionTrace
+	def recordExecution(self, key, count=1):
+		"""
+		This method records given document execution, the executions boost the document ranking.
+
+		:param key: Document key. ( Object )
+		:param count: Executions count. ( Integer )
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__usages[key] = self.__usages.get(key, 0) + count
+		self.__ranking = None
+		return True
+
+	@core.executionTrace
+	def getWordsDocuments(self, prefix):
+		"""
+		This method returns the documents with a documentation word starting with given prefix.
+
+		:param prefix: Word prefix. ( String )
+		:return: Documents keys. ( Set )
+		"""
+
+		keys = set()
+		index = bisect.bisect_left(self.__sortedWords, prefix)
+		while index < len(self.__sortedWords) and self.__sortedWords[index].startswith(prefix):
+			keys.update(self.__words[self.__sortedWords[index]])
+			index += 1
+		return keys
+
+	@core.executionTrace
+	def getRanking(self):
+		"""
+		This method returns the documents usages boosts, the documents ranks, the documents keys sorted
+		by decreasing rank along their negated ranks and the longest name length penalty.
+
+		A document rank is its usage boost minus its name length penalty.
+
+		:return: Usages boosts, ranks, documents keys, negated ranks, longest name penalty. ( Tuple )
+		"""
+
+		if self.__ranking is None:
+			usageWeight = Constants.searchEngineUsageWeight
+			boosts = dict((key, usageWeight * math.log(1 + self.__usages.get(key, 0))) for key in self.__documents)
+			ranks = dict((key, boost - len(self.__documents[key][0]) * 0.01) for key, boost in boosts.iteritems())
+			order = sorted(ranks, key=ranks.__getitem__, reverse=True)
+			self.__ranking = (boosts,
+							ranks,
+							order,
+							[-ranks[key] for key in order],
+							max([len(name) for name, module in self.__documents.itervalues()] or [0]) * 0.01)
+		return self.__ranking
+
+	@core.executionTrace
+	def search(self, query, count=Constants.searchEngineResultsCount):
+		"""
+		This method searches the documents matching given query and returns the best ranked ones.
+
+		:param query: Query. ( String )
+		:param count: Results count. ( Integer )
+		:return: Documents keys from the best ranked. ( List )
+		"""
+
+		query = query.lower().strip()
+		compactQuery = query.replace(" ", "")
+		if not compactQuery:
+			return sorted(self.__documents, key=lambda key: (-self.__usages.get(key, 0), self.__documents[key][0]))[:count]
+
+		if count < 1:
+			return []
+
+		# Intersecting from the rarest token.
+		namesCandidates, modulesCandidates = [set.intersection(*sorted((index.get(character, set()) \
+		for character in set(compactQuery)), key=len)) for index in (self.__characters, self.__modulesCharacters)]
+
+		# The documents not matching a query do not match the queries it prefixes, i.e. the next keystrokes.
+		previousQuery, mismatches = self.__mismatches
+		if previousQuery and compactQuery.startswith(previousQuery):
+			namesCandidates -= mismatches
+			modulesCandidates -= mismatches
+		else:
+			mismatches = set()
+		self.__mismatches = (compactQuery, mismatches)
+		candidates = namesCandidates | modulesCandidates
+
+		contiguous = set()
+		if len(query) >= 3:
+			contiguous = set.intersection(*sorted((self.__trigrams.get(trigram, set()) \
+			for trigram in getTrigrams(query)), key=len))
+
+		words = [(len(word) * 0.5, self.getWordsDocuments(word)) for word in query.split() if len(word) >= 2]
+
+		prefixed = set()
+		index = bisect.bisect_left(self.__sortedNames, (compactQuery,))
+		while index < len(self.__sortedNames) and self.__sortedNames[index][0].startswith(compactQuery):
+			prefixed.add(self.__sortedNames[index][1])
+			index += 1
+
+		match = getSubsequencePattern(compactQuery).match
+		documentsNames = self.__documents
+		boosts, ranks, order, negatedRanks, penalty = self.getRanking()
+		scores = {}
+		scored = set()
+		best = []
+
+		def scoreDocuments(sets, bound, slack):
+			sets = sorted(sets, key=len)
+			# Once the best ranked documents are known, only the documents ranked above the worst of them can enter.
+			if len(best) == count:
+				reachable = bisect.bisect_left(negatedRanks, bound + slack - best[0] - 1e-9)
+				if reachable < len(sets[0]):
+					keys = set(itertools.islice(order, reachable))
+					keys.intersection_update(*sets)
+					keys -= scored
+					orderedKeys = itertools.ifilter(keys.__contains__, itertools.islice(order, reachable))
+				else:
+					orderedKeys = sorted(set.intersection(*sets) - scored, key=ranks.__getitem__, reverse=True)
+			else:
+				keys = set.intersection(*sets)
+				# Filtering the documents order is cheaper than sorting many keys.
+				if len(keys) * 4 > len(order):
+					orderedKeys = itertools.ifilter(keys.__contains__, order)
+				else:
+					orderedKeys = sorted(keys, key=ranks.__getitem__, reverse=True)
+
+			# The tolerance stops on the documents tying with the worst best ranked one despite rounding errors.
+			threshold = None
+			if len(best) == count:
+				threshold = best[0] + 1e-9 - bound - slack
+			for key in orderedKeys:
+				if threshold is not None and ranks[key] <= threshold:
+					break
+
+				if key in scored:
+					continue
+
+				scored.add(key)
+				score = None
+				if key in candidates:
+					name, module = documentsNames[key]
+					if match(name):
+						score = getSubsequenceScore(compactQuery, name)
+					elif match(module):
+						score = getSubsequenceScore(compactQuery, module) * 0.5
+					else:
+						mismatches.add(key)
+				if score is not None and key in contiguous:
+					score += len(query)
+				for bonus, documents in words:
+					if key in documents:
+						score = (score or 0.) + bonus
+				if score is None:
+					continue
+
+				scores[key] = score = score + boosts[key]
+				if len(best) < count:
+					heapq.heappush(best, score)
+				elif score > best[0]:
+					heapq.heapreplace(best, score)
+				else:
+					continue
+				if len(best) == count:
+					threshold = best[0] + 1e-9 - bound - slack
+
+		# The documents having all the words come first, the documents missing a word lose at least the smallest
+		# word bonus and the documents without any word get none.
+		wordsPasses = [(None, 0.)]
+		if words:
+			bonuses, documents = zip(*words)
+			wordsPasses = [(set.intersection(*documents), sum(bonuses)),
+							(set().union(*documents), sum(bonuses) - min(bonuses)),
+							(None, 0.)]
+
+		# The first character cannot extend a contiguous run and scores at most 1 out of a word start: a name scores
+		# at most 3 * len(query) - 1 without the prefix bonus and 3 * len(query) + 1 with it, minus its length penalty
+		# already in its rank. A name missing a query bigram, or a trigram, breaks at least one contiguous run.
+		# The module names scores are halved and not penalized by the name length, a slack covers them in their own
+		# passes.
+		initials = self.__initials.get(compactQuery[0], set())
+		if len(query) >= 3 and not " " in query:
+			joined = contiguous
+		elif len(compactQuery) >= 2:
+			joined = set.intersection(*sorted((self.__bigrams.get(bigram, set()) \
+			for bigram in getBigrams(compactQuery)), key=len))
+		else:
+			joined = namesCandidates
+		bound = 3. * len(compactQuery) - 1.
+		moduleBound = 1.5 * len(compactQuery) + 0.5
+		for sets, keysBound, slack in (((prefixed, contiguous), bound + 2. + len(query), 0.),
+										((prefixed,), bound + 2., 0.),
+										((contiguous, initials), bound + len(query), 0.),
+										((contiguous,), bound - 1. + len(query), 0.),
+										((namesCandidates, joined, initials), bound, 0.),
+										((namesCandidates, initials), bound - 1., 0.),
+										((namesCandidates, joined), bound - 1., 0.),
+										((namesCandidates,), bound - 2., 0.),
+										((modulesCandidates, contiguous), moduleBound + len(query), penalty),
+										((modulesCandidates,), moduleBound, penalty)):
+			for wordsKeys, wordsBonus in wordsPasses:
+				scoreDocuments(wordsKeys is None and sets or sets + (wordsKeys,), keysBound + wordsBonus, slack)
+		for wordsKeys, wordsBonus in wordsPasses[:-1]:
+			scoreDocuments((wordsKeys,), wordsBonus, penalty)
+
+		return heapq.nlargest(count, scores, key=scores.__getitem__)
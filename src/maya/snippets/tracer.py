@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**tracer.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Tracer module.
+
+**Others:**
+	The :func:`executionTrace` decorator is meant for the hot paths: it registers and returns the decorated object
+	unchanged so that an untraced call costs nothing. Enabling the tracer replaces the registered objects
+	of the imported :mod:`snippets` modules with wrappers feeding :func:`foundations.core.executionTrace`
+	and a sampling profiler, disabling it restores the original objects.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import functools
+import inspect
+import logging
+import sys
+import time
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.core as core
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+			"TRACING",
+			"TRACED_OBJECTS",
+			"TRACING_WRAPPERS",
+			"STATISTICS",
+			"SAMPLING_RATE",
+			"isTracing",
+			"getTracingWrapper",
+			"executionTrace",
+			"enableTracing",
+			"disableTracing",
+			"getStatistics",
+			"clearStatistics",
+			"measureOverhead"]
+
+LOGGER = logging.getLogger(Constants.logger)
+
+TRACED_OBJECTS = {}
+TRACING_WRAPPERS = {}
+STATISTICS = {}
+SAMPLING_RATE = Constants.tracerSamplingRate
+
+TRACING = False
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def isTracing():
+	"""
+	This definition returns if the tracer is enabled.
+
+	:return: Tracer state. ( Boolean )
+	"""
+
+	return TRACING
+
+def getTracingWrapper(object, name=None):
+	"""
+	This definition returns the tracing wrapper of given object.
+
+	One call every :data:`SAMPLING_RATE` calls is timed, the calls count is always incremented.
+
+	:param object: Object to wrap. ( Object )
+	:param name: Statistics name. ( String )
+	:return: Tracing wrapper. ( Object )
+	"""
+
+	wrapper = TRACING_WRAPPERS.get(id(object))
+	if wrapper is not None:
+		return wrapper
+
+	name = name or "{0}.{1}".format(object.__module__, object.__name__)
+	statistics = STATISTICS.setdefault(name, [0, 0, 0.])
+	tracedObject = core.executionTrace(object)
+
+	@functools.wraps(object)
+	def tracingWrapper(*args, **kwargs):
+		"""
+		This decorator is the tracing wrapper.
+
+		:param \*args: Arguments. ( \* )
+		:param \*\*kwargs: Keywords arguments. ( \*\* )
+		:return: Object return value. ( Object )
+		"""
+
+		statistics[0] += 1
+		if statistics[0] % SAMPLING_RATE:
+			return tracedObject(*args, **kwargs)
+
+		startTime = time.time()
+		try:
+			return tracedObject(*args, **kwargs)
+		finally:
+			statistics[1] += 1
+			statistics[2] += time.time() - startTime
+
+	TRACING_WRAPPERS[id(object)] = tracingWrapper
+	return tracingWrapper
+
+def executionTrace(object):
+	"""
+	This decorator registers given object for tracing.
+
+	The object is returned unchanged when the tracer is disabled.
+
+	:param object: Object to register. ( Object )
+	:return: Object. ( Object )
+	"""
+
+	TRACED_OBJECTS[id(object)] = object
+	return isTracing() and getTracingWrapper(object) or object
+
+def _patchModules(mapping):
+	"""
+	This definition replaces the attributes of the imported :mod:`snippets` modules and of their classes
+	using given mapping.
+
+	:param mapping: Attributes values getter called with the attribute path and value. ( Object )
+	:return: Replaced attributes count. ( Integer )
+	"""
+
+	count = 0
+	for name, module in sys.modules.items():
+		if module is None or not name.split(".")[0] == "snippets":
+			continue
+
+		owners = [(name, module)]
+		owners.extend(("{0}.{1}".format(name, value.__name__), value) for value in vars(module).values() \
+		if inspect.isclass(value) and getattr(value, "__module__", None) == name)
+		for path, owner in owners:
+			for attribute, value in vars(owner).items():
+				replacement = mapping("{0}.{1}".format(path, attribute), value)
+				if replacement is not None:
+					setattr(owner, attribute, replacement)
+					count += 1
+	return count
+
+def enableTracing():
+	"""
+	This definition enables the tracer.
+
+	:return: Definition success. ( Boolean )
+	"""
+
+	global TRACING
+
+	if TRACING:
+		return False
+
+	TRACING = True
+	count = _patchModules(lambda path, value: \
+	id(value) in TRACED_OBJECTS and TRACED_OBJECTS[id(value)] is value and getTracingWrapper(value, path) or None)
+	LOGGER.info("{0} | Tracing enabled on '{1}' objects!".format(__name__, count))
+	return True
+
+def disableTracing():
+	"""
+	This definition disables the tracer.
+
+	:return: Definition success. ( Boolean )
+	"""
+
+	global TRACING
+
+	if not TRACING:
+		return False
+
+	TRACING = False
+	objects = dict((id(TRACING_WRAPPERS[identity]), object) for identity, object in TRACED_OBJECTS.iteritems() \
+	if identity in TRACING_WRAPPERS)
+	count = _patchModules(lambda path, value: objects.get(id(value)))
+	LOGGER.info("{0} | Tracing disabled on '{1}' objects!".format(__name__, count))
+	return True
+
+def getStatistics():
+	"""
+	This definition returns the sampling profiler statistics sorted from the most expensive object.
+
+	:return: Statistics. ( List )
+	"""
+
+	statistics = []
+	for name, (calls, samples, duration) in STATISTICS.iteritems():
+		if not calls:
+			continue
+
+		statistics.append({"name" : name,
+							"calls" : calls,
+							"samples" : samples,
+							"duration" : samples and duration * calls / samples or 0.})
+	return sorted(statistics, key=lambda statistic: statistic["duration"], reverse=True)
+
+def clearStatistics():
+	"""
+	This definition clears the sampling profiler statistics.
+
+	:return: Definition success. ( Boolean )
+	"""
+
+	for statistics in STATISTICS.itervalues():
+		statistics[:] = [0, 0, 0.]
+	return True
+
+def measureOverhead(iterations=100000):
+	"""
+	This definition measures the per call overhead of an untraced and a traced object
+	against the :func:`foundations.core.executionTrace` decorator.
+
+	:param iterations: Calls count. ( Integer )
+	:return: Per call durations in seconds. ( Dictionary )
+	"""
+
+	def object():
+		"""
+		This definition is the measured object.
+		"""
+
+		pass
+
+	def measure(function):
+		"""
+		This definition measures given function per call duration.
+
+		:param function: Function to measure. ( Object )
+		:return: Per call duration. ( Float )
+		"""
+
+		startTime = time.time()
+		for i in xrange(iterations):
+			function()
+		return (time.time() - startTime) / iterations
+
+	overhead = {"reference" : measure(object),
+				"executionTrace" : measure(core.executionTrace(object)),
+				"untraced" : measure(executionTrace(object)),
+				"traced" : measure(getTracingWrapper(object))}
+	del(TRACED_OBJECTS[id(object)])
+	del(TRACING_WRAPPERS[id(object)])
+	STATISTICS.pop("{0}.{1}".format(object.__module__, object.__name__), None)
+	return overhead
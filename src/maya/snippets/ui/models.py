@@ -18,10 +18,13 @@
 #***	External imports.
 #**********************************************************************************************************************
 import logging
+import re
 from PyQt4.QtCore import QAbstractListModel
+from PyQt4.QtCore import QCoreApplication
 from PyQt4.QtCore import QModelIndex
 from PyQt4.QtCore import QVariant
 from PyQt4.QtCore import Qt
+from PyQt4.QtGui import QSortFilterProxyModel
 
 #**********************************************************************************************************************
 #***	Internal imports.
@@ -29,7 +32,9 @@ from PyQt4.QtCore import Qt
 import foundations.core as core
 import foundations.dataStructures
 import foundations.exceptions
+import snippets.tracer as tracer
 from snippets.globals.constants import Constants
+from snippets.globals.uiConstants import UiConstants
 
 #**********************************************************************************************************************
 #***	Module attributes.
@@ -44,7 +49,8 @@ __status__ = "Production"
 __all__ = ["LOGGER",
 			"Categorie",
 			"Interface",
-			"InterfacesModel"]
+			"InterfacesModel",
+			"InterfacesProxyModel"]
 
 LOGGER = logging.getLogger(Constants.logger)
 
@@ -56,7 +62,7 @@ class Categorie(foundations.dataStructures.Structure):
 	This is the **Interface** class.
 	"""
 
-	@core.executionTrace
+	@tracer.executionTrace
 	def __init__(self, **kwargs):
 		"""
 		This method initializes the class.
@@ -71,7 +77,7 @@ class Interface(foundations.dataStructures.Structure):
 	This is the **Interface** class.
 	"""
 
-	@core.executionTrace
+	@tracer.executionTrace
 	def __init__(self, **kwargs):
 		"""
 		This method initializes the class.
@@ -100,6 +106,8 @@ class InterfacesModel(QAbstractListModel):
 		QAbstractListModel.__init__(self, parent)
 
 		# --- Setting class attributes. ---
+		self.__sortOrder = Qt.AscendingOrder
+
 		self.__interfaces = []
 		self.interfaces = interfaces or self.__interfaces
 
@@ -131,7 +139,7 @@ class InterfacesModel(QAbstractListModel):
 				assert type(element) is Interface, "'{0}' attribute: '{1}' type is not 'Interface'!".format("interfaces", element)
 		# TODO: Rollback to beginResetModel() whenever MPC changes it's PyQt version.	
 		self.modelAboutToBeReset.emit()
-		self.__interfaces = value
+		self.__interfaces = value is not None and sorted(value, key=lambda x: (x.name), reverse=self.__sortOrder) or value
 		# TODO: Rollback to endResetModel () whenever MPC changes it's PyQt version.
 		self.modelReset.emit()
 
@@ -148,8 +156,7 @@ class InterfacesModel(QAbstractListModel):
 	#******************************************************************************************************************
 	#***	Class methods.
 	#******************************************************************************************************************
-	@core.executionTrace
-	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	@tracer.executionTrace
 	def __getitem__(self, name):
 		"""
 		This method reimplements the :meth:`object.__getitem__` method.
@@ -158,12 +165,11 @@ class InterfacesModel(QAbstractListModel):
 		:return: Item. ( Interface / Catorie )
 		"""
 
-		for item in self.__interfaces:
-			if item.name == name:
-				return item
+		row = self.__getRow(name)
+		if row is not None:
+			return self.__interfaces[row]
 
-	@core.executionTrace
-	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	@tracer.executionTrace
 	def __iter__(self):
 		"""
 		This method reimplements the :meth:`object.__iter__` method.
@@ -173,8 +179,7 @@ class InterfacesModel(QAbstractListModel):
 
 		return iter(self.__interfaces)
 
-	@core.executionTrace
-	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	@tracer.executionTrace
 	def __reversed__(self):
 		"""
 		This method reimplements the :meth:`object.__reversed__` method.
@@ -184,8 +189,7 @@ class InterfacesModel(QAbstractListModel):
 
 		return reversed(self.__interfaces)
 
-	@core.executionTrace
-	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	@tracer.executionTrace
 	def __contains__(self, name):
 		"""
 		This method reimplements the :meth:`object.__contains__` method.
@@ -194,10 +198,9 @@ class InterfacesModel(QAbstractListModel):
 		:return: Item existence. ( Boolean )
 		"""
 
-		return self[name] and True or False
+		return self.__getRow(name) is not None
 
-	@core.executionTrace
-	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	@tracer.executionTrace
 	def __len__(self):
 		"""
 		This method reimplements the :meth:`object.__len__` method.
@@ -264,6 +267,7 @@ class InterfacesModel(QAbstractListModel):
 
 		# TODO: Rollback to beginResetModel() whenever MPC changes it's PyQt version.
 		self.modelAboutToBeReset.emit()
+		self.__sortOrder = order
 		self.__interfaces = sorted(self.__interfaces, key=lambda x: (x.name), reverse=order)
 		# TODO: Rollback to endResetModel () whenever MPC changes it's PyQt version.
 		self.modelReset.emit()
@@ -280,7 +284,68 @@ class InterfacesModel(QAbstractListModel):
 
 		return self.__interfaces[index.row()]
 
-	@core.executionTrace
+	@tracer.executionTrace
+	def __getInsertionRow(self, name):
+		"""
+		This method returns the row where an item with given name would be inserted.
+
+		The interfaces are always kept sorted by name in the Model sort order, the row is bisected.
+
+		:param name: Item name. ( String )
+		:return: Row. ( Integer )
+		"""
+
+		ascending = self.__sortOrder == Qt.AscendingOrder
+		low, high = 0, len(self.__interfaces)
+		while low < high:
+			middle = (low + high) // 2
+			itemName = self.__interfaces[middle].name
+			if (ascending and itemName < name) or (not ascending and itemName > name):
+				low = middle + 1
+			else:
+				high = middle
+		return low
+
+	@tracer.executionTrace
+	def __getRow(self, name):
+		"""
+		This method returns the row of the item with given name.
+
+		:param name: Item name. ( String )
+		:return: Row. ( Integer )
+		"""
+
+		row = self.__getInsertionRow(name)
+		if row < len(self.__interfaces) and self.__interfaces[row].name == name:
+			return row
+
+	@tracer.executionTrace
+	def __insertItem(self, item):
+		"""
+		This method inserts given item at its sorted row.
+
+		:param item: Item to insert. ( Interface / Categorie )
+		"""
+
+		row = self.__getInsertionRow(item.name)
+		self.beginInsertRows(QModelIndex(), row, row)
+		self.__interfaces.insert(row, item)
+		self.endInsertRows()
+
+	@tracer.executionTrace
+	def __removeItem(self, name):
+		"""
+		This method removes the item with given name.
+
+		:param name: Item name. ( String )
+		"""
+
+		row = self.__getRow(name)
+		self.beginRemoveRows(QModelIndex(), row, row)
+		del(self.__interfaces[row])
+		self.endRemoveRows()
+
+	@tracer.executionTrace
 	@foundations.exceptions.exceptionsHandler(None, False, Exception)
 	def __registerCategorie(self, categorie):
 		"""
@@ -291,27 +356,30 @@ class InterfacesModel(QAbstractListModel):
 
 		name = categorie[0]
 		if not name in self:
-			self.__interfaces.append(Categorie(name=name))
+			self.__insertItem(Categorie(name=name))
 
 	@core.executionTrace
 	@foundations.exceptions.exceptionsHandler(None, False, Exception)
 	def __unregisterCategorie(self, name):
 		"""
-		This method unregisters categorie with given name.
+		This method unregisters categorie with given name if it doesn't contain any interface anymore.
 
 		:param categorie: Categorie name. ( String )
 		"""
 
 		name = name[0]
-		count = 0
-		for item in reversed(self):
+		row = self.__getRow(name)
+		if row is None or hasattr(self.__interfaces[row], "attribute"):
+			return
+
+		# The categorie interfaces are sorted next to it, only its neighbours need to be checked.
+		for item in self.__interfaces[max(row - 1, 0):row] + self.__interfaces[row + 1:row + 2]:
 			if item.name.startswith(name):
-				count += 1
+				return
 
-			if item.name == name and count == 1:
-				self.__interfaces.remove(self[name])
+		self.__removeItem(name)
 
-	@core.executionTrace
+	@tracer.executionTrace
 	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
 	def registerInterface(self, interface):
 		"""
@@ -328,9 +396,8 @@ class InterfacesModel(QAbstractListModel):
 
 		LOGGER.debug("> Registering '{0}' interface.".format(name))
 
-		self.__interfaces.append(interface)
 		self.__registerCategorie(name)
-		self.sort()
+		self.__insertItem(interface)
 		return True
 
 	@core.executionTrace
@@ -349,11 +416,222 @@ class InterfacesModel(QAbstractListModel):
 
 		LOGGER.debug("> Unregistering '{0}' interface.".format(name))
 
-		for i, interface in enumerate(self):
-			if not interface.name == name:
+		self.__removeItem(name)
+		self.__unregisterCategorie(name)
+		return True
+
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def setInterfaces(self, interfaces):
+		"""
+		This method sets the Model interfaces in one pass, the categories are created
+		and the Model is reset only once.
+
+		:param interfaces: Interfaces. ( Iterable )
+		:return: Method success. ( Boolean )
+		"""
+
+		items = {}
+		for interface in interfaces:
+			if interface.name in items:
+				LOGGER.warning("!> {0} | An interface with '{1}' name is already registered!".format(
+				self.__class__.__name__, interface.name))
 				continue
+			items[interface.name] = interface
+
+		for name in set(name[0] for name in items):
+			items.setdefault(name, Categorie(name=name))
+
+		# TODO: Rollback to beginResetModel() whenever MPC changes it's PyQt version.
+		self.modelAboutToBeReset.emit()
+		self.__interfaces = sorted(items.itervalues(), key=lambda x: (x.name), reverse=self.__sortOrder)
+		# TODO: Rollback to endResetModel () whenever MPC changes it's PyQt version.
+		self.modelReset.emit()
+		return True
+
+class InterfacesProxyModel(QSortFilterProxyModel):
+	"""
+	This class is a `QSortFilterProxyModel <http://doc.qt.nokia.com/qsortfilterproxymodel.html>`_ subclass
+	filtering an :class:`InterfacesModel` class instance interfaces.
+	"""
+
+	@core.executionTrace
+	def __init__(self, parent=None, sourceModel=None):
+		"""
+		This method initializes the class.
+
+		:param parent: Parent object. ( QObject )
+		:param sourceModel: Source Model. ( InterfacesModel )
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		QSortFilterProxyModel.__init__(self, parent)
+
+		# --- Setting class attributes. ---
+		self.__pattern = None
+		self.__flags = re.IGNORECASE
+		self.__matches = None
+		self.__accepted = None
+		self.__generation = 0
+
+		if sourceModel is not None:
+			self.setSourceModel(sourceModel)
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def pattern(self):
+		"""
+		This method is the property for **self.__pattern** attribute.
+
+		:return: self.__pattern. ( String )
+		"""
+
+		return self.__pattern
+
+	@pattern.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def pattern(self, value):
+		"""
+		This method is the setter method for **self.__pattern** attribute.
+
+		:param value: Attribute value. ( String )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "pattern"))
+
+	@pattern.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def pattern(self):
+		"""
+		This method is the deleter method for **self.__pattern** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "pattern"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	@core.executionTrace
+	def setSourceModel(self, sourceModel):
+		"""
+		This method reimplements the :meth:`QSortFilterProxyModel.setSourceModel` method.
+
+		:param sourceModel: Source Model. ( InterfacesModel )
+		"""
+
+		QSortFilterProxyModel.setSourceModel(self, sourceModel)
+
+		sourceModel.modelReset.connect(self.__sourceModel__changed)
+		sourceModel.rowsInserted.connect(self.__sourceModel__changed)
+		sourceModel.rowsRemoved.connect(self.__sourceModel__changed)
+
+	@core.executionTrace
+	def __sourceModel__changed(self, *args):
+		"""
+		This method is triggered when the source Model changes.
+
+		:param \*args: Arguments. ( \* )
+		"""
+
+		self.__pattern is not None and self.setFilter(self.__pattern, self.__flags, incremental=False)
+
+	@core.executionTrace
+	def isPlainPattern(self, pattern):
+		"""
+		This method returns if given pattern doesn't contain any regular expression special character.
+
+		:param pattern: Pattern. ( String )
+		:return: Is plain pattern. ( Boolean )
+		"""
+
+		for character in ".^$*+?{}[]\\|()":
+			if character in pattern:
+				return False
+		return True
 
-			del(self.__interfaces[i])
-			self.__unregisterCategorie(name)
-			self.sort()
+	@core.executionTrace
+	@foundations.exceptions.exceptionsHandler(None, False, Exception)
+	def setFilter(self, pattern=".*", flags=re.IGNORECASE, incremental=True):
+		"""
+		This method filters the source Model interfaces with given pattern.
+
+		When the pattern is a plain text extending the previous one, only the previous matches are searched.
+		The interfaces are filtered by chunks and pending events are processed between them, the filtering
+		is interrupted if a newer filter is set meanwhile.
+
+		:param pattern: Interface name pattern. ( String )
+		:param flags: Regex filtering flags. ( Integer )
+		:param incremental: Search only the previous matches if possible. ( Boolean )
+		:return: Method success. ( Boolean )
+		"""
+
+		try:
+			expression = re.compile(pattern, flags)
+		except Exception:
+			return
+
+		candidates = None
+		if incremental and self.__matches is not None and flags == self.__flags and \
+		pattern.startswith(self.__pattern) and self.isPlainPattern(self.__pattern) and self.isPlainPattern(pattern):
+			candidates = self.__matches
+
+		sourceModel = self.sourceModel()
+		if candidates is None:
+			candidates = [item for item in sourceModel if hasattr(item, "attribute")]
+
+		self.__generation += 1
+		generation = self.__generation
+		matches = []
+		for i in xrange(0, len(candidates), UiConstants.filterChunkSize):
+			if i:
+				QCoreApplication.processEvents()
+				if generation != self.__generation:
+					LOGGER.debug("> '{0}' pattern filtering interrupted by a newer filter.".format(pattern))
+					return False
+
+			matches.extend(interface for interface in candidates[i:i + UiConstants.filterChunkSize] \
+			if re.search(expression, interface.name))
+
+		accepted = set(interface.name for interface in matches)
+		accepted.update(name[0] for name in list(accepted))
+
+		LOGGER.debug("> Filtering '{0}' interfaces with '{1}' pattern: '{2}' matches.".format(
+		len(candidates), pattern, len(matches)))
+
+		self.__pattern = pattern
+		self.__flags = flags
+		self.__matches = matches
+		self.__accepted = accepted
+		self.invalidateFilter()
+		return True
+
+	# Called for every source Model row, the method is not traced.
+	def filterAcceptsRow(self, row, parent):
+		"""
+		This method reimplements the :meth:`QSortFilterProxyModel.filterAcceptsRow` method.
+
+		:param row: Source row. ( Integer )
+		:param parent: Source parent. ( QModelIndex )
+		:return: Row accepted. ( Boolean )
+		"""
+
+		if self.__accepted is None:
 			return True
+
+		return self.sourceModel().interfaces[row].name in self.__accepted
+
+	@core.executionTrace
+	def getInterface(self, index):
+		"""
+		This method returns the interface with given proxy index.
+
+		:param index: Interface proxy index. ( QModelIndex )
+		:return: Interface. ( Interface )
+		"""
+
+		return self.sourceModel().getInterface(self.mapToSource(index))
@@ -17,11 +17,15 @@
 #**********************************************************************************************************************
 #***	External imports.
 #**********************************************************************************************************************
+import bisect
 import functools
 import logging
 import os
+import time
 from PyQt4.QtCore import QString
+from PyQt4.QtCore import QTimer
 from PyQt4.QtCore import Qt
+from PyQt4.QtCore import pyqtSignal
 from PyQt4.QtGui import QCompleter
 from PyQt4.QtGui import QIcon
 from PyQt4.QtGui import QLineEdit
@@ -36,6 +40,7 @@ import foundations.core as core
 import foundations.exceptions
 import snippets.ui.common
 from snippets.globals.constants import Constants
+from snippets.globals.uiConstants import UiConstants
 from snippets.ui.widgets.active_QLabel import Active_QLabel
 
 #**********************************************************************************************************************
@@ -59,15 +64,22 @@ class Search_QLineEdit(QLineEdit):
 	"""
 	This class is a `QLineEdit <http://doc.qt.nokia.com/qlinedit.html>`_ subclass providing
 	a search field with clearing capabilities.
+
+	The **searchRequested** signal is emitted once the text has not changed for the search delay,
+	the intermediate keystrokes are coalesced.
 	"""
 
+	# Custom signals definitions.
+	searchRequested = pyqtSignal(QString)
+
 	@core.executionTrace
 	def __init__(self,
 				parent=None,
 				uiSearchImage=None,
 				uiSearchClickedImage=None,
 				uiClearImage=None,
-				uiClearClickedImage=None):
+				uiClearClickedImage=None,
+				searchDelay=UiConstants.searchDelay):
 		"""
 		This method initializes the class.
 
@@ -76,6 +88,7 @@ class Search_QLineEdit(QLineEdit):
 		:param uiSearchClickedImage: Search button clicked image path. ( String )
 		:param uiClearImage: Clear button image path. ( String )
 		:param uiClearClickedImage: Clear button clicked image path. ( String )
+		:param searchDelay: Search delay in milliseconds. ( Integer )
 		"""
 
 		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -107,6 +120,12 @@ class Search_QLineEdit(QLineEdit):
 		self.setCompleter(self.__completer)
 		self.__completerVisibleItemsCount = 16
 
+		self.__searchTimer = QTimer(self)
+		self.__searchTimer.setSingleShot(True)
+		self.__searchDelay = None
+		self.searchDelay = searchDelay
+		self.__latencies = [0] * (len(UiConstants.searchLatencyBuckets) + 1)
+
 		# TODO: Rollback to Search_QLineEdit.__initializeUi(self) whenever MPC changes it's PyQt version.
 		self.__initializeUi()
 		self.__setClearButtonVisibility(self.text())
@@ -114,6 +133,8 @@ class Search_QLineEdit(QLineEdit):
 		# Signals / Slots.
 		self.__clearButton.clicked.connect(self.clear)
 		self.textChanged.connect(self.__setClearButtonVisibility)
+		self.textChanged.connect(self.__search_QLineEdit__textChanged)
+		self.__searchTimer.timeout.connect(self.__searchTimer__timeout)
 
 	#******************************************************************************************************************
 	#***	Attributes properties.
@@ -389,6 +410,73 @@ class Search_QLineEdit(QLineEdit):
 		raise foundations.exceptions.ProgrammingError(
 		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "completerVisibleItemsCount"))
 
+	@property
+	def searchDelay(self):
+		"""
+		This method is the property for **self.__searchDelay** attribute.
+
+		:return: self.__searchDelay. ( Integer )
+		"""
+
+		return self.__searchDelay
+
+	@searchDelay.setter
+	@foundations.exceptions.exceptionsHandler(None, False, AssertionError)
+	def searchDelay(self, value):
+		"""
+		This method is the setter method for **self.__searchDelay** attribute.
+
+		:param value: Attribute value. ( Integer )
+		"""
+
+		if value is not None:
+			assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("searchDelay", value)
+			assert value >= 0, "'{0}' attribute: '{1}' need to be positive!".format("searchDelay", value)
+			self.__searchTimer.setInterval(value)
+		self.__searchDelay = value
+
+	@searchDelay.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def searchDelay(self):
+		"""
+		This method is the deleter method for **self.__searchDelay** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "searchDelay"))
+
+	@property
+	def latencies(self):
+		"""
+		This method is the property for **self.__latencies** attribute.
+
+		:return: self.__latencies. ( List )
+		"""
+
+		return self.__latencies
+
+	@latencies.setter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def latencies(self, value):
+		"""
+		This method is the setter method for **self.__latencies** attribute.
+
+		:param value: Attribute value. ( List )
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "latencies"))
+
+	@latencies.deleter
+	@foundations.exceptions.exceptionsHandler(None, False, foundations.exceptions.ProgrammingError)
+	def latencies(self):
+		"""
+		This method is the deleter method for **self.__latencies** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "latencies"))
+
 	#******************************************************************************************************************
 	#***	Class methods.
 	#******************************************************************************************************************
@@ -452,3 +540,69 @@ class Search_QLineEdit(QLineEdit):
 			self.__clearButton.show()
 		else:
 			self.__clearButton.hide()
+
+	@core.executionTrace
+	def __search_QLineEdit__textChanged(self, text):
+		"""
+		This method is triggered when the Widget text changes.
+
+		:param text: Current field text. ( QString )
+		"""
+
+		self.__searchTimer.start()
+
+	@core.executionTrace
+	def __searchTimer__timeout(self):
+		"""
+		This method is triggered when the search delay has elapsed without any text change.
+		"""
+
+		# The latency excludes the search delay, it is recorded on the next event loop iteration,
+		# once the views have been repainted.
+		searchTime = time.time()
+		self.searchRequested.emit(self.text())
+		QTimer.singleShot(0, functools.partial(self.__recordLatency, searchTime))
+
+	@core.executionTrace
+	def __recordLatency(self, searchTime):
+		"""
+		This method records the latency between given search time and now.
+
+		:param searchTime: Search time. ( Float )
+		"""
+
+		latency = (time.time() - searchTime) * 1000
+		self.__latencies[bisect.bisect_left(UiConstants.searchLatencyBuckets, latency)] += 1
+
+	@core.executionTrace
+	def search(self):
+		"""
+		This method emits the **searchRequested** signal immediately, discarding the pending search.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__searchTimer.stop()
+		self.__searchTimer__timeout()
+		return True
+
+	@core.executionTrace
+	def getLatencyHistogram(self):
+		"""
+		This method returns the search to repaint latencies histogram.
+
+		:return: Buckets upper bounds in milliseconds and latencies counts, the last bucket is unbounded. ( List )
+		"""
+
+		return zip(UiConstants.searchLatencyBuckets + (None,), self.__latencies)
+
+	@core.executionTrace
+	def clearLatencyHistogram(self):
+		"""
+		This method clears the latencies histogram.
+
+		:return: Method success. ( Boolean )
+		"""
+
+		self.__latencies[:] = [0] * len(self.__latencies)
+		return True
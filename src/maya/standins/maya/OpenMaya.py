@@ -0,0 +1,941 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**OpenMaya.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Stand-in :mod:`maya.OpenMaya` module.
+
+**Others:**
+	Only the classes and methods used by the snippets libraries are implemented. The Maya arrays are Python lists
+	so that they are filled element by element like the original ones.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import math
+import numpy
+
+import maya.scene as _scene
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["MGlobal",
+			"MSpace",
+			"MVector",
+			"MPoint",
+			"MMatrix",
+			"MScriptUtil",
+			"MIntArray",
+			"MFloatArray",
+			"MDoubleArray",
+			"MPointArray",
+			"MObject",
+			"MObjectHandle",
+			"MMessage",
+			"MNodeMessage",
+			"MDagPath",
+			"MSelectionList",
+			"MItSelectionList",
+			"MItMeshPolygon",
+			"MFnMesh"]
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class MGlobal(object):
+	"""
+	This class is the **MGlobal** class.
+	"""
+
+	@staticmethod
+	def displayInfo(message):
+		"""
+		This method displays given message.
+
+		:param message: Message. ( String )
+		"""
+
+		print(message)
+
+	@staticmethod
+	def displayWarning(message):
+		"""
+		This method displays given warning message.
+
+		:param message: Message. ( String )
+		"""
+
+		print("# Warning: {0} #".format(message))
+
+	@staticmethod
+	def displayError(message):
+		"""
+		This method displays given error message.
+
+		:param message: Message. ( String )
+		"""
+
+		print("# Error: {0} #".format(message))
+
+class MSpace(object):
+	"""
+	This class is the **MSpace** class.
+	"""
+
+	kInvalid = 0
+	kTransform = 1
+	kPreTransform = 2
+	kPostTransform = 3
+	kWorld = 4
+	kObject = kPreTransform
+
+class MVector(object):
+	"""
+	This class is the **MVector** class.
+	"""
+
+	def __init__(self, x=0., y=0., z=0.):
+		"""
+		This method initializes the class.
+
+		:param x: X coordinate. ( Float )
+		:param y: Y coordinate. ( Float )
+		:param z: Z coordinate. ( Float )
+		"""
+
+		self.x, self.y, self.z = float(x), float(y), float(z)
+
+	def __add__(self, other):
+		"""
+		This method reimplements the addition operator.
+
+		:param other: Vector. ( MVector )
+		:return: Vector. ( MVector )
+		"""
+
+		return MVector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+	def __sub__(self, other):
+		"""
+		This method reimplements the subtraction operator.
+
+		:param other: Vector. ( MVector )
+		:return: Vector. ( MVector )
+		"""
+
+		return MVector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+	def __mul__(self, other):
+		"""
+		This method reimplements the multiplication operator: dot product with a vector, vector transformation
+		with a matrix and scaling with a number.
+
+		:param other: Vector, matrix or number. ( MVector / MMatrix / Float )
+		:return: Dot product or vector. ( Float / MVector )
+		"""
+
+		if isinstance(other, MVector):
+			return self.x * other.x + self.y * other.y + self.z * other.z
+		elif isinstance(other, MMatrix):
+			x, y, z = numpy.dot((self.x, self.y, self.z), other.matrix[:3, :3])
+			return MVector(x, y, z)
+		return MVector(self.x * other, self.y * other, self.z * other)
+
+	def length(self):
+		"""
+		This method returns the vector length.
+
+		:return: Length. ( Float )
+		"""
+
+		return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+	def normalize(self):
+		"""
+		This method normalizes the vector in place.
+
+		:return: Vector. ( MVector )
+		"""
+
+		length = self.length()
+		if length:
+			self.x, self.y, self.z = self.x / length, self.y / length, self.z / length
+		return self
+
+class MPoint(object):
+	"""
+	This class is the **MPoint** class.
+	"""
+
+	def __init__(self, x=0., y=0., z=0., w=1.):
+		"""
+		This method initializes the class.
+
+		:param x: X coordinate. ( Float )
+		:param y: Y coordinate. ( Float )
+		:param z: Z coordinate. ( Float )
+		:param w: W coordinate. ( Float )
+		"""
+
+		self.x, self.y, self.z, self.w = float(x), float(y), float(z), float(w)
+
+	def __sub__(self, other):
+		"""
+		This method reimplements the subtraction operator.
+
+		:param other: Point. ( MPoint )
+		:return: Vector. ( MVector )
+		"""
+
+		return MVector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+	def distanceTo(self, other):
+		"""
+		This method returns the distance to given point.
+
+		:param other: Point. ( MPoint )
+		:return: Distance. ( Float )
+		"""
+
+		return (self - other).length()
+
+class MMatrix(object):
+	"""
+	This class is the **MMatrix** class, it follows Maya rows vectors convention.
+	"""
+
+	def __init__(self):
+		"""
+		This method initializes the class.
+		"""
+
+		self.matrix = numpy.identity(4)
+
+	def __call__(self, row, column):
+		"""
+		This method returns given matrix element.
+
+		:param row: Row. ( Integer )
+		:param column: Column. ( Integer )
+		:return: Element. ( Float )
+		"""
+
+		return float(self.matrix[row, column])
+
+	def __mul__(self, other):
+		"""
+		This method reimplements the multiplication operator.
+
+		:param other: Matrix. ( MMatrix )
+		:return: Matrix. ( MMatrix )
+		"""
+
+		matrix = MMatrix()
+		matrix.matrix = numpy.dot(self.matrix, other.matrix)
+		return matrix
+
+	def inverse(self):
+		"""
+		This method returns the matrix inverse.
+
+		:return: Matrix. ( MMatrix )
+		"""
+
+		matrix = MMatrix()
+		matrix.matrix = numpy.linalg.inv(self.matrix)
+		return matrix
+
+class _Pointer(object):
+	"""
+	This class is the **_Pointer** class, it stores the value of an :class:`MScriptUtil` pointer.
+	"""
+
+	def __init__(self, value=0.):
+		"""
+		This method initializes the class.
+
+		:param value: Value. ( Object )
+		"""
+
+		self.value = value
+
+class MScriptUtil(object):
+	"""
+	This class is the **MScriptUtil** class.
+	"""
+
+	def __init__(self):
+		"""
+		This method initializes the class.
+		"""
+
+		self.__pointer = _Pointer()
+
+	def createFromDouble(self, *values):
+		"""
+		This method initializes the script utility value.
+
+		:param \*values: Values. ( \* )
+		"""
+
+		self.__pointer.value = values[0]
+
+	def createFromInt(self, *values):
+		"""
+		This method initializes the script utility value.
+
+		:param \*values: Values. ( \* )
+		"""
+
+		self.__pointer.value = values[0]
+
+	def asDoublePtr(self):
+		"""
+		This method returns the script utility value pointer.
+
+		:return: Pointer. ( _Pointer )
+		"""
+
+		return self.__pointer
+
+	asIntPtr = asDoublePtr
+
+	@staticmethod
+	def getDouble(pointer):
+		"""
+		This method returns given pointer value.
+
+		:param pointer: Pointer. ( _Pointer )
+		:return: Value. ( Float )
+		"""
+
+		return pointer.value
+
+	getInt = getDouble
+
+	@staticmethod
+	def createMatrixFromList(values, matrix):
+		"""
+		This method fills given matrix from given values.
+
+		:param values: Sixteen values. ( List )
+		:param matrix: Matrix. ( MMatrix )
+		"""
+
+		matrix.matrix = numpy.array(values, dtype=numpy.float64).reshape(4, 4)
+
+	@staticmethod
+	def createFloatArrayFromList(values, array):
+		"""
+		This method fills given array from given values.
+
+		:param values: Values. ( List )
+		:param array: Array. ( MFloatArray )
+		"""
+
+		array[:] = [float(value) for value in values]
+
+class _MArray(list):
+	"""
+	This class is the **_MArray** class, it is the base class of the Maya arrays.
+	"""
+
+	def length(self):
+		"""
+		This method returns the array length.
+
+		:return: Length. ( Integer )
+		"""
+
+		return len(self)
+
+	def set(self, value, index):
+		"""
+		This method sets given array element.
+
+		:param value: Value. ( Object )
+		:param index: Index. ( Integer )
+		"""
+
+		self[index] = value
+
+	def setLength(self, length):
+		"""
+		This method sets the array length.
+
+		:param length: Length. ( Integer )
+		"""
+
+		del self[length:]
+		self.extend([self._default] * (length - len(self)))
+
+	def clear(self):
+		"""
+		This method clears the array.
+		"""
+
+		del self[:]
+
+class MIntArray(_MArray):
+	"""
+	This class is the **MIntArray** class.
+	"""
+
+	_default = 0
+
+class MFloatArray(_MArray):
+	"""
+	This class is the **MFloatArray** class.
+	"""
+
+	_default = 0.
+
+class MDoubleArray(_MArray):
+	"""
+	This class is the **MDoubleArray** class.
+	"""
+
+	_default = 0.
+
+class MPointArray(_MArray):
+	"""
+	This class is the **MPointArray** class.
+	"""
+
+	_default = None
+
+class MObject(object):
+	"""
+	This class is the **MObject** class.
+	"""
+
+	def __init__(self):
+		"""
+		This method initializes the class.
+		"""
+
+		self.node = None
+
+	def isNull(self):
+		"""
+		This method returns if the object is null.
+
+		:return: Null state. ( Boolean )
+		"""
+
+		return self.node is None
+
+	def __eq__(self, other):
+		"""
+		This method returns if given object references the same node.
+
+		:param other: Object. ( MObject )
+		:return: Equality. ( Boolean )
+		"""
+
+		return self.node is other.node
+
+	def __ne__(self, other):
+		"""
+		This method returns if given object references a different node.
+
+		:param other: Object. ( MObject )
+		:return: Inequality. ( Boolean )
+		"""
+
+		return not self.__eq__(other)
+
+class MObjectHandle(object):
+	"""
+	This class is the **MObjectHandle** class.
+	"""
+
+	def __init__(self, object):
+		"""
+		This method initializes the class.
+
+		:param object: Object. ( MObject )
+		"""
+
+		self.__object = MObject()
+		self.__object.node = object.node
+
+	def object(self):
+		"""
+		This method returns the handle object.
+
+		:return: Object. ( MObject )
+		"""
+
+		return self.__object
+
+	def hashCode(self):
+		"""
+		This method returns the handle hash code.
+
+		:return: Hash code. ( Integer )
+		"""
+
+		return id(self.__object.node)
+
+	def isValid(self):
+		"""
+		This method returns if the handle object is still part of the scene.
+
+		:return: Validity. ( Boolean )
+		"""
+
+		return self.__object.node in _scene.SCENE.nodes
+
+class MMessage(object):
+	"""
+	This class is the **MMessage** class.
+	"""
+
+	@staticmethod
+	def removeCallback(id):
+		"""
+		This method removes given callback.
+
+		:param id: Callback id. ( Integer )
+		"""
+
+		_scene.SCENE.removeCallback(id)
+
+class MNodeMessage(MMessage):
+	"""
+	This class is the **MNodeMessage** class.
+	"""
+
+	@staticmethod
+	def addNodeDirtyCallback(node, function, clientData=None):
+		"""
+		This method registers given function to be called when given node becomes dirty.
+
+		:param node: Node. ( MObject )
+		:param function: Function called with the node and the client data. ( Object )
+		:param clientData: Client data. ( Object )
+		:return: Callback id. ( Integer )
+		"""
+
+		return _scene.SCENE.addCallback(node.node, lambda: function(node, clientData))
+
+	@staticmethod
+	def addNodePreRemovalCallback(node, function, clientData=None):
+		"""
+		This method registers given function to be called before given node is removed from the scene.
+
+		:param node: Node. ( MObject )
+		:param function: Function called with the node and the client data. ( Object )
+		:param clientData: Client data. ( Object )
+		:return: Callback id. ( Integer )
+		"""
+
+		return _scene.SCENE.addCallback(node.node, lambda: function(node, clientData), "preRemoval")
+
+class MSceneMessage(MMessage):
+	"""
+	This class is the **MSceneMessage** class.
+	"""
+
+	kBeforeNew = "beforeNew"
+	kBeforeOpen = "beforeOpen"
+
+	@staticmethod
+	def addCallback(message, function, clientData=None):
+		"""
+		This method registers given function to be called when given scene message is emitted.
+
+		:param message: Message. ( String )
+		:param function: Function called with the client data. ( Object )
+		:param clientData: Client data. ( Object )
+		:return: Callback id. ( Integer )
+		"""
+
+		return _scene.SCENE.addCallback(None, lambda: function(clientData), message)
+
+class MDagPath(object):
+	"""
+	This class is the **MDagPath** class.
+	"""
+
+	def __init__(self):
+		"""
+		This method initializes the class.
+		"""
+
+		self.node = None
+
+	def fullPathName(self):
+		"""
+		This method returns the path full name.
+
+		:return: Full name. ( String )
+		"""
+
+		return self.node.longName
+
+	def partialPathName(self):
+		"""
+		This method returns the path partial name.
+
+		:return: Partial name. ( String )
+		"""
+
+		return _scene.SCENE.getPartialName(self.node)
+
+	def inclusiveMatrix(self):
+		"""
+		This method returns the path world matrix.
+
+		:return: World matrix. ( MMatrix )
+		"""
+
+		matrix = MMatrix()
+		matrix.matrix = numpy.array(self.node.worldMatrix, dtype=numpy.float64)
+		return matrix
+
+	def extendToShape(self):
+		"""
+		This method extends the path to the shape node.
+		"""
+
+		if isinstance(self.node, _scene.Transform):
+			self.node = self.node.shape
+
+	def getShape(self):
+		"""
+		This method returns the path mesh shape.
+
+		:return: Mesh shape. ( MeshShape )
+		"""
+
+		if isinstance(self.node, _scene.Transform):
+			return self.node.shape
+		return self.node
+
+class MSelectionList(object):
+	"""
+	This class is the **MSelectionList** class.
+	"""
+
+	def __init__(self):
+		"""
+		This method initializes the class.
+		"""
+
+		self.nodes = []
+
+	def add(self, name):
+		"""
+		This method adds given node to the selection list.
+
+		:param name: Node name. ( String )
+		"""
+
+		node = _scene.SCENE.getNode(name.split(".")[0])
+		if node is None:
+			raise RuntimeError("(kInvalidParameter): Object does not exist")
+		self.nodes.append(node)
+
+	def length(self):
+		"""
+		This method returns the selection list length.
+
+		:return: Length. ( Integer )
+		"""
+
+		return len(self.nodes)
+
+	def getDagPath(self, index, dagPath):
+		"""
+		This method fills given dag path with given selection list item.
+
+		:param index: Index. ( Integer )
+		:param dagPath: Dag path. ( MDagPath )
+		"""
+
+		dagPath.node = self.nodes[index]
+
+	def getDependNode(self, index, object):
+		"""
+		This method fills given object with given selection list item.
+
+		:param index: Index. ( Integer )
+		:param object: Object. ( MObject )
+		"""
+
+		object.node = self.nodes[index]
+
+class MItSelectionList(object):
+	"""
+	This class is the **MItSelectionList** class.
+	"""
+
+	def __init__(self, selectionList):
+		"""
+		This method initializes the class.
+
+		:param selectionList: Selection list. ( MSelectionList )
+		"""
+
+		self.__selectionList = selectionList
+		self.__index = 0
+
+	def isDone(self):
+		"""
+		This method returns if the iteration is done.
+
+		:return: Iteration done. ( Boolean )
+		"""
+
+		return self.__index >= self.__selectionList.length()
+
+	def next(self):
+		"""
+		This method moves to the next item.
+		"""
+
+		self.__index += 1
+
+	def getDagPath(self, dagPath, component=None):
+		"""
+		This method fills given dag path with the current item.
+
+		:param dagPath: Dag path. ( MDagPath )
+		:param component: Component. ( MObject )
+		"""
+
+		self.__selectionList.getDagPath(self.__index, dagPath)
+
+class MItMeshPolygon(object):
+	"""
+	This class is the **MItMeshPolygon** class, it iterates over a mesh faces one by one.
+	"""
+
+	def __init__(self, dagPath, component=None):
+		"""
+		This method initializes the class.
+
+		:param dagPath: Dag path. ( MDagPath )
+		:param component: Component. ( MObject )
+		"""
+
+		self.__shape = dagPath.getShape()
+		self.__mesh = self.__shape.mesh
+		self.__index = 0
+
+	def isDone(self):
+		"""
+		This method returns if the iteration is done.
+
+		:return: Iteration done. ( Boolean )
+		"""
+
+		return self.__index >= len(self.__mesh.faceCounts)
+
+	def next(self):
+		"""
+		This method moves to the next face.
+		"""
+
+		self.__index += 1
+
+	def reset(self):
+		"""
+		This method resets the iterator.
+		"""
+
+		self.__index = 0
+
+	def index(self):
+		"""
+		This method returns the current face index.
+
+		:return: Face index. ( Integer )
+		"""
+
+		return self.__index
+
+	def polygonVertexCount(self):
+		"""
+		This method returns the current face vertices count.
+
+		:return: Vertices count. ( Integer )
+		"""
+
+		return int(self.__mesh.faceCounts[self.__index])
+
+	def __getFaceVertices(self):
+		"""
+		This method returns the current face vertices.
+
+		:return: Faces vertices. ( Array )
+		"""
+
+		offset = int(self.__mesh.faceOffsets[self.__index])
+		return slice(offset, offset + int(self.__mesh.faceCounts[self.__index]))
+
+	def getUVArea(self, pointer, uvSet=None):
+		"""
+		This method stores the current face UVs area into given pointer.
+
+		:param pointer: Pointer. ( _Pointer )
+		:param uvSet: UV set. ( String )
+		"""
+
+		uvs = self.__mesh.uvs[self.__mesh.faceUVs[self.__getFaceVertices()]].tolist()
+		area = 0.
+		for i in range(len(uvs)):
+			area += uvs[i - 1][0] * uvs[i][1] - uvs[i][0] * uvs[i - 1][1]
+		pointer.value = 0.5 * abs(area)
+
+	def getArea(self, pointer, space=MSpace.kObject):
+		"""
+		This method stores the current face area into given pointer.
+
+		:param pointer: Pointer. ( _Pointer )
+		:param space: Space. ( Integer )
+		"""
+
+		vertices = self.__mesh.faceVertices[self.__getFaceVertices()]
+		if space == MSpace.kWorld:
+			points = self.__shape.getWorldPoints(vertices)
+		else:
+			points = self.__mesh.points[vertices]
+		normal = numpy.cross(points, numpy.roll(points, -1, axis=0)).sum(axis=0)
+		pointer.value = 0.5 * float(numpy.sqrt((normal ** 2).sum()))
+
+class MFnMesh(object):
+	"""
+	This class is the **MFnMesh** class.
+	"""
+
+	def __init__(self, dagPath):
+		"""
+		This method initializes the class.
+
+		:param dagPath: Dag path. ( MDagPath )
+		"""
+
+		self.__shape = dagPath.getShape()
+		self.__mesh = self.__shape.mesh
+
+	def numVertices(self):
+		"""
+		This method returns the mesh vertices count.
+
+		:return: Vertices count. ( Integer )
+		"""
+
+		return len(self.__mesh.points)
+
+	def numPolygons(self):
+		"""
+		This method returns the mesh faces count.
+
+		:return: Faces count. ( Integer )
+		"""
+
+		return len(self.__mesh.faceCounts)
+
+	def numFaceVertices(self):
+		"""
+		This method returns the mesh faces vertices count.
+
+		:return: Faces vertices count. ( Integer )
+		"""
+
+		return len(self.__mesh.faceVertices)
+
+	def numUVs(self, uvSet=None):
+		"""
+		This method returns the mesh UVs count.
+
+		:param uvSet: UV set. ( String )
+		:return: UVs count. ( Integer )
+		"""
+
+		return len(self.__mesh.uvs)
+
+	def getUVs(self, uArray, vArray, uvSet=None):
+		"""
+		This method fills given arrays with the mesh UVs.
+
+		:param uArray: U array. ( MFloatArray )
+		:param vArray: V array. ( MFloatArray )
+		:param uvSet: UV set. ( String )
+		"""
+
+		uArray[:] = self.__mesh.uvs[:, 0].tolist()
+		vArray[:] = self.__mesh.uvs[:, 1].tolist()
+
+	def setUVs(self, uArray, vArray, uvSet=None):
+		"""
+		This method sets the mesh UVs from given arrays.
+
+		:param uArray: U array. ( MFloatArray )
+		:param vArray: V array. ( MFloatArray )
+		:param uvSet: UV set. ( String )
+		"""
+
+		self.__mesh.uvs = numpy.column_stack((numpy.asarray(uArray, dtype=numpy.float64),
+											numpy.asarray(vArray, dtype=numpy.float64)))
+		_scene.SCENE.setDirty(self.__shape)
+
+	def getAssignedUVs(self, uvCounts, uvIds, uvSet=None):
+		"""
+		This method fills given arrays with the faces UVs counts and the faces vertices UVs indices.
+
+		:param uvCounts: Faces UVs counts. ( MIntArray )
+		:param uvIds: Faces vertices UVs indices. ( MIntArray )
+		:param uvSet: UV set. ( String )
+		"""
+
+		uvCounts[:] = self.__mesh.faceCounts.tolist()
+		uvIds[:] = self.__mesh.faceUVs.tolist()
+
+	def getVertices(self, vertexCounts, vertices):
+		"""
+		This method fills given arrays with the faces vertices counts and the faces vertices indices.
+
+		:param vertexCounts: Faces vertices counts. ( MIntArray )
+		:param vertices: Faces vertices indices. ( MIntArray )
+		"""
+
+		vertexCounts[:] = self.__mesh.faceCounts.tolist()
+		vertices[:] = self.__mesh.faceVertices.tolist()
+
+	def getPoints(self, points, space=MSpace.kObject):
+		"""
+		This method fills given array with the mesh points.
+
+		:param points: Points. ( MPointArray )
+		:param space: Space. ( Integer )
+		"""
+
+		if space == MSpace.kWorld:
+			positions = self.__shape.getWorldPoints()
+		else:
+			positions = self.__mesh.points
+		points[:] = [MPoint(x, y, z) for x, y, z in positions.tolist()]
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**__init__.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Headless Maya stand-in package.
+
+**Others:**
+	This package provides the subset of :mod:`maya.cmds`, :mod:`maya.mel` and :mod:`maya.OpenMaya` used by
+	the snippets libraries, backed by the in-memory NumPy meshes of :mod:`maya.scene`. It allows the libraries
+	to be exercised and benchmarked without a Maya license by prepending the **standins** directory to
+	:data:`sys.path`::
+
+		import sys
+		sys.path.insert(0, "Path/To/Snippets/Folder/Snippets/src/maya/standins")
+
+		import maya.cmds as cmds
+		cmds.polyPlane(sx=999, sy=999)
+"""
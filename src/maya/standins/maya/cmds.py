@@ -0,0 +1,822 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**cmds.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Stand-in :mod:`maya.cmds` module.
+
+**Others:**
+	Only the commands and flags used by the snippets libraries are implemented, they follow Maya return values
+	conventions: partial names, compact components ranges unless flattened and flat lists of floats for queries.
+	The public attributes of this module are the commands only so that
+	:class:`snippets.commandsProfiler.CommandsProfiler` can wrap them.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import math
+import numpy
+
+import maya.scene as _scene
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["ls",
+			"select",
+			"objExists",
+			"nodeType",
+			"listRelatives",
+			"delete",
+			"rename",
+			"polyPlane",
+			"polyEvaluate",
+			"polyListComponentConversion",
+			"filterExpand",
+			"polyInfo",
+			"polyCrease",
+			"polyEditUV",
+			"polyTweakUV",
+			"polyForceUV",
+			"xform",
+			"move",
+			"pointPosition",
+			"objectCenter",
+			"setAttr",
+			"getAttr",
+			"connectAttr",
+			"shadingNode",
+			"sets",
+			"workspace",
+			"file",
+			"undoInfo",
+			"repeatLast",
+			"progressBar",
+			"pluginInfo",
+			"loadPlugin"]
+
+_SELECTION_MASKS = {31 : "vtx", 32 : "e", 34 : "f", 35 : "map", 70 : "vtxFace"}
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def _getFlag(kwargs, names, default=None):
+	"""
+	This definition returns the value of the first given flag name found in given keywords arguments.
+
+	:param kwargs: Keywords arguments. ( Dictionary )
+	:param names: Flag short and long names. ( Tuple )
+	:param default: Default value. ( Object )
+	:return: Flag value. ( Object )
+	"""
+
+	for name in names:
+		if name in kwargs:
+			return kwargs[name]
+	return default
+
+def _getItems(args):
+	"""
+	This definition flattens given arguments into a list of names.
+
+	:param args: Arguments. ( Tuple )
+	:return: Names. ( List )
+	"""
+
+	items = []
+	for arg in args:
+		if isinstance(arg, basestring):
+			items.append(arg)
+		elif arg is not None:
+			items.extend(_getItems(arg))
+	return items
+
+def _splitItems(items):
+	"""
+	This definition splits given names into components names and nodes.
+
+	:param items: Names. ( List )
+	:return: Components names, nodes. ( Tuple )
+	"""
+
+	components = []
+	nodes = []
+	for item in items:
+		if "." in item:
+			components.append(item)
+		else:
+			node = _scene.SCENE.getNode(item)
+			node is not None and nodes.append(node)
+	return components, nodes
+
+def _getName(node, long=False):
+	"""
+	This definition returns given node name.
+
+	:param node: Node. ( Node )
+	:param long: Full path name. ( Boolean )
+	:return: Node name. ( String )
+	"""
+
+	if long:
+		return node.longName
+	return _scene.SCENE.getPartialName(node)
+
+def _getNode(name):
+	"""
+	This definition returns the node with given name and raises an exception if it does not exist.
+
+	:param name: Node name. ( String )
+	:return: Node. ( Node )
+	"""
+
+	node = _scene.SCENE.getNode(name)
+	if node is None:
+		raise ValueError("No object matches name: {0}".format(name))
+	return node
+
+def _getVertices(items):
+	"""
+	This definition returns the vertices of given components or objects.
+
+	:param items: Names. ( List )
+	:return: Vertices components. ( List )
+	"""
+
+	return [components.convert("vtx") for components in _scene.getComponents(items)]
+
+def _getUVs(items):
+	"""
+	This definition returns the UVs of given components or objects.
+
+	:param items: Names. ( List )
+	:return: UVs components. ( List )
+	"""
+
+	return [components.convert("map") for components in _scene.getComponents(items)]
+
+def ls(*args, **kwargs):
+	"""
+	This definition lists given or selected nodes and components.
+
+	:param \*args: Names. ( \* )
+	:param \*\*kwargs: sl, fl, l, o, type. ( \*\* )
+	:return: Names. ( List )
+	"""
+
+	if _getFlag(kwargs, ("sl", "selection")):
+		items = list(_scene.SCENE.selection)
+	else:
+		items = _getItems(args)
+		if not args:
+			items = [node.longName for node in _scene.SCENE.nodes]
+
+	flatten = _getFlag(kwargs, ("fl", "flatten"), False)
+	long = _getFlag(kwargs, ("l", "long"), False)
+	objectsOnly = _getFlag(kwargs, ("o", "objectsOnly"), False)
+	types = _getFlag(kwargs, ("type", "typ"))
+	if isinstance(types, basestring):
+		types = [types]
+
+	componentsNames, nodes = _splitItems(items)
+	names = []
+	for node in nodes:
+		if types and not node.type in types:
+			continue
+		names.append(_getName(node, long))
+
+	if types and not "mesh" in types:
+		return names
+
+	for components in _scene.getComponents(componentsNames):
+		if objectsOnly:
+			name = _getName(components.shape, long)
+			not name in names and names.append(name)
+		elif not types:
+			names.extend(_scene.formatComponents(components, flatten, long))
+	return names
+
+def select(*args, **kwargs):
+	"""
+	This definition selects given nodes and components.
+
+	:param \*args: Names. ( \* )
+	:param \*\*kwargs: cl, add, d. ( \*\* )
+	"""
+
+	if _getFlag(kwargs, ("cl", "clear")):
+		_scene.SCENE.selection = []
+		return
+
+	items = _getItems(args)
+	for node in set(item.split(".")[0] for item in items):
+		if _scene.SCENE.getNode(node) is None:
+			raise ValueError("No object matches name: {0}".format(node))
+
+	if _getFlag(kwargs, ("add",)):
+		selection = set(_scene.SCENE.selection)
+		_scene.SCENE.selection.extend(item for item in items if not item in selection)
+	elif _getFlag(kwargs, ("d", "deselect")):
+		items = set(items)
+		_scene.SCENE.selection = [item for item in _scene.SCENE.selection if not item in items]
+	else:
+		_scene.SCENE.selection = items
+
+def objExists(name):
+	"""
+	This definition returns if given node exists.
+
+	:param name: Node name. ( String )
+	:return: Node existence. ( Boolean )
+	"""
+
+	return _scene.SCENE.getNode(name.split(".")[0]) is not None
+
+def nodeType(node):
+	"""
+	This definition returns given node type.
+
+	:param node: Node name. ( String / List )
+	:return: Node type. ( String )
+	"""
+
+	if isinstance(node, (list, tuple)):
+		node = node[0]
+	return _getNode(node.split(".")[0]).type
+
+def listRelatives(*args, **kwargs):
+	"""
+	This definition lists given nodes relatives.
+
+	:param \*args: Nodes names. ( \* )
+	:param \*\*kwargs: p, s, c, ad, f, type, ni. ( \*\* )
+	:return: Relatives names. ( List )
+	"""
+
+	long = _getFlag(kwargs, ("f", "fullPath"), False)
+	type = _getFlag(kwargs, ("type",))
+	relatives = []
+	for item in _getItems(args):
+		node = _getNode(item)
+		if _getFlag(kwargs, ("p", "parent")):
+			candidates = node.parent is not None and [node.parent] or []
+		elif _getFlag(kwargs, ("ad", "allDescendents")):
+			candidates = []
+			stack = list(node.children)
+			while stack:
+				child = stack.pop()
+				candidates.append(child)
+				stack.extend(child.children)
+		elif _getFlag(kwargs, ("s", "shapes")):
+			candidates = [child for child in node.children if not isinstance(child, _scene.Transform)]
+		else:
+			candidates = list(node.children)
+
+		for candidate in candidates:
+			if type and candidate.type != type:
+				continue
+			relatives.append(_getName(candidate, long))
+	return relatives or None
+
+def delete(*args):
+	"""
+	This definition deletes given or selected nodes.
+
+	:param \*args: Nodes names. ( \* )
+	"""
+
+	for item in _getItems(args) or list(_scene.SCENE.selection):
+		_scene.SCENE.removeNode(_getNode(item))
+		_scene.SCENE.selection = [name for name in _scene.SCENE.selection if _scene.SCENE.getNode(name.split(".")[0])]
+
+def rename(node, name):
+	"""
+	This definition renames given node.
+
+	:param node: Node name. ( String )
+	:param name: New name. ( String )
+	:return: Node name. ( String )
+	"""
+
+	node = _getNode(node)
+	node.name = ""
+	node.name = _scene.SCENE.getUniqueName(name.split("|")[-1])
+	return node.name
+
+def polyPlane(**kwargs):
+	"""
+	This definition creates a polygonal plane.
+
+	:param \*\*kwargs: n, w, h, sx, sy. ( \*\* )
+	:return: Transform name, creation node name. ( List )
+	"""
+
+	mesh = _scene.getGridMesh(int(_getFlag(kwargs, ("sx", "subdivisionsX"), 10)),
+							int(_getFlag(kwargs, ("sy", "subdivisionsY"), 10)),
+							float(_getFlag(kwargs, ("w", "width"), 1.)),
+							float(_getFlag(kwargs, ("h", "height"), 1.)))
+
+	transform = _scene.SCENE.addNode(_scene.Transform(_getFlag(kwargs, ("n", "name"), "pPlane1")))
+	base = transform.name.rstrip("0123456789")
+	_scene.SCENE.addNode(_scene.MeshShape("{0}Shape{1}".format(base, transform.name[len(base):]), transform, mesh))
+	_scene.SCENE.selection = [transform.name]
+	return [_getName(transform), "polyPlane1"]
+
+def polyEvaluate(*args, **kwargs):
+	"""
+	This definition returns given object topological informations.
+
+	:param \*args: Object name. ( \* )
+	:param \*\*kwargs: v, e, f, uv, t, a, wa. ( \*\* )
+	:return: Information. ( Integer / Float )
+	"""
+
+	items = _getItems(args) or list(_scene.SCENE.selection)
+	shape = _scene.SCENE.getShape(items[0].split(".")[0])
+	if shape is None:
+		raise ValueError("No object matches name: {0}".format(items[0]))
+
+	mesh = shape.mesh
+	if _getFlag(kwargs, ("v", "vertex")):
+		return len(mesh.points)
+	elif _getFlag(kwargs, ("e", "edge")):
+		return len(mesh.edges)
+	elif _getFlag(kwargs, ("f", "face")):
+		return len(mesh.faceCounts)
+	elif _getFlag(kwargs, ("uv", "uvcoord")):
+		return len(mesh.uvs)
+	elif _getFlag(kwargs, ("t", "triangle")):
+		return int((mesh.faceCounts - 2).sum())
+	elif _getFlag(kwargs, ("wa", "worldArea")):
+		return float(mesh.getFacesAreas(shape.getWorldPoints()).sum())
+	elif _getFlag(kwargs, ("a", "area")):
+		return float(mesh.getFacesAreas().sum())
+
+def polyListComponentConversion(*args, **kwargs):
+	"""
+	This definition converts given components or objects to another components type.
+
+	:param \*args: Components names. ( \* )
+	:param \*\*kwargs: tv, te, tf, tuv, tvf, bo. ( \*\* )
+	:return: Converted components names. ( List )
+	"""
+
+	target = None
+	for names, type in ((("tv", "toVertex"), "vtx"),
+						(("te", "toEdge"), "e"),
+						(("tf", "toFace"), "f"),
+						(("tuv", "toUV"), "map"),
+						(("tvf", "toVertexFace"), "vtxFace")):
+		if _getFlag(kwargs, names):
+			target = type
+			break
+
+	border = _getFlag(kwargs, ("bo", "border"), False)
+	names = []
+	for components in _scene.getComponents(_getItems(args)):
+		names.extend(_scene.formatComponents(components.convert(target or components.type, border)))
+	return names
+
+def filterExpand(*args, **kwargs):
+	"""
+	This definition filters and expands given components.
+
+	:param \*args: Components names. ( \* )
+	:param \*\*kwargs: sm, ex. ( \*\* )
+	:return: Components names. ( List )
+	"""
+
+	masks = _getFlag(kwargs, ("sm", "selectionMask"), ())
+	if not isinstance(masks, (list, tuple)):
+		masks = [masks]
+
+	items = _getItems(args) or list(_scene.SCENE.selection)
+	componentsNames, nodes = _splitItems(items)
+	names = []
+	if 12 in masks:
+		names.extend(_getName(node) for node in nodes if isinstance(node, _scene.Transform) and node.shape is not None)
+
+	types = [_SELECTION_MASKS[mask] for mask in masks if mask in _SELECTION_MASKS]
+	for components in _scene.getComponents(componentsNames):
+		if components.type in types:
+			names.extend(_scene.formatComponents(components, _getFlag(kwargs, ("ex", "expand"), True)))
+	return names or None
+
+def polyInfo(*args, **kwargs):
+	"""
+	This definition returns given components informations.
+
+	:param \*args: Components names. ( \* )
+	:param \*\*kwargs: fn. ( \*\* )
+	:return: Informations. ( List )
+	"""
+
+	if not _getFlag(kwargs, ("fn", "faceNormals")):
+		return
+
+	informations = []
+	for components in _scene.getComponents(_getItems(args)):
+		faces = components.convert("f").indices
+		for face, normal in zip(faces.tolist(), components.shape.mesh.getFacesNormals(faces).tolist()):
+			informations.append("FACE_NORMAL {0:>6}: {1:.6f} {2:.6f} {3:.6f}\n".format(face, *normal))
+	return informations
+
+def polyCrease(*args, **kwargs):
+	"""
+	This definition queries or sets given edges crease values.
+
+	:param \*args: Edges names. ( \* )
+	:param \*\*kwargs: q, v. ( \*\* )
+	:return: Crease values. ( List )
+	"""
+
+	value = _getFlag(kwargs, ("v", "value"))
+	values = []
+	for components in _scene.getComponents(_getItems(args)):
+		mesh = components.shape.mesh
+		edges = components.convert("e").indices
+		if _getFlag(kwargs, ("q", "query")):
+			values.extend(mesh.creases[edges].tolist())
+		else:
+			mesh.creases[edges] = value
+	if _getFlag(kwargs, ("q", "query")):
+		return values
+
+def polyEditUV(*args, **kwargs):
+	"""
+	This definition queries or edits given UVs positions.
+
+	:param \*args: UVs names. ( \* )
+	:param \*\*kwargs: q, u, v, su, sv, pu, pv, a, r. ( \*\* )
+	:return: UVs positions. ( List )
+	"""
+
+	items = _getItems(args) or list(_scene.SCENE.selection)
+	if _getFlag(kwargs, ("q", "query")):
+		uValue = _getFlag(kwargs, ("u", "uValue"))
+		vValue = _getFlag(kwargs, ("v", "vValue"))
+		values = []
+		for components in _getUVs(items):
+			uvs = components.shape.mesh.uvs[components.indices]
+			if uValue and vValue:
+				values.extend(uvs.ravel().tolist())
+			elif uValue:
+				values.extend(uvs[:, 0].tolist())
+			else:
+				values.extend(uvs[:, 1].tolist())
+		return values
+
+	pivot = numpy.array((_getFlag(kwargs, ("pu", "pivotU"), 0.), _getFlag(kwargs, ("pv", "pivotV"), 0.)))
+	scale = numpy.array((_getFlag(kwargs, ("su", "scaleU"), 1.), _getFlag(kwargs, ("sv", "scaleV"), 1.)))
+	angle = math.radians(_getFlag(kwargs, ("a", "angle"), 0.))
+	offset = numpy.array((_getFlag(kwargs, ("u", "uValue"), 0.), _getFlag(kwargs, ("v", "vValue"), 0.)))
+	relative = _getFlag(kwargs, ("r", "relative"), True)
+	rotation = numpy.array(((math.cos(angle), math.sin(angle)), (-math.sin(angle), math.cos(angle))))
+	for components in _getUVs(items):
+		uvs = components.shape.mesh.uvs
+		if not relative:
+			uvs[components.indices] = offset
+		else:
+			uvs[components.indices] = numpy.dot((uvs[components.indices] - pivot) * scale, rotation) + pivot + offset
+		_scene.SCENE.setDirty(components.shape)
+
+def polyTweakUV(*args, **kwargs):
+	"""
+	This definition offsets given UVs, each UV by its own offset.
+
+	:param \*args: UVs names. ( \* )
+	:param \*\*kwargs: uv, uvs. ( \*\* )
+	"""
+
+	offsets = numpy.array(_getFlag(kwargs, ("uv", "uvs"), ()), dtype=numpy.float64).reshape(-1, 2)
+	start = 0
+	for components in _getUVs(_getItems(args) or list(_scene.SCENE.selection)):
+		count = min(len(components.indices), len(offsets) - start)
+		components.shape.mesh.uvs[components.indices[:count]] += offsets[start:start + count]
+		start += count
+		_scene.SCENE.setDirty(components.shape)
+
+def polyForceUV(*args, **kwargs):
+	"""
+	This definition maps each face of given objects onto the whole UVs space, each face becomes its own UVs shell.
+
+	:param \*args: Objects names. ( \* )
+	:param \*\*kwargs: unitize. ( \*\* )
+	"""
+
+	if not _getFlag(kwargs, ("unitize",)):
+		return
+
+	for components in _getVertices(_getItems(args) or list(_scene.SCENE.selection)):
+		mesh = components.shape.mesh
+		local = numpy.arange(len(mesh.faceVertices)) - mesh.faceOffsets[mesh.faceIds]
+		angles = 2. * math.pi * local / mesh.faceCounts[mesh.faceIds] - 3. * math.pi / 4.
+		uvs = 0.5 + numpy.column_stack((numpy.cos(angles), numpy.sin(angles))) * math.sqrt(0.5)
+		components.shape.mesh = _scene.Mesh(mesh.points,
+											mesh.faceCounts,
+											mesh.faceVertices,
+											uvs,
+											numpy.arange(len(mesh.faceVertices)))
+		_scene.SCENE.setDirty(components.shape)
+
+def xform(*args, **kwargs):
+	"""
+	This definition queries or edits given transforms or components positions.
+
+	:param \*args: Transforms or components names. ( \* )
+	:param \*\*kwargs: q, t, m, ws, r. ( \*\* )
+	:return: Queried values. ( List )
+	"""
+
+	items = _getItems(args) or list(_scene.SCENE.selection)
+	worldSpace = _getFlag(kwargs, ("ws", "worldSpace"), False)
+	relative = _getFlag(kwargs, ("r", "relative"), False)
+	componentsNames, nodes = _splitItems(items)
+	if _getFlag(kwargs, ("q", "query")):
+		values = []
+		for node in nodes:
+			matrix = node.matrix
+			if worldSpace:
+				matrix = node.worldMatrix
+			if _getFlag(kwargs, ("m", "matrix")):
+				values.extend(matrix.ravel().tolist())
+			else:
+				values.extend(matrix[3, :3].tolist())
+		for components in _getVertices(componentsNames):
+			if worldSpace:
+				values.extend(components.shape.getWorldPoints(components.indices).ravel().tolist())
+			else:
+				values.extend(components.shape.mesh.points[components.indices].ravel().tolist())
+		return values
+
+	matrix = _getFlag(kwargs, ("m", "matrix"))
+	translation = _getFlag(kwargs, ("t", "translation"))
+	for node in nodes:
+		if matrix is not None:
+			node.matrix = numpy.array(matrix, dtype=numpy.float64).reshape(4, 4)
+		elif translation is not None:
+			if relative:
+				node.matrix[3, :3] += translation
+			else:
+				node.matrix[3, :3] = translation
+		_scene.SCENE.setDirty(node)
+
+	if translation is None:
+		return
+
+	for components in _getVertices(componentsNames):
+		shape, indices = components.shape, components.indices
+		if worldSpace:
+			if relative:
+				shape.setWorldPoints(indices, shape.getWorldPoints(indices) + translation)
+			else:
+				shape.setWorldPoints(indices, numpy.tile(translation, (len(indices), 1)))
+		elif relative:
+			shape.mesh.points[indices] += translation
+		else:
+			shape.mesh.points[indices] = translation
+		_scene.SCENE.setDirty(shape)
+
+def move(*args, **kwargs):
+	"""
+	This definition moves given transforms or components.
+
+	:param \*args: Coordinates followed by transforms or components names. ( \* )
+	:param \*\*kwargs: ws, r. ( \*\* )
+	"""
+
+	coordinates = [arg for arg in args if isinstance(arg, (int, float))]
+	items = [arg for arg in args if not isinstance(arg, (int, float))]
+	kwargs = dict(kwargs)
+	kwargs["t"] = coordinates
+	if not _getFlag(kwargs, ("os", "objectSpace")):
+		kwargs["ws"] = True
+	xform(*items, **kwargs)
+
+def pointPosition(*args, **kwargs):
+	"""
+	This definition returns given vertex position.
+
+	:param \*args: Vertex name. ( \* )
+	:param \*\*kwargs: w, l. ( \*\* )
+	:return: Position. ( List )
+	"""
+
+	components = _getVertices(_getItems(args)[:1])[0]
+	if _getFlag(kwargs, ("l", "local")):
+		return components.shape.mesh.points[components.indices[0]].tolist()
+	return components.shape.getWorldPoints(components.indices[:1])[0].tolist()
+
+def objectCenter(*args, **kwargs):
+	"""
+	This definition returns given object bounding box center.
+
+	:param \*args: Object name. ( \* )
+	:param \*\*kwargs: gl, l. ( \*\* )
+	:return: Center. ( List )
+	"""
+
+	shape = _scene.SCENE.getShape(_getItems(args)[0])
+	if _getFlag(kwargs, ("gl", "global")):
+		points = shape.getWorldPoints()
+	else:
+		points = shape.mesh.points
+	return ((points.min(axis=0) + points.max(axis=0)) / 2.).tolist()
+
+def setAttr(attribute, *values, **kwargs):
+	"""
+	This definition sets given attribute value.
+
+	:param attribute: Attribute name. ( String )
+	:param \*values: Attribute values. ( \* )
+	:param \*\*kwargs: type. ( \*\* )
+	"""
+
+	node, attribute = attribute.split(".", 1)
+	node = _getNode(node)
+	node.setAttribute(attribute, values)
+	_scene.SCENE.setDirty(node)
+
+def getAttr(attribute, **kwargs):
+	"""
+	This definition returns given attribute value.
+
+	:param attribute: Attribute name. ( String )
+	:param \*\*kwargs: Unused. ( \*\* )
+	:return: Attribute value. ( Object )
+	"""
+
+	node, attribute = attribute.split(".", 1)
+	try:
+		return _getNode(node).getAttribute(attribute)
+	except KeyError:
+		raise ValueError("No object matches name: {0}.{1}".format(node, attribute))
+
+def connectAttr(source, destination, **kwargs):
+	"""
+	This definition connects given attributes, the connection is stored on the destination node.
+
+	:param source: Source attribute. ( String )
+	:param destination: Destination attribute. ( String )
+	:param \*\*kwargs: f. ( \*\* )
+	"""
+
+	_getNode(source.split(".")[0])
+	node, attribute = destination.split(".", 1)
+	_getNode(node).attributes[attribute] = source
+
+def shadingNode(type, **kwargs):
+	"""
+	This definition creates a shading node.
+
+	:param type: Node type. ( String )
+	:param \*\*kwargs: asShader, asTexture, asUtility, n. ( \*\* )
+	:return: Node name. ( String )
+	"""
+
+	node = _scene.Node(_getFlag(kwargs, ("n", "name"), "{0}1".format(type)))
+	node.type = type
+	return _scene.SCENE.addNode(node).name
+
+def sets(*args, **kwargs):
+	"""
+	This definition creates a shading engine or adds given members to a shading engine.
+
+	:param \*args: Members names. ( \* )
+	:param \*\*kwargs: e, fe, r, nss, em, n. ( \*\* )
+	:return: Shading engine name. ( String )
+	"""
+
+	forceElement = _getFlag(kwargs, ("fe", "forceElement"))
+	if forceElement is None:
+		shadingEngine = _scene.SCENE.addNode(_scene.ShadingEngine(_getFlag(kwargs, ("n", "name"), "set1")))
+		shadingEngine.members.extend(_getItems(args))
+		return shadingEngine.name
+
+	shadingEngine = _getNode(forceElement)
+	items = _getItems(args)
+	for node in set(item.split(".")[0] for item in items):
+		_getNode(node)
+	shadingEngine.members.extend(items)
+
+def workspace(*args, **kwargs):
+	"""
+	This definition queries the workspace.
+
+	:param \*args: Unused. ( \* )
+	:param \*\*kwargs: q, rd, fn. ( \*\* )
+	:return: Workspace directory. ( String )
+	"""
+
+	if _getFlag(kwargs, ("rd", "rootDirectory")):
+		return "{0}/".format(_scene.SCENE.workspace.replace("\\", "/"))
+	elif _getFlag(kwargs, ("fn", "fullName")):
+		return _scene.SCENE.workspace.replace("\\", "/")
+
+def file(*args, **kwargs):
+	"""
+	This definition creates a new scene or exports the selected meshes to an Obj file.
+
+	:param \*args: File path. ( \* )
+	:param \*\*kwargs: new, es, typ, op, f. ( \*\* )
+	:return: File path. ( String )
+	"""
+
+	if _getFlag(kwargs, ("new", "newFile")):
+		_scene.SCENE.new()
+		return
+
+	if not _getFlag(kwargs, ("es", "exportSelected")):
+		return
+
+	path = args[0]
+	componentsNames, nodes = _splitItems(list(_scene.SCENE.selection))
+	with open(path, "w") as handle:
+		offsets = numpy.zeros(2, dtype=numpy.int64)
+		for node in nodes:
+			shape = isinstance(node, _scene.Transform) and node.shape or node
+			if not isinstance(shape, _scene.MeshShape):
+				continue
+
+			mesh = shape.mesh
+			handle.write("g {0}\n".format(node.name))
+			numpy.savetxt(handle, shape.getWorldPoints(), fmt="v %.6f %.6f %.6f")
+			numpy.savetxt(handle, mesh.uvs, fmt="vt %.6f %.6f")
+			indices = numpy.column_stack((mesh.faceVertices + offsets[0] + 1, mesh.faceUVs + offsets[1] + 1))
+			faceVertices = ["{0}/{1}".format(*pair) for pair in indices.tolist()]
+			handle.writelines("f {0}\n".format(" ".join(faceVertices[offset:offset + count]))
+							for offset, count in zip(mesh.faceOffsets.tolist(), mesh.faceCounts.tolist()))
+			offsets += (len(mesh.points), len(mesh.uvs))
+	return path
+
+def undoInfo(*args, **kwargs):
+	"""
+	This definition is a no-op stand-in for the undo queue.
+
+	:param \*args: Unused. ( \* )
+	:param \*\*kwargs: Unused. ( \*\* )
+	"""
+
+	pass
+
+def repeatLast(*args, **kwargs):
+	"""
+	This definition is a no-op stand-in for the repeat last command.
+
+	:param \*args: Unused. ( \* )
+	:param \*\*kwargs: Unused. ( \*\* )
+	"""
+
+	pass
+
+def progressBar(*args, **kwargs):
+	"""
+	This definition is a stand-in for the progress bar, it is never cancelled.
+
+	:param \*args: Unused. ( \* )
+	:param \*\*kwargs: q, isCancelled. ( \*\* )
+	:return: Cancelled state. ( Boolean )
+	"""
+
+	if _getFlag(kwargs, ("q", "query")):
+		return False
+
+def pluginInfo(*args, **kwargs):
+	"""
+	This definition is a stand-in for the plugins informations, every plugin is loaded.
+
+	:param \*args: Unused. ( \* )
+	:param \*\*kwargs: Unused. ( \*\* )
+	:return: Plugin loaded state. ( Boolean )
+	"""
+
+	return True
+
+def loadPlugin(*args, **kwargs):
+	"""
+	This definition is a no-op stand-in for the plugins loading.
+
+	:param \*args: Unused. ( \* )
+	:param \*\*kwargs: Unused. ( \*\* )
+	"""
+
+	pass
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**mel.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Stand-in :mod:`maya.mel` module.
+
+**Others:**
+	Only the Mel statements used by the snippets libraries are evaluated.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import re
+
+import maya.scene as _scene
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["eval"]
+
+_MAIN_PROGRESS_BAR = "MainHelpLineProgressBar"
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def eval(statement):
+	"""
+	This definition evaluates given Mel statement.
+
+	:param statement: Mel statement. ( String )
+	:return: Statement result. ( Object )
+	"""
+
+	statement = statement.strip().rstrip(";")
+	if statement.endswith("$gMainProgressBar"):
+		return _MAIN_PROGRESS_BAR
+
+	match = re.match(r"^nearestPointOnMesh\s+(?P<object>\S+)$", statement)
+	if match:
+		shape = _scene.SCENE.getShape(match.group("object"))
+		if shape is None:
+			raise RuntimeError("No object matches name: {0}".format(match.group("object")))
+
+		return _scene.SCENE.addNode(_scene.NearestPointOnMesh("nearestPointOnMesh1", shape=shape)).name
@@ -0,0 +1,880 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2012 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**scene.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Stand-in scene module.
+
+**Others:**
+	The meshes are stored as NumPy arrays: points, faces vertices counts, flat faces vertices and flat faces UVs
+	indices. The topology queries go through compressed adjacency tables built on first use so that
+	a per component query costs the component size and not the mesh size, like in Maya.
+"""
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import numpy
+import re
+import tempfile
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2012 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["COMPONENT_PATTERN",
+			"COMPONENTS_TYPES",
+			"getRanges",
+			"getCompressedTable",
+			"Mesh",
+			"getGridMesh",
+			"Node",
+			"Transform",
+			"MeshShape",
+			"NearestPointOnMesh",
+			"ShadingEngine",
+			"Scene",
+			"SCENE",
+			"Components",
+			"getComponents",
+			"formatComponents"]
+
+COMPONENT_PATTERN = re.compile(r"^(?P<node>[^\.\[\]]+)\.(?P<type>vtxFace|vtx|map|e|f)\[(?P<start>\d+)(?::(?P<end>\d+))?\]"
+								r"(?:\[(?P<faceStart>\d+)(?::(?P<faceEnd>\d+))?\])?$")
+
+COMPONENTS_TYPES = ("vtx", "e", "f", "map", "vtxFace")
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def getRanges(starts, counts):
+	"""
+	This definition returns the concatenation of the integer ranges defined by given starts and counts.
+
+	:param starts: Ranges starts. ( Array )
+	:param counts: Ranges counts. ( Array )
+	:return: Concatenated ranges. ( Array )
+	"""
+
+	starts = numpy.asarray(starts, dtype=numpy.int64)
+	counts = numpy.asarray(counts, dtype=numpy.int64)
+	total = counts.sum()
+	if not total:
+		return numpy.zeros(0, dtype=numpy.int64)
+
+	return numpy.repeat(starts - numpy.cumsum(counts) + counts, counts) + numpy.arange(total)
+
+def getCompressedTable(keys, size):
+	"""
+	This definition returns a compressed table mapping each key to the positions it appears at in given keys.
+
+	:param keys: Keys. ( Array )
+	:param size: Keys count. ( Integer )
+	:return: Offsets, counts, positions. ( Tuple )
+	"""
+
+	positions = numpy.argsort(keys, kind="mergesort")
+	counts = numpy.bincount(keys, minlength=size)
+	offsets = numpy.cumsum(counts) - counts
+	return offsets, counts, positions
+
+class Mesh(object):
+	"""
+	This class is the **Mesh** class, it stores a polygonal mesh into NumPy arrays.
+	"""
+
+	def __init__(self, points, faceCounts, faceVertices, uvs=None, faceUVs=None):
+		"""
+		This method initializes the class.
+
+		:param points: Points object space positions. ( Array )
+		:param faceCounts: Faces vertices counts. ( Array )
+		:param faceVertices: Flat faces vertices indices. ( Array )
+		:param uvs: UVs positions. ( Array )
+		:param faceUVs: Flat faces UVs indices, aligned on the faces vertices. ( Array )
+		"""
+
+		self.points = numpy.array(points, dtype=numpy.float64).reshape(-1, 3)
+		self.faceCounts = numpy.array(faceCounts, dtype=numpy.int64)
+		self.faceVertices = numpy.array(faceVertices, dtype=numpy.int64)
+		self.faceOffsets = numpy.cumsum(self.faceCounts) - self.faceCounts
+		self.faceIds = numpy.repeat(numpy.arange(len(self.faceCounts)), self.faceCounts)
+
+		if uvs is None:
+			self.uvs = numpy.zeros((0, 2), dtype=numpy.float64)
+			self.faceUVs = numpy.zeros(len(self.faceVertices), dtype=numpy.int64)
+		else:
+			self.uvs = numpy.array(uvs, dtype=numpy.float64).reshape(-1, 2)
+			self.faceUVs = numpy.array(faceUVs, dtype=numpy.int64)
+
+		local = numpy.arange(len(self.faceVertices)) - self.faceOffsets[self.faceIds]
+		self.nextFaceVertices = self.faceOffsets[self.faceIds] + (local + 1) % self.faceCounts[self.faceIds]
+
+		self.__edges = None
+		self.__faceVertexEdges = None
+		self.creases = None
+		self.__tables = {}
+
+	@property
+	def edges(self):
+		"""
+		This method is the property for the mesh edges vertices pairs.
+
+		:return: Edges. ( Array )
+		"""
+
+		self.__edges is None and self.__buildEdges()
+		return self.__edges
+
+	@property
+	def faceVertexEdges(self):
+		"""
+		This method is the property for the edge starting at each face vertex.
+
+		:return: Faces vertices edges. ( Array )
+		"""
+
+		self.__faceVertexEdges is None and self.__buildEdges()
+		return self.__faceVertexEdges
+
+	def __buildEdges(self):
+		"""
+		This method builds the mesh edges.
+		"""
+
+		pairs = numpy.sort(numpy.column_stack((self.faceVertices, self.faceVertices[self.nextFaceVertices])), axis=1)
+		keys = pairs[:, 0] * len(self.points) + pairs[:, 1]
+		uniqueKeys, indices, inverse = numpy.unique(keys, return_index=True, return_inverse=True)
+		self.__edges = pairs[indices]
+		self.__faceVertexEdges = inverse.ravel()
+		self.creases = numpy.zeros(len(self.__edges), dtype=numpy.float64)
+
+	def getTable(self, name):
+		"""
+		This method returns given compressed adjacency table, building it if needed.
+
+		:param name: Table name, **vertices**, **uvs**, **edges** or **edgesVertices**. ( String )
+		:return: Offsets, counts, positions. ( Tuple )
+		"""
+
+		table = self.__tables.get(name)
+		if table is not None:
+			return table
+
+		if name == "vertices":
+			table = getCompressedTable(self.faceVertices, len(self.points))
+		elif name == "uvs":
+			table = getCompressedTable(self.faceUVs, len(self.uvs))
+		elif name == "edges":
+			table = getCompressedTable(self.faceVertexEdges, len(self.edges))
+		elif name == "edgesVertices":
+			offsets, counts, positions = getCompressedTable(self.edges.ravel(), len(self.points))
+			table = offsets, counts, positions // 2
+		self.__tables[name] = table
+		return table
+
+	def getFaceVertices(self, type, indices):
+		"""
+		This method returns the faces vertices of given components.
+
+		:param type: Components type. ( String )
+		:param indices: Components indices. ( Array )
+		:return: Faces vertices. ( Array )
+		"""
+
+		if type == "f":
+			return getRanges(self.faceOffsets[indices], self.faceCounts[indices])
+		elif type == "vtxFace":
+			faceVertices = getRanges(self.faceOffsets[indices[:, 1]], self.faceCounts[indices[:, 1]])
+			vertices = numpy.repeat(indices[:, 0], self.faceCounts[indices[:, 1]])
+			return faceVertices[self.faceVertices[faceVertices] == vertices]
+
+		offsets, counts, positions = self.getTable({"vtx" : "vertices", "map" : "uvs", "e" : "edges"}[type])
+		return positions[getRanges(offsets[indices], counts[indices])]
+
+	def convert(self, type, indices, target, border=False):
+		"""
+		This method converts given components to given target components type.
+
+		:param type: Components type. ( String )
+		:param indices: Components indices. ( Array )
+		:param target: Target components type. ( String )
+		:param border: Only return the edges on the border of the components. ( Boolean )
+		:return: Target components indices. ( Array )
+		"""
+
+		if type == target and not border:
+			return numpy.unique(indices)
+
+		if type == "e" and target == "vtx":
+			return numpy.unique(self.edges[indices].ravel())
+		if type == "vtx" and target == "e":
+			offsets, counts, positions = self.getTable("edgesVertices")
+			return numpy.unique(positions[getRanges(offsets[indices], counts[indices])])
+
+		faceVertices = self.getFaceVertices(type, indices)
+		if target == "vtx":
+			return numpy.unique(self.faceVertices[faceVertices])
+		elif target == "f":
+			return numpy.unique(self.faceIds[faceVertices])
+		elif target == "map":
+			if type == "e":
+				faceVertices = numpy.concatenate((faceVertices, self.nextFaceVertices[faceVertices]))
+			return numpy.unique(self.faceUVs[faceVertices])
+		elif target == "vtxFace":
+			pairs = numpy.column_stack((self.faceVertices[faceVertices], self.faceIds[faceVertices]))
+			return pairs[numpy.lexsort((pairs[:, 1], pairs[:, 0]))]
+		elif target == "e":
+			edges = self.faceVertexEdges[self.getFaceVertices("f", self.convert(type, indices, "f"))]
+			if not border:
+				return numpy.unique(edges)
+
+			edges, counts = numpy.unique(edges, return_counts=True)
+			return edges[counts == 1]
+
+	def getFacesNormals(self, faces=None):
+		"""
+		This method returns given faces object space normals using Newell method.
+
+		:param faces: Faces indices. ( Array )
+		:return: Faces normals. ( Array )
+		"""
+
+		if faces is None:
+			faces = numpy.arange(len(self.faceCounts))
+		faces = numpy.asarray(faces)
+		faceVertices = self.getFaceVertices("f", faces)
+		current = self.points[self.faceVertices[faceVertices]]
+		next = self.points[self.faceVertices[self.nextFaceVertices[faceVertices]]]
+		products = numpy.column_stack(((current[:, 1] - next[:, 1]) * (current[:, 2] + next[:, 2]),
+										(current[:, 2] - next[:, 2]) * (current[:, 0] + next[:, 0]),
+										(current[:, 0] - next[:, 0]) * (current[:, 1] + next[:, 1])))
+		owners = numpy.repeat(numpy.arange(len(faces)), self.faceCounts[faces])
+		normals = numpy.zeros((len(faces), 3))
+		numpy.add.at(normals, owners, products)
+		lengths = numpy.sqrt((normals ** 2).sum(axis=1))
+		lengths[lengths == 0] = 1.
+		return normals / lengths[:, numpy.newaxis]
+
+	def getTriangles(self):
+		"""
+		This method returns the mesh fan triangulation as faces vertices triplets.
+
+		:return: Triangles faces vertices, triangles faces. ( Tuple )
+		"""
+
+		local = numpy.arange(len(self.faceVertices)) - self.faceOffsets[self.faceIds]
+		mask = (local >= 1) & (local <= self.faceCounts[self.faceIds] - 2)
+		second = numpy.nonzero(mask)[0]
+		first = self.faceOffsets[self.faceIds[second]]
+		return numpy.column_stack((first, second, second + 1)), self.faceIds[second]
+
+	def getFacesAreas(self, points=None):
+		"""
+		This method returns the faces areas.
+
+		:param points: Points to use instead of the mesh points. ( Array )
+		:return: Faces areas. ( Array )
+		"""
+
+		if points is None:
+			points = self.points
+		triangles, faces = self.getTriangles()
+		a, b, c = (points[self.faceVertices[triangles[:, i]]] for i in range(3))
+		areas = 0.5 * numpy.sqrt((numpy.cross(b - a, c - a) ** 2).sum(axis=1))
+		return numpy.bincount(faces, weights=areas, minlength=len(self.faceCounts))
+
+	def getFacesUVAreas(self):
+		"""
+		This method returns the faces UVs areas.
+
+		:return: Faces UVs areas. ( Array )
+		"""
+
+		triangles, faces = self.getTriangles()
+		a, b, c = (self.uvs[self.faceUVs[triangles[:, i]]] for i in range(3))
+		areas = 0.5 * numpy.abs((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1]))
+		return numpy.bincount(faces, weights=areas, minlength=len(self.faceCounts))
+
+def getGridMesh(subdivisionsX=10, subdivisionsY=10, width=1., height=1.):
+	"""
+	This definition returns a grid mesh lying in the XZ plane with its normal along +Y, like a Maya polyPlane.
+
+	:param subdivisionsX: Width subdivisions. ( Integer )
+	:param subdivisionsY: Height subdivisions. ( Integer )
+	:param width: Grid width. ( Float )
+	:param height: Grid height. ( Float )
+	:return: Mesh. ( Mesh )
+	"""
+
+	columns, rows = subdivisionsX + 1, subdivisionsY + 1
+	u, v = numpy.meshgrid(numpy.linspace(0., 1., columns), numpy.linspace(0., 1., rows))
+	u, v = u.ravel(), v.ravel()
+	points = numpy.column_stack(((u - 0.5) * width, numpy.zeros(len(u)), (0.5 - v) * height))
+
+	x, y = numpy.meshgrid(numpy.arange(subdivisionsX), numpy.arange(subdivisionsY))
+	corners = (y * columns + x).ravel()
+	faceVertices = numpy.column_stack((corners, corners + 1, corners + columns + 1, corners + columns)).ravel()
+	return Mesh(points, numpy.full(len(corners), 4), faceVertices, numpy.column_stack((u, v)), faceVertices)
+
+class Node(object):
+	"""
+	This class is the **Node** class.
+	"""
+
+	type = "node"
+
+	def __init__(self, name, parent=None):
+		"""
+		This method initializes the class.
+
+		:param name: Node name. ( String )
+		:param parent: Node parent. ( Node )
+		"""
+
+		self.name = name
+		self.parent = parent
+		self.children = []
+		self.attributes = {}
+
+		parent is not None and parent.children.append(self)
+
+	@property
+	def longName(self):
+		"""
+		This method is the property for the node full path.
+
+		:return: Node full path. ( String )
+		"""
+
+		return "{0}|{1}".format(self.parent is not None and self.parent.longName or "", self.name)
+
+	def getAttribute(self, attribute):
+		"""
+		This method returns given attribute value.
+
+		:param attribute: Attribute name. ( String )
+		:return: Attribute value. ( Object )
+		"""
+
+		return self.attributes[attribute]
+
+	def setAttribute(self, attribute, values):
+		"""
+		This method sets given attribute value.
+
+		:param attribute: Attribute name. ( String )
+		:param values: Attribute values. ( Tuple )
+		"""
+
+		if len(values) == 1:
+			self.attributes[attribute] = values[0]
+		else:
+			self.attributes[attribute] = tuple(values)
+
+class Transform(Node):
+	"""
+	This class is the **Transform** node class, its matrix follows Maya rows vectors convention.
+	"""
+
+	type = "transform"
+
+	def __init__(self, name, parent=None):
+		"""
+		This method initializes the class.
+
+		:param name: Node name. ( String )
+		:param parent: Node parent. ( Node )
+		"""
+
+		Node.__init__(self, name, parent)
+
+		self.matrix = numpy.identity(4)
+
+	@property
+	def shape(self):
+		"""
+		This method is the property for the transform first shape.
+
+		:return: Shape. ( Node )
+		"""
+
+		for child in self.children:
+			if not isinstance(child, Transform):
+				return child
+
+	@property
+	def worldMatrix(self):
+		"""
+		This method is the property for the transform world matrix.
+
+		:return: World matrix. ( Array )
+		"""
+
+		parent = self.parent
+		matrix = self.matrix
+		while parent is not None:
+			matrix = numpy.dot(matrix, parent.matrix)
+			parent = parent.parent
+		return matrix
+
+	def getAttribute(self, attribute):
+		"""
+		This method reimplements the :meth:`Node.getAttribute` method.
+
+		:param attribute: Attribute name. ( String )
+		:return: Attribute value. ( Object )
+		"""
+
+		if attribute in ("translate", "t"):
+			return [tuple(self.matrix[3, :3])]
+		elif attribute in ("translateX", "tx", "translateY", "ty", "translateZ", "tz"):
+			return self.matrix[3, "XYZxyz".index(attribute[-1]) % 3]
+		return Node.getAttribute(self, attribute)
+
+	def setAttribute(self, attribute, values):
+		"""
+		This method reimplements the :meth:`Node.setAttribute` method.
+
+		:param attribute: Attribute name. ( String )
+		:param values: Attribute values. ( Tuple )
+		"""
+
+		if attribute in ("translate", "t"):
+			self.matrix[3, :3] = values
+		elif attribute in ("translateX", "tx", "translateY", "ty", "translateZ", "tz"):
+			self.matrix[3, "XYZxyz".index(attribute[-1]) % 3] = values[0]
+		else:
+			Node.setAttribute(self, attribute, values)
+
+class MeshShape(Node):
+	"""
+	This class is the **MeshShape** node class.
+	"""
+
+	type = "mesh"
+
+	def __init__(self, name, parent=None, mesh=None):
+		"""
+		This method initializes the class.
+
+		:param name: Node name. ( String )
+		:param parent: Node parent. ( Node )
+		:param mesh: Mesh. ( Mesh )
+		"""
+
+		Node.__init__(self, name, parent)
+
+		self.mesh = mesh
+
+	@property
+	def worldMatrix(self):
+		"""
+		This method is the property for the shape world matrix.
+
+		:return: World matrix. ( Array )
+		"""
+
+		if self.parent is None:
+			return numpy.identity(4)
+		return self.parent.worldMatrix
+
+	def getWorldPoints(self, vertices=None):
+		"""
+		This method returns given vertices world positions.
+
+		:param vertices: Vertices indices. ( Array )
+		:return: World positions. ( Array )
+		"""
+
+		points = self.mesh.points
+		if vertices is not None:
+			points = points[vertices]
+		matrix = self.worldMatrix
+		return numpy.dot(points, matrix[:3, :3]) + matrix[3, :3]
+
+	def setWorldPoints(self, vertices, positions):
+		"""
+		This method sets given vertices world positions.
+
+		:param vertices: Vertices indices. ( Array )
+		:param positions: World positions. ( Array )
+		"""
+
+		inverse = numpy.linalg.inv(self.worldMatrix)
+		self.mesh.points[vertices] = numpy.dot(numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3),
+											inverse[:3, :3]) + inverse[3, :3]
+
+class NearestPointOnMesh(Node):
+	"""
+	This class is the **NearestPointOnMesh** node class.
+
+	The nearest face is the face with the closest center, this is exact on regular grids.
+	"""
+
+	type = "nearestPointOnMesh"
+
+	def __init__(self, name, parent=None, shape=None):
+		"""
+		This method initializes the class.
+
+		:param name: Node name. ( String )
+		:param parent: Node parent. ( Node )
+		:param shape: Input mesh shape. ( MeshShape )
+		"""
+
+		Node.__init__(self, name, parent)
+
+		self.shape = shape
+		self.attributes["inPosition"] = (0., 0., 0.)
+		self.__centers = None
+
+	def getAttribute(self, attribute):
+		"""
+		This method reimplements the :meth:`Node.getAttribute` method.
+
+		:param attribute: Attribute name. ( String )
+		:return: Attribute value. ( Object )
+		"""
+
+		if attribute in ("nearestFaceIndex", "f"):
+			if self.__centers is None:
+				mesh = self.shape.mesh
+				points = self.shape.getWorldPoints()[mesh.faceVertices]
+				owners = mesh.faceIds
+				self.__centers = numpy.column_stack([numpy.bincount(owners, weights=points[:, i]) for i in range(3)]) / \
+				mesh.faceCounts[:, numpy.newaxis]
+			distances = ((self.__centers - numpy.asarray(self.attributes["inPosition"])) ** 2).sum(axis=1)
+			return int(numpy.argmin(distances))
+		return Node.getAttribute(self, attribute)
+
+class ShadingEngine(Node):
+	"""
+	This class is the **ShadingEngine** node class, it stores its members names.
+	"""
+
+	type = "shadingEngine"
+
+	def __init__(self, name, parent=None):
+		"""
+		This method initializes the class.
+
+		:param name: Node name. ( String )
+		:param parent: Node parent. ( Node )
+		"""
+
+		Node.__init__(self, name, parent)
+
+		self.members = []
+
+class Scene(object):
+	"""
+	This class is the **Scene** class, it stores the nodes and the selection.
+	"""
+
+	def __init__(self):
+		"""
+		This method initializes the class.
+		"""
+
+		self.nodes = []
+		self.selection = []
+		self.workspace = tempfile.gettempdir()
+		self.callbacks = {}
+		self.callbacksIndex = 0
+
+	def new(self):
+		"""
+		This method clears the scene, the nodes callbacks are dropped while the scene callbacks are kept.
+		"""
+
+		self.executeCallbacks(None, "beforeNew")
+		self.nodes = []
+		self.selection = []
+		self.callbacks = dict((id, callback) for id, callback in self.callbacks.iteritems() if callback[0] is None)
+
+	def getUniqueName(self, name):
+		"""
+		This method returns a unique node name from given name.
+
+		:param name: Node name. ( String )
+		:return: Unique node name. ( String )
+		"""
+
+		names = set(node.name for node in self.nodes)
+		if not name in names:
+			return name
+
+		base = name.rstrip("0123456789")
+		index = 1
+		while "{0}{1}".format(base, index) in names:
+			index += 1
+		return "{0}{1}".format(base, index)
+
+	def addNode(self, node):
+		"""
+		This method adds given node to the scene.
+
+		:param node: Node. ( Node )
+		:return: Node. ( Node )
+		"""
+
+		node.name = self.getUniqueName(node.name)
+		self.nodes.append(node)
+		return node
+
+	def removeNode(self, node):
+		"""
+		This method removes given node and its children from the scene.
+
+		:param node: Node. ( Node )
+		"""
+
+		for child in list(node.children):
+			self.removeNode(child)
+		self.executeCallbacks(node, "preRemoval")
+		node in self.nodes and self.nodes.remove(node)
+		node.parent is not None and node in node.parent.children and node.parent.children.remove(node)
+
+	def addCallback(self, node, execute, message="dirty"):
+		"""
+		This method registers given callable to be executed when given message is emitted for given node.
+
+		:param node: Node, None for a scene message. ( Node )
+		:param execute: Callable. ( Object )
+		:param message: Message, "dirty", "preRemoval", "beforeNew" or "beforeOpen". ( String )
+		:return: Callback id. ( Integer )
+		"""
+
+		self.callbacksIndex += 1
+		self.callbacks[self.callbacksIndex] = (node, execute, message)
+		return self.callbacksIndex
+
+	def removeCallback(self, id):
+		"""
+		This method removes given callback.
+
+		:param id: Callback id. ( Integer )
+		"""
+
+		if not id in self.callbacks:
+			raise RuntimeError("(kInvalidParameter): Callback does not exist")
+		del self.callbacks[id]
+
+	def executeCallbacks(self, node, message):
+		"""
+		This method executes the callbacks registered for given node and message.
+
+		:param node: Node, None for a scene message. ( Node )
+		:param message: Message. ( String )
+		"""
+
+		if not self.callbacks:
+			return
+
+		for callbackNode, execute, callbackMessage in list(self.callbacks.values()):
+			if callbackNode is node and callbackMessage == message:
+				execute()
+
+	def setDirty(self, node):
+		"""
+		This method marks given node dirty and executes its callbacks.
+
+		Like in Maya, the descendants are not marked dirty: a shape is not notified when an ancestor moves.
+
+		:param node: Node. ( Node )
+		"""
+
+		self.executeCallbacks(node, "dirty")
+
+	def getNode(self, name):
+		"""
+		This method returns the node with given name, full path or partial path.
+
+		:param name: Node name. ( String )
+		:return: Node. ( Node )
+		"""
+
+		if name.startswith("|"):
+			for node in self.nodes:
+				if node.longName == name:
+					return node
+			return
+
+		for node in self.nodes:
+			if node.name == name or node.longName.endswith("|{0}".format(name)):
+				return node
+
+	def getShape(self, name):
+		"""
+		This method returns the mesh shape of given transform or shape name.
+
+		:param name: Node name. ( String )
+		:return: Mesh shape. ( MeshShape )
+		"""
+
+		node = self.getNode(name)
+		if isinstance(node, Transform):
+			node = node.shape
+		return isinstance(node, MeshShape) and node or None
+
+	def getPartialName(self, node):
+		"""
+		This method returns the shortest unique name of given node.
+
+		:param node: Node. ( Node )
+		:return: Shortest unique name. ( String )
+		"""
+
+		if [other.name for other in self.nodes].count(node.name) == 1:
+			return node.name
+		return node.longName
+
+SCENE = Scene()
+
+class Components(object):
+	"""
+	This class is the **Components** class, it stores components of one type on one mesh.
+	"""
+
+	def __init__(self, shape, type, indices):
+		"""
+		This method initializes the class.
+
+		:param shape: Mesh shape. ( MeshShape )
+		:param type: Components type. ( String )
+		:param indices: Components indices, vertices faces pairs for **vtxFace** components. ( Array )
+		"""
+
+		self.shape = shape
+		self.type = type
+		self.indices = indices
+
+	def convert(self, target, border=False):
+		"""
+		This method returns the components converted to given type.
+
+		:param target: Target components type. ( String )
+		:param border: Only return the edges on the border of the components. ( Boolean )
+		:return: Converted components. ( Components )
+		"""
+
+		return Components(self.shape, target, self.shape.mesh.convert(self.type, self.indices, target, border))
+
+def getComponents(items):
+	"""
+	This definition parses given components names and returns them grouped by mesh and type.
+
+	:param items: Components names or nodes names. ( List )
+	:return: Components. ( List )
+	"""
+
+	if isinstance(items, basestring):
+		items = [items]
+
+	groups = {}
+	order = []
+	shapes = {}
+	for item in items:
+		match = COMPONENT_PATTERN.match(item)
+		if match is None:
+			shape = SCENE.getShape(item)
+			if shape is None:
+				continue
+			type, start, end = "f", 0, len(shape.mesh.faceCounts) - 1
+		else:
+			node = match.group("node")
+			shape = shapes.get(node)
+			if shape is None:
+				shape = shapes[node] = SCENE.getShape(node)
+				if shape is None:
+					raise ValueError("No object matches name: {0}".format(item))
+
+			type = match.group("type")
+			start = int(match.group("start"))
+			end = int(match.group("end") or start)
+
+		key = (id(shape), type)
+		group = groups.get(key)
+		if group is None:
+			group = groups[key] = (shape, type, [], [], [])
+			order.append(key)
+
+		if type == "vtxFace":
+			faceStart = int(match.group("faceStart"))
+			faceEnd = int(match.group("faceEnd") or faceStart)
+			vertices = numpy.arange(start, end + 1)
+			faces = numpy.arange(faceStart, faceEnd + 1)
+			group[4].append(numpy.column_stack((numpy.repeat(vertices, len(faces)), numpy.tile(faces, len(vertices)))))
+		else:
+			group[2].append(start)
+			group[3].append(end)
+
+	components = []
+	for key in order:
+		shape, type, starts, ends, pairs = groups[key]
+		if type == "vtxFace":
+			indices = numpy.unique(numpy.concatenate(pairs), axis=0)
+		else:
+			size = {"vtx" : len(shape.mesh.points),
+					"e" : len(shape.mesh.edges),
+					"f" : len(shape.mesh.faceCounts),
+					"map" : len(shape.mesh.uvs)}[type]
+			starts = numpy.array(starts, dtype=numpy.int64)
+			ends = numpy.minimum(numpy.array(ends, dtype=numpy.int64), size - 1)
+			indices = getRanges(starts, numpy.maximum(ends - starts + 1, 0))
+			if len(starts) > 1:
+				indices = numpy.unique(indices)
+		components.append(Components(shape, type, indices))
+	return components
+
+def formatComponents(components, flatten=False, long=False):
+	"""
+	This definition returns given components names.
+
+	:param components: Components. ( Components )
+	:param flatten: One name per component instead of ranges. ( Boolean )
+	:param long: Use the full path. ( Boolean )
+	:return: Components names. ( List )
+	"""
+
+	transform = components.shape.parent
+	name = long and transform.longName or SCENE.getPartialName(transform)
+	indices = components.indices
+	if not len(indices):
+		return []
+
+	if components.type == "vtxFace":
+		return ["{0}.vtxFace[{1}][{2}]".format(name, vertex, face) for vertex, face in indices.tolist()]
+
+	if flatten:
+		prefix = "{0}.{1}[".format(name, components.type)
+		return [prefix + str(index) + "]" for index in indices.tolist()]
+
+	breaks = numpy.nonzero(numpy.diff(indices) != 1)[0]
+	starts = numpy.concatenate(([indices[0]], indices[breaks + 1]))
+	ends = numpy.concatenate((indices[breaks], [indices[-1]]))
+	names = []
+	for start, end in zip(starts.tolist(), ends.tolist()):
+		if start == end:
+			names.append("{0}.{1}[{2}]".format(name, components.type, start))
+		else:
+			names.append("{0}.{1}[{2}:{3}]".format(name, components.type, start, end))
+	return names